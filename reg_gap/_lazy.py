@@ -0,0 +1,38 @@
+"""Lazy package exports (PEP 562)."""
+
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(
+    namespace: dict[str, Any],
+    exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Each public name is imported from its submodule on first access and
+    then stored in the package namespace, so later lookups are plain
+    attribute reads.
+
+    Args:
+        namespace: The package's ``globals()``.
+        exports: Maps each public name to the relative module defining it.
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign in the package.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(namespace.get("__all__", ())))
+
+    return __getattr__, __dir__
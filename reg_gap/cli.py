@@ -11,22 +11,151 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
+import pickle
+import re
 import sys
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .ingestion import UniversalLoader, TextNormalizer
-from .parsing import ClauseExtractor, EntityRecognizer, DefinitionExtractor
-from .comparison import SemanticDiff, JurisdictionalComparator, AmbiguityDetector
-from .comparison.jurisdictional import JurisdictionProfile
-from .risk import EnforcementModel, SeverityAssessor, ConfidenceBounds
-from .reports import ReportGenerator, Visualizer
+# Analysis packages are imported inside the command functions so that
+# lightweight invocations (--help, --version) start quickly.
+if TYPE_CHECKING:
+    from .comparison import JurisdictionalComparator
 
 
+# Combined input size above which `compare` processes its two documents
+# in separate worker processes.
+PARALLEL_COMPARE_BYTES = 1 << 20
+
+# Maximum number of documents `report` keeps in flight at once, bounding
+# memory while comparisons of already-processed documents proceed.
+REPORT_LOAD_WINDOW = 4
+
+# Buffer size for output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
+class AnalysisStatistics:
+    """Document statistics reported by the analyze command."""
+    
+    word_count: int
+    sentence_count: int
+    clause_count: int
+    definition_count: int
+    section_count: int
+
+
+@dataclass(slots=True)
+class ClauseCounts:
+    """Clause counts by type reported by the analyze command."""
+    
+    obligations: int
+    prohibitions: int
+    permissions: int
+    conditions: int
+
+
+@dataclass(slots=True)
+class AmbiguityIssue:
+    """A top ambiguity issue reported by the analyze command."""
+    
+    type: str
+    phrase: str
+    severity: float
+
+
+@dataclass(slots=True)
+class AmbiguitySummary:
+    """Ambiguity summary reported by the analyze command."""
+    
+    total_instances: int
+    high_severity_count: int
+    ambiguity_score: float
+    top_issues: list[AmbiguityIssue]
+
+
+@dataclass(slots=True)
+class AnalyzeResult:
+    """Results of the analyze command."""
+    
+    document: str
+    jurisdiction: str
+    statistics: AnalysisStatistics
+    clauses: ClauseCounts
+    ambiguity: AmbiguitySummary
+    recommendations: list[str]
+    disclaimer: str
+
+
+@dataclass(slots=True)
+class ComparedJurisdictions:
+    """The pair of jurisdictions compared by the compare command."""
+    
+    jurisdiction_a: str
+    jurisdiction_b: str
+
+
+@dataclass(slots=True)
+class GapCounts:
+    """Gap totals reported by the compare command."""
+    
+    total_gaps: int
+    high_severity_gaps: int
+    requires_review: int
+
+
+@dataclass(slots=True)
+class GapEntry:
+    """A top gap reported by the compare command."""
+    
+    type: str
+    description: str
+    severity: float
+    recommendations: list[str]
+
+
+@dataclass(slots=True)
+class CompareResult:
+    """Results of the compare command."""
+    
+    comparison: ComparedJurisdictions
+    summary: GapCounts
+    gaps_by_type: dict[str, int]
+    top_gaps: list[GapEntry]
+    disclaimer: str
+
+
+# Command results as passed to the formatters
+ResultData = dict | AnalyzeResult | CompareResult
+
+
+def _plain(data: ResultData) -> dict:
+    """Convert results to plain dictionaries for JSON serialization.
+
+    Args:
+        data: Results dictionary or result dataclass.
+
+    Returns:
+        dict: The results as nested dictionaries and lists.
+    """
+    return data if isinstance(data, dict) else asdict(data)
+
+
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser for the CLI.
 
+    The parser is built once per process and reused on subsequent calls.
+
     Returns:
         argparse.ArgumentParser: Configured argument parser with all subcommands
             (analyze, compare, report, demo) and their respective options.
@@ -76,6 +205,14 @@ def create_parser() -> argparse.ArgumentParser:
         default="text",
         help="Output format"
     )
+    analyze_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update cached parses and results for this document. "
+             "Results are cached by document content and package version, "
+             "so use this after changing the analysis code without a "
+             "version bump"
+    )
     
     # Compare command
     compare_parser = subparsers.add_parser(
@@ -150,15 +287,414 @@ def create_parser() -> argparse.ArgumentParser:
         type=str,
         help="Output file path"
     )
+    demo_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the demo analysis instead of using the cached result"
+    )
     
     return parser
 
 
+def _worker_count(task_count: int) -> int:
+    """Determine how many worker processes to use for document processing.
+
+    Honors the ``REG_GAP_WORKERS`` environment variable and otherwise
+    defaults to the number of CPUs this process may run on, never
+    exceeding the number of tasks.
+
+    Args:
+        task_count: Number of independent documents to process.
+
+    Returns:
+        int: Number of worker processes (1 means process serially).
+    """
+    try:
+        workers = int(os.environ.get("REG_GAP_WORKERS", ""))
+    except ValueError:
+        if hasattr(os, "sched_getaffinity"):
+            workers = len(os.sched_getaffinity(0))
+        else:
+            workers = os.cpu_count() or 1
+    return max(1, min(workers, task_count))
+
+
+def _io_worker_count(task_count: int) -> int:
+    """Determine how many threads to use for concurrent document reads.
+
+    Honors the ``REG_GAP_IO_WORKERS`` environment variable and otherwise
+    defaults to 2, which overlaps reads without thrashing rotating disks.
+
+    Args:
+        task_count: Number of documents to read.
+
+    Returns:
+        int: Number of reader threads (1 means read serially).
+    """
+    try:
+        workers = int(os.environ.get("REG_GAP_IO_WORKERS", ""))
+    except ValueError:
+        workers = 2
+    return max(1, min(workers, task_count))
+
+
+@lru_cache(maxsize=1)
+def get_ambiguity_detector():
+    """Return the process-wide AmbiguityDetector.
+
+    The detector holds no per-document state (defined terms are passed to
+    `detect`), so one instance is shared by all documents in a process.
+
+    Returns:
+        AmbiguityDetector: Shared detector instance.
+    """
+    from .comparison import AmbiguityDetector
+    
+    return AmbiguityDetector()
+
+
+@lru_cache(maxsize=None)
+def get_normalizer(jurisdiction: Optional[str] = None):
+    """Return the process-wide TextNormalizer for a jurisdiction.
+
+    Args:
+        jurisdiction: Jurisdiction code, or None for the generic normalizer.
+
+    Returns:
+        TextNormalizer: Shared normalizer specialized to the jurisdiction's
+            section headers.
+    """
+    from .ingestion import TextNormalizer
+    
+    return TextNormalizer.for_jurisdiction(jurisdiction)
+
+
+@lru_cache(maxsize=None)
+def get_clause_extractor():
+    """Return the process-wide ClauseExtractor.
+
+    Returns:
+        ClauseExtractor: Shared extractor instance.
+    """
+    from .parsing import ClauseExtractor
+    
+    return ClauseExtractor()
+
+
+@lru_cache(maxsize=None)
+def get_definition_extractor():
+    """Return the process-wide DefinitionExtractor.
+
+    Returns:
+        DefinitionExtractor: Shared extractor instance.
+    """
+    from .parsing import DefinitionExtractor
+    
+    return DefinitionExtractor()
+
+
+@lru_cache(maxsize=1)
+def get_pipeline():
+    """Return the process-wide FusedPipeline.
+
+    The pipeline runs the shared clause and definition extractors and the
+    shared detector from `get_ambiguity_detector`.
+
+    Returns:
+        FusedPipeline: Shared pipeline instance.
+    """
+    from .parsing.fused import FusedPipeline
+    
+    return FusedPipeline(
+        clause_extractor=get_clause_extractor(),
+        definition_extractor=get_definition_extractor(),
+        ambiguity_detector=get_ambiguity_detector()
+    )
+
+
+def _process_one(
+    doc_path: str,
+    jurisdiction: str,
+    detect_ambiguity: bool = True
+) -> tuple:
+    """Run the per-document pipeline for a single regulatory document.
+
+    Loads the document and hands it to `_process_loaded`. Defined at
+    module level so it can be dispatched to worker processes.
+
+    Args:
+        doc_path: Path to the regulatory document.
+        jurisdiction: Jurisdiction code for the document.
+        detect_ambiguity: Whether to run ambiguity detection.
+
+    Returns:
+        tuple: (profile, clauses, definitions, ambiguity_report), where
+            ambiguity_report is None if detection was skipped.
+
+    Raises:
+        FileNotFoundError: If the document does not exist.
+        ValueError: If the document type is unsupported or empty.
+    """
+    from .ingestion import UniversalLoader
+    
+    doc = UniversalLoader().load(doc_path, jurisdiction)
+    return _process_loaded(doc, detect_ambiguity)
+
+
+def _process_loaded(doc, detect_ambiguity: bool = True) -> tuple:
+    """Analyze an already loaded regulatory document.
+
+    Normalizes the text, extracts clauses and definitions, optionally
+    detects ambiguity, and builds the jurisdiction profile.
+
+    Args:
+        doc: RegulatoryDocument to analyze.
+        detect_ambiguity: Whether to run ambiguity detection.
+
+    Returns:
+        tuple: (profile, clauses, definitions, ambiguity_report), where
+            ambiguity_report is None if detection was skipped.
+    """
+    from .comparison.jurisdictional import JurisdictionProfile
+    
+    normalized = get_normalizer(doc.jurisdiction).normalize(doc.content)
+    clauses, definitions, amb_report = get_pipeline().run(
+        normalized.normalized,
+        source_document=doc.source_path,
+        jurisdiction=doc.jurisdiction,
+        detect_ambiguity=detect_ambiguity,
+        word_count=normalized.word_count
+    )
+    
+    profile = JurisdictionProfile(
+        jurisdiction=doc.jurisdiction,
+        clauses=clauses,
+        definitions=definitions
+    )
+    
+    return profile, clauses, definitions, amb_report
+
+
+def _load_documents(documents: list[str], jurisdictions: list[str]) -> list:
+    """Load documents concurrently on a small pool of reader threads.
+
+    File reads release the GIL, so reading documents side by side overlaps
+    their I/O. The thread count comes from `_io_worker_count`.
+
+    Args:
+        documents: Paths to the regulatory documents.
+        jurisdictions: Jurisdiction codes (one per document).
+
+    Returns:
+        list: Loaded RegulatoryDocument objects in input order.
+
+    Raises:
+        FileNotFoundError: If a document does not exist (``filename`` is
+            set to its path).
+        ValueError: If a document type is unsupported or empty.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .ingestion import UniversalLoader
+    
+    loader = UniversalLoader()
+    tasks = list(zip(documents, jurisdictions))
+    
+    with ThreadPoolExecutor(max_workers=_io_worker_count(len(tasks))) as pool:
+        futures = [pool.submit(loader.load, doc_path, jurisdiction) for doc_path, jurisdiction in tasks]
+        docs = []
+        for (doc_path, _), future in zip(tasks, futures):
+            with _tag_missing_file(doc_path):
+                docs.append(future.result())
+    
+    return docs
+
+
+def _process_documents(
+    documents: list[str],
+    jurisdictions: list[str],
+    workers: int,
+    detect_ambiguity: bool = True
+):
+    """Process documents, fanning out across worker processes if allowed.
+
+    Args:
+        documents: Paths to the regulatory documents.
+        jurisdictions: Jurisdiction codes (one per document).
+        workers: Maximum number of worker processes. With 1 worker (or a
+            single document) everything runs in the current process.
+        detect_ambiguity: Whether to run ambiguity detection.
+
+    Yields:
+        tuple: (doc_path, result) in input order, where result is the
+            return value of `_process_one`. Errors raised while processing
+            a document propagate when its result is reached.
+    """
+    tasks = list(zip(documents, jurisdictions))
+    
+    if workers <= 1 or len(tasks) <= 1:
+        for doc_path, jurisdiction in tasks:
+            with _tag_missing_file(doc_path):
+                result = _process_one(doc_path, jurisdiction, detect_ambiguity)
+            yield doc_path, result
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_process_one, doc_path, jurisdiction, detect_ambiguity)
+            for doc_path, jurisdiction in tasks
+        ]
+        try:
+            for (doc_path, _), future in zip(tasks, futures):
+                with _tag_missing_file(doc_path):
+                    result = future.result()
+                yield doc_path, result
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+# Comparator received once per `report` worker by `_init_report_worker`
+_report_comparator: Optional["JurisdictionalComparator"] = None
+
+
+def _init_report_worker(comparator: "JurisdictionalComparator") -> None:
+    """Receive the comparator once per worker instead of once per pair.
+
+    Args:
+        comparator: Comparator used for every pair of profiles.
+    """
+    global _report_comparator
+    _report_comparator = comparator
+
+
+def _compare_profiles(profile_a, profile_b) -> list:
+    """Compare two profiles with the worker's comparator.
+
+    Args:
+        profile_a: First jurisdiction profile.
+        profile_b: Second jurisdiction profile.
+
+    Returns:
+        list[JurisdictionalGap]: Gaps between the two profiles.
+    """
+    return _report_comparator.compare(profile_a, profile_b)
+
+
+def _process_and_compare(
+    documents: list[str],
+    jurisdictions: list[str],
+    comparator: "JurisdictionalComparator",
+    workers: int
+) -> tuple[list[tuple], dict]:
+    """Process documents and compare every pair as soon as both are ready.
+
+    Documents are processed in a sliding window of at most
+    `REPORT_LOAD_WINDOW` in flight; each finished document is immediately
+    compared against all previously finished ones in the same worker pool,
+    so comparison work overlaps with the processing of slower documents.
+
+    Args:
+        documents: Paths to the regulatory documents.
+        jurisdictions: Jurisdiction codes (one per document).
+        comparator: Comparator used for each pair of profiles.
+        workers: Maximum number of worker processes. With 1 worker (or a
+            single document) everything runs in the current process.
+
+    Returns:
+        tuple: (results, gap_matrix) where results holds the
+            `_process_one` output for each document in input order and
+            gap_matrix matches `JurisdictionalComparator.generate_gap_matrix`.
+    """
+    tasks = list(zip(documents, jurisdictions))
+    
+    if workers <= 1 or len(tasks) <= 1:
+        results = [result for _, result in _process_documents(documents, jurisdictions, 1)]
+        return results, comparator.generate_gap_matrix([r[0] for r in results])
+    
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    
+    results = [None] * len(tasks)
+    pair_gaps = {}
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_report_worker,
+        initargs=(comparator,)
+    ) as pool:
+        pending = {}
+        next_task = 0
+        in_flight = 0
+        
+        try:
+            while next_task < len(tasks) or pending:
+                while next_task < len(tasks) and in_flight < REPORT_LOAD_WINDOW:
+                    future = pool.submit(_process_one, *tasks[next_task])
+                    pending[future] = ("load", next_task)
+                    next_task += 1
+                    in_flight += 1
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, key = pending.pop(future)
+                    
+                    if kind == "compare":
+                        pair_gaps[key] = future.result()
+                        continue
+                    
+                    with _tag_missing_file(tasks[key][0]):
+                        results[key] = future.result()
+                    in_flight -= 1
+                    
+                    for other, result in enumerate(results):
+                        if other == key or result is None:
+                            continue
+                        i, j = min(key, other), max(key, other)
+                        future = pool.submit(_compare_profiles, results[i][0], results[j][0])
+                        pending[future] = ("compare", (i, j))
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    # Assemble in the same pair order as generate_gap_matrix
+    gap_matrix = {}
+    for i in range(len(results)):
+        for j in range(i + 1, len(results)):
+            key = (results[i][0].jurisdiction, results[j][0].jurisdiction)
+            gap_matrix[key] = pair_gaps[(i, j)]
+    
+    return results, gap_matrix
+
+
+@contextmanager
+def _tag_missing_file(doc_path: str):
+    """Record the offending path on FileNotFoundError raised in the block."""
+    try:
+        yield
+    except FileNotFoundError as e:
+        if e.filename is None:
+            e.filename = doc_path
+        raise
+
+
+def _file_size(path: str) -> int:
+    """Return the size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
 def analyze_document(args) -> int:
     """Analyze a single regulatory document for clauses, definitions, and ambiguity.
 
     Loads the document, normalizes text, extracts clauses and definitions,
-    detects ambiguity, and outputs results in the specified format.
+    detects ambiguity, and outputs results in the specified format. Results
+    are cached by document content and package version, so re-analyzing an
+    unchanged document skips the pipeline. Changes to the analysis code
+    that do not bump ``__version__`` are not detected; pass ``--no-cache``
+    after making them.
 
     Args:
         args: Parsed command-line arguments containing:
@@ -166,16 +702,19 @@ def analyze_document(args) -> int:
             - jurisdiction: Jurisdiction code (e.g., US-SEC, EU-MiFID).
             - output: Optional output file path.
             - format: Output format (json, markdown, or text).
+            - no_cache: Bypass the document and results caches.
 
     Returns:
         int: Exit code (0 for success, 1 for failure).
     """
+    from .ingestion import UniversalLoader
+    
     print(f"Analyzing: {args.document}")
     print(f"Jurisdiction: {args.jurisdiction}")
     print("-" * 50)
     
     # Load document
-    loader = UniversalLoader()
+    loader = UniversalLoader(use_cache=not args.no_cache)
     try:
         doc = loader.load(args.document, args.jurisdiction)
     except FileNotFoundError:
@@ -185,81 +724,243 @@ def analyze_document(args) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
     
-    # Normalize text
-    normalizer = TextNormalizer()
-    normalized = normalizer.normalize(doc.content)
+    # Reuse the results of an earlier run on identical content
+    cache_path = None
+    results = None
+    if not args.no_cache:
+        cache_path = _analysis_cache_path(doc.content, args.jurisdiction)
+        results = _read_cached_results(cache_path)
+    
+    if results is None:
+        results = _build_analysis(doc.content, args.document, args.jurisdiction)
+        if cache_path is not None:
+            _write_cached_results(cache_path, asdict(results))
+    else:
+        # Cached results are plain dictionaries
+        results["document"] = args.document
     
-    # Extract clauses
-    clause_extractor = ClauseExtractor()
-    clauses = clause_extractor.extract(normalized.normalized)
+    # Output results
+    write_output(results, args.format, args.output)
     
-    # Extract definitions
-    def_extractor = DefinitionExtractor()
-    definitions = def_extractor.extract(
-        normalized.normalized,
-        source_document=args.document,
-        jurisdiction=args.jurisdiction
-    )
+    if args.output:
+        print(f"Results written to: {args.output}")
     
-    # Detect ambiguity
-    defined_terms = {d.term for d in definitions}
-    ambiguity_detector = AmbiguityDetector(defined_terms=defined_terms)
-    ambiguity_report = ambiguity_detector.detect(
+    return 0
+
+
+def _build_analysis(content: str, document: str, jurisdiction: str) -> AnalyzeResult:
+    """Run the single-document analysis pipeline and build the results.
+
+    Args:
+        content: Raw document text.
+        document: Path of the document, recorded in the results.
+        jurisdiction: Jurisdiction code for the document.
+
+    Returns:
+        AnalyzeResult: Analysis results as output by the analyze command.
+    """
+    from .parsing.clause_extractor import ClauseType
+    from .risk import SeverityAssessor
+    
+    # Normalize text
+    normalized = get_normalizer(jurisdiction).normalize(content)
+    
+    # Extract clauses and definitions, and detect ambiguity
+    clauses, definitions, ambiguity_report = get_pipeline().run(
         normalized.normalized,
-        document_id=args.document,
-        jurisdiction=args.jurisdiction
+        source_document=document,
+        jurisdiction=jurisdiction,
+        word_count=normalized.word_count
     )
     
     # Assess severity
     severity_assessor = SeverityAssessor()
     
     # Build results
-    results = {
-        "document": args.document,
-        "jurisdiction": args.jurisdiction,
-        "statistics": {
-            "word_count": normalized.word_count,
-            "sentence_count": normalized.sentence_count,
-            "clause_count": len(clauses),
-            "definition_count": len(definitions),
-            "section_count": len(normalized.sections)
-        },
-        "clauses": {
-            "obligations": len([c for c in clauses if c.clause_type.value == "obligation"]),
-            "prohibitions": len([c for c in clauses if c.clause_type.value == "prohibition"]),
-            "permissions": len([c for c in clauses if c.clause_type.value == "permission"]),
-            "conditions": len([c for c in clauses if c.clause_type.value == "condition"])
-        },
-        "ambiguity": {
-            "total_instances": ambiguity_report.total_instances,
-            "high_severity_count": ambiguity_report.high_severity_count,
-            "ambiguity_score": round(ambiguity_report.ambiguity_score, 3),
-            "top_issues": [
-                {
-                    "type": inst.ambiguity_type.value,
-                    "phrase": inst.trigger_phrase,
-                    "severity": inst.severity
-                }
-                for inst in sorted(ambiguity_report.instances, key=lambda x: -x.severity)[:5]
+    type_counts = Counter(c.clause_type for c in clauses)
+    
+    results = AnalyzeResult(
+        document=document,
+        jurisdiction=jurisdiction,
+        statistics=AnalysisStatistics(
+            word_count=normalized.word_count,
+            sentence_count=normalized.sentence_count,
+            clause_count=len(clauses),
+            definition_count=len(definitions),
+            section_count=len(normalized.sections)
+        ),
+        clauses=ClauseCounts(
+            obligations=type_counts[ClauseType.OBLIGATION],
+            prohibitions=type_counts[ClauseType.PROHIBITION],
+            permissions=type_counts[ClauseType.PERMISSION],
+            conditions=type_counts[ClauseType.CONDITION]
+        ),
+        ambiguity=AmbiguitySummary(
+            total_instances=ambiguity_report.total_instances,
+            high_severity_count=ambiguity_report.high_severity_count,
+            ambiguity_score=round(ambiguity_report.ambiguity_score, 3),
+            top_issues=[
+                AmbiguityIssue(
+                    type=inst.ambiguity_type.value,
+                    phrase=inst.trigger_phrase,
+                    severity=inst.severity
+                )
+                for inst in ambiguity_report.most_severe(5)
             ]
-        },
-        "recommendations": ambiguity_report.recommendations,
-        "disclaimer": (
+        ),
+        recommendations=ambiguity_report.recommendations,
+        disclaimer=(
             "This analysis is for informational purposes only. "
             "Consult qualified legal counsel before making compliance decisions."
         )
-    }
+    )
     
-    # Output results
-    output = format_output(results, args.format)
+    return results
+
+
+def _analysis_cache_path(content: str, jurisdiction: str) -> Path:
+    """Locate the cache entry for analyzing `content` under `jurisdiction`.
+
+    Entries live under ``$XDG_CACHE_HOME/reg_gap/analyze`` (default
+    ``~/.cache``) and are keyed by a BLAKE2b hash of the document content
+    and the package version. The key does not cover the analysis code
+    itself, so code changes made without a version bump reuse old entries.
+
+    Args:
+        content: Raw document text.
+        jurisdiction: Jurisdiction code used for the analysis.
+
+    Returns:
+        Path: Location of the cache file (which may not exist yet).
+    """
+    from . import __version__
     
-    if args.output:
-        Path(args.output).write_text(output, encoding='utf-8')
-        print(f"Results written to: {args.output}")
-    else:
-        print(output)
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16)
+    digest.update(__version__.encode("ascii"))
     
-    return 0
+    safe_jurisdiction = re.sub(r"[^\w.-]", "_", jurisdiction)
+    return _cache_dir() / "analyze" / f"{safe_jurisdiction}_{digest.hexdigest()}.json"
+
+
+def _cache_dir() -> Path:
+    """Return the reg_gap cache directory (which may not exist yet).
+
+    Returns:
+        Path: ``$XDG_CACHE_HOME/reg_gap``, defaulting to ``~/.cache/reg_gap``.
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache_root, "reg_gap")
+
+
+def _read_cached_results(path: Path) -> Optional[dict]:
+    """Load cached analysis results, or None if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as fp:
+            results = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    return results if isinstance(results, dict) else None
+
+
+def _write_cached_results(path: Path, results: dict) -> None:
+    """Store analysis results in the cache, ignoring filesystem errors."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(results, fp)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _demo_cache_path(*texts: str) -> Path:
+    """Locate the cache entry for the demo analysis of `texts`.
+
+    The key covers the texts, the package version, and the fields of the
+    pickled result classes, so a change to their layout misses the cache
+    even without a version bump.
+
+    Args:
+        *texts: The synthetic regulation texts analyzed by the demo.
+
+    Returns:
+        Path: Location of the cache file (which may not exist yet).
+    """
+    from . import __version__
+    from .comparison.ambiguity import AmbiguityInstance, AmbiguityReport
+    from .parsing.clause_extractor import RegulatoryClause
+    from .parsing.definitions import Definition
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(__version__.encode("ascii"))
+    for cls in (RegulatoryClause, Definition, AmbiguityInstance, AmbiguityReport):
+        layout = ",".join(f.name for f in fields(cls))
+        digest.update(f"\0{cls.__qualname__}:{layout}".encode("ascii"))
+    
+    return _cache_dir() / f"demo_{digest.hexdigest()}.pkl"
+
+
+def _read_demo_cache(path: Path) -> Optional[list]:
+    """Load the cached demo analysis, or None if missing or unreadable."""
+    try:
+        with open(path, "rb") as fp:
+            analysis = pickle.load(fp)
+    except Exception:
+        # A truncated file or an entry written by other code can fail in
+        # the unpickler or in any reconstructed object's constructor
+        return None
+    
+    if not isinstance(analysis, list) or not all(
+        isinstance(entry, tuple) and len(entry) == 3 for entry in analysis
+    ):
+        return None
+    return analysis
+
+
+def _write_demo_cache(path: Path, analysis: list) -> None:
+    """Store the demo analysis in the cache, ignoring filesystem errors."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(analysis, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _analyze_demo(regulations: list[tuple[str, str, str]]) -> list:
+    """Run the demo pipeline on the synthetic regulations.
+
+    Args:
+        regulations: (text, jurisdiction, document_id) for each regulation.
+
+    Returns:
+        list: (clauses, definitions, ambiguity_report) for each regulation.
+    """
+    pipeline = get_pipeline()
+    detector = get_ambiguity_detector()
+    
+    analysis = []
+    for text, jurisdiction, document_id in regulations:
+        normalized = get_normalizer(jurisdiction).normalize(text)
+        clauses, definitions, _ = pipeline.run(
+            normalized.normalized, jurisdiction=jurisdiction, detect_ambiguity=False
+        )
+        analysis.append((
+            clauses,
+            definitions,
+            detector.detect(
+                normalized.normalized, document_id, jurisdiction,
+                word_count=normalized.word_count
+            )
+        ))
+    
+    return analysis
 
 
 def compare_documents(args) -> int:
@@ -279,46 +980,44 @@ def compare_documents(args) -> int:
     Returns:
         int: Exit code (0 for success, 1 for failure).
     """
+    import numpy as np
+    
+    from .comparison import JurisdictionalComparator
+    from .reports import Visualizer
+    
     print(f"Comparing documents:")
     print(f"  1. {args.document1} ({args.jurisdictions[0]})")
     print(f"  2. {args.document2} ({args.jurisdictions[1]})")
     print("-" * 50)
     
-    loader = UniversalLoader()
-    normalizer = TextNormalizer()
-    clause_extractor = ClauseExtractor()
-    def_extractor = DefinitionExtractor()
+    documents = [args.document1, args.document2]
     
-    # Load and process both documents
-    docs = []
-    profiles = []
+    # Large documents are processed side by side in separate processes;
+    # otherwise only the reads overlap and processing stays in-process
+    workers = 1
+    if sum(_file_size(path) for path in documents) >= PARALLEL_COMPARE_BYTES:
+        workers = _worker_count(len(documents))
     
-    for doc_path, jurisdiction in zip(
-        [args.document1, args.document2],
-        args.jurisdictions
-    ):
-        try:
-            doc = loader.load(doc_path, jurisdiction)
-            normalized = normalizer.normalize(doc.content)
-            clauses = clause_extractor.extract(normalized.normalized)
-            definitions = def_extractor.extract(
-                normalized.normalized,
-                source_document=doc_path,
-                jurisdiction=jurisdiction
-            )
-            
-            profile = JurisdictionProfile(
-                jurisdiction=jurisdiction,
-                clauses=clauses,
-                definitions=definitions
-            )
-            
-            docs.append(doc)
-            profiles.append(profile)
-            
-        except FileNotFoundError:
-            print(f"Error: File not found: {doc_path}", file=sys.stderr)
-            return 1
+    # Load and process both documents
+    try:
+        if workers > 1:
+            profiles = [
+                result[0]
+                for _, result in _process_documents(
+                    documents,
+                    args.jurisdictions,
+                    workers,
+                    detect_ambiguity=False
+                )
+            ]
+        else:
+            profiles = [
+                _process_loaded(doc, detect_ambiguity=False)[0]
+                for doc in _load_documents(documents, args.jurisdictions)
+            ]
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e.filename}", file=sys.stderr)
+        return 1
     
     # Compare
     comparator = JurisdictionalComparator()
@@ -328,51 +1027,76 @@ def compare_documents(args) -> int:
     visualizer = Visualizer()
     gap_matrix = {(args.jurisdictions[0], args.jurisdictions[1]): gaps}
     
+    # Per-gap columns for the summary statistics
+    severities = np.fromiter((g.severity for g in gaps), dtype=np.float64, count=len(gaps))
+    needs_review = np.fromiter(
+        (g.requires_legal_review for g in gaps), dtype=bool, count=len(gaps)
+    )
+    
     # Build results
-    results = {
-        "comparison": {
-            "jurisdiction_a": args.jurisdictions[0],
-            "jurisdiction_b": args.jurisdictions[1]
-        },
-        "summary": {
-            "total_gaps": len(gaps),
-            "high_severity_gaps": len([g for g in gaps if g.severity >= 0.7]),
-            "requires_review": len([g for g in gaps if g.requires_legal_review])
-        },
-        "gaps_by_type": {},
-        "top_gaps": [],
-        "disclaimer": (
+    results = CompareResult(
+        comparison=ComparedJurisdictions(
+            jurisdiction_a=args.jurisdictions[0],
+            jurisdiction_b=args.jurisdictions[1]
+        ),
+        summary=GapCounts(
+            total_gaps=len(gaps),
+            high_severity_gaps=int(np.count_nonzero(severities >= 0.7)),
+            requires_review=int(np.count_nonzero(needs_review))
+        ),
+        gaps_by_type=dict(Counter(g.gap_type.value for g in gaps)),
+        top_gaps=[
+            GapEntry(
+                type=gaps[i].gap_type.value,
+                description=gaps[i].description,
+                severity=round(gaps[i].severity, 3),
+                recommendations=gaps[i].recommendations
+            )
+            for i in _top_k_indices(severities, 10)
+        ],
+        disclaimer=(
             "This comparison is for informational purposes only. "
             "All gaps require qualified legal review before any compliance decisions."
         )
-    }
-    
-    # Count by type
-    for gap in gaps:
-        gt = gap.gap_type.value
-        results["gaps_by_type"][gt] = results["gaps_by_type"].get(gt, 0) + 1
-    
-    # Top gaps
-    for gap in sorted(gaps, key=lambda g: -g.severity)[:10]:
-        results["top_gaps"].append({
-            "type": gap.gap_type.value,
-            "description": gap.description,
-            "severity": round(gap.severity, 3),
-            "recommendations": gap.recommendations
-        })
+    )
     
     # Output
-    output = format_output(results, args.format)
+    write_output(results, args.format, args.output)
     
     if args.output:
-        Path(args.output).write_text(output, encoding='utf-8')
         print(f"Results written to: {args.output}")
-    else:
-        print(output)
     
     return 0
 
 
+def _top_k_indices(values, k: int):
+    """Return the indices of the k largest values, largest first.
+
+    Uses a partial partition to find the cut-off value, so only the
+    selected candidates are sorted. Ties keep their original order, as
+    with a stable descending sort.
+
+    Args:
+        values: 1-D numpy array of scores.
+        k: Number of indices to return.
+
+    Returns:
+        numpy.ndarray: Indices of the top k values in descending order.
+    """
+    import numpy as np
+    
+    n = len(values)
+    if n > k:
+        cutoff = np.partition(values, n - k)[n - k]
+        above = np.flatnonzero(values > cutoff)
+        ties = np.flatnonzero(values == cutoff)[:k - len(above)]
+        candidates = np.sort(np.concatenate((above, ties)))
+    else:
+        candidates = np.arange(n)
+    
+    return candidates[np.argsort(-values[candidates], kind="stable")]
+
+
 def generate_report(args) -> int:
     """Generate a comprehensive analysis report for multiple documents.
 
@@ -394,12 +1118,11 @@ def generate_report(args) -> int:
         print("Error: Number of documents must match number of jurisdictions", file=sys.stderr)
         return 1
     
-    print(f"Generating report for {len(args.documents)} documents...")
+    from .comparison import JurisdictionalComparator
+    from .risk import EnforcementModel, SeverityAssessor
+    from .reports import ReportGenerator
     
-    loader = UniversalLoader()
-    normalizer = TextNormalizer()
-    clause_extractor = ClauseExtractor()
-    def_extractor = DefinitionExtractor()
+    print(f"Generating report for {len(args.documents)} documents...")
     
     profiles = []
     all_clauses = []
@@ -407,45 +1130,28 @@ def generate_report(args) -> int:
     all_ambiguities = []
     
     for doc_path, jurisdiction in zip(args.documents, args.jurisdictions):
-        try:
-            print(f"  Processing: {doc_path} ({jurisdiction})")
-            
-            doc = loader.load(doc_path, jurisdiction)
-            normalized = normalizer.normalize(doc.content)
-            clauses = clause_extractor.extract(normalized.normalized)
-            definitions = def_extractor.extract(
-                normalized.normalized,
-                source_document=doc_path,
-                jurisdiction=jurisdiction
-            )
-            
-            # Detect ambiguity
-            defined_terms = {d.term for d in definitions}
-            detector = AmbiguityDetector(defined_terms=defined_terms)
-            amb_report = detector.detect(
-                normalized.normalized,
-                document_id=doc_path,
-                jurisdiction=jurisdiction
-            )
-            
-            profile = JurisdictionProfile(
-                jurisdiction=jurisdiction,
-                clauses=clauses,
-                definitions=definitions
-            )
-            
-            profiles.append(profile)
-            all_clauses.extend(clauses)
-            all_definitions.extend(definitions)
-            all_ambiguities.append(amb_report)
-            
-        except FileNotFoundError:
-            print(f"Error: File not found: {doc_path}", file=sys.stderr)
-            return 1
-    
-    # Compare all pairs
+        print(f"  Processing: {doc_path} ({jurisdiction})")
+    
+    workers = _worker_count(len(args.documents))
     comparator = JurisdictionalComparator()
-    gap_matrix = comparator.generate_gap_matrix(profiles)
+    
+    # Process documents and compare all pairs
+    try:
+        results, gap_matrix = _process_and_compare(
+            args.documents,
+            args.jurisdictions,
+            comparator,
+            workers
+        )
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e.filename}", file=sys.stderr)
+        return 1
+    
+    for profile, clauses, definitions, amb_report in results:
+        profiles.append(profile)
+        all_clauses.extend(clauses)
+        all_definitions.extend(definitions)
+        all_ambiguities.append(amb_report)
     
     # Model enforcement
     enforcement_model = EnforcementModel()
@@ -474,13 +1180,13 @@ def generate_report(args) -> int:
         clause_count=len(all_clauses)
     )
     
-    # Format output
+    # Write output
     if args.format == "markdown":
         output = report_generator.generate_markdown_report(report)
+        with open(args.output, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as fp:
+            fp.write(output)
     else:
-        output = report.to_json()
-    
-    Path(args.output).write_text(output, encoding='utf-8')
+        Path(args.output).write_bytes(_json_bytes(report.to_dict()))
     print(f"Report written to: {args.output}")
     
     return 0
@@ -497,10 +1203,16 @@ def run_demo(args) -> int:
     Args:
         args: Parsed command-line arguments containing:
             - output: Optional output file path for saving demo results.
+            - no_cache: If True, recompute instead of using the cached
+              analysis of the synthetic texts.
 
     Returns:
         int: Exit code (0 for success).
     """
+    from .comparison import JurisdictionalComparator
+    from .comparison.jurisdictional import JurisdictionProfile
+    from .reports import Visualizer
+    
     print("Running RegulatoryGapAnalyzer Demo")
     print("=" * 50)
     
@@ -550,26 +1262,29 @@ def run_demo(args) -> int:
     of a formal request.
     """
     
-    print("\nAnalyzing synthetic US regulation...")
+    # The synthetic texts never change, so their analysis is cached
+    regulations = [
+        (regulation_us, "US-SEC", "US-Regulation"),
+        (regulation_eu, "EU-MiFID", "EU-Regulation"),
+    ]
+    cache_path = None
+    analysis = None
+    if not args.no_cache:
+        cache_path = _demo_cache_path(regulation_us, regulation_eu)
+        analysis = _read_demo_cache(cache_path)
     
-    # Process US regulation
-    normalizer = TextNormalizer()
-    clause_extractor = ClauseExtractor()
-    def_extractor = DefinitionExtractor()
+    if analysis is None:
+        analysis = _analyze_demo(regulations)
+        if cache_path is not None:
+            _write_demo_cache(cache_path, analysis)
     
-    us_normalized = normalizer.normalize(regulation_us)
-    us_clauses = clause_extractor.extract(us_normalized.normalized)
-    us_definitions = def_extractor.extract(us_normalized.normalized, jurisdiction="US-SEC")
+    (us_clauses, us_definitions, us_ambiguity), (eu_clauses, eu_definitions, eu_ambiguity) = analysis
     
+    print("\nAnalyzing synthetic US regulation...")
     print(f"  - Extracted {len(us_clauses)} clauses")
     print(f"  - Found {len(us_definitions)} definitions")
     
     print("\nAnalyzing synthetic EU regulation...")
-    
-    eu_normalized = normalizer.normalize(regulation_eu)
-    eu_clauses = clause_extractor.extract(eu_normalized.normalized)
-    eu_definitions = def_extractor.extract(eu_normalized.normalized, jurisdiction="EU-MiFID")
-    
     print(f"  - Extracted {len(eu_clauses)} clauses")
     print(f"  - Found {len(eu_definitions)} definitions")
     
@@ -597,11 +1312,6 @@ def run_demo(args) -> int:
     
     # Detect ambiguity
     print("\nDetecting ambiguity...")
-    detector = AmbiguityDetector()
-    
-    us_ambiguity = detector.detect(us_normalized.normalized, "US-Regulation", "US-SEC")
-    eu_ambiguity = detector.detect(eu_normalized.normalized, "EU-Regulation", "EU-MiFID")
-    
     print(f"  US regulation ambiguity score: {us_ambiguity.ambiguity_score:.3f}")
     print(f"  EU regulation ambiguity score: {eu_ambiguity.ambiguity_score:.3f}")
     
@@ -614,9 +1324,11 @@ def run_demo(args) -> int:
     print(visualizer.generate_ascii_heatmap(heatmap))
     
     # Generate ranking
-    all_ambiguities = us_ambiguity.instances + eu_ambiguity.instances
-    if all_ambiguities:
-        ranking = visualizer.generate_ambiguity_ranking(all_ambiguities)
+    ambiguity_count = len(us_ambiguity.instances) + len(eu_ambiguity.instances)
+    if ambiguity_count:
+        ranking = visualizer.generate_ambiguity_ranking(
+            chain(us_ambiguity.instances, eu_ambiguity.instances)
+        )
         print(visualizer.generate_ascii_ranking(ranking))
     
     # Summary
@@ -628,7 +1340,7 @@ def run_demo(args) -> int:
     print(f"Total clauses: {len(us_clauses) + len(eu_clauses)}")
     print(f"Total definitions: {len(us_definitions) + len(eu_definitions)}")
     print(f"Jurisdictional gaps: {len(gaps)}")
-    print(f"Ambiguity instances: {len(all_ambiguities)}")
+    print(f"Ambiguity instances: {ambiguity_count}")
     
     print("\n⚠️  DISCLAIMER")
     print("-" * 50)
@@ -645,20 +1357,20 @@ def run_demo(args) -> int:
             "us_ambiguity": us_ambiguity.to_dict(),
             "eu_ambiguity": eu_ambiguity.to_dict()
         }
-        Path(args.output).write_text(json.dumps(results, indent=2, default=str), encoding='utf-8')
+        write_output(results, "json", args.output)
         print(f"\nDemo results saved to: {args.output}")
     
     return 0
 
 
-def format_output(data: dict, format_type: str) -> str:
+def format_output(data: ResultData, format_type: str) -> str:
     """Format output data according to the requested format.
 
-    Converts a dictionary of results into a formatted string suitable
+    Converts command results into a formatted string suitable
     for display or file output.
 
     Args:
-        data: Dictionary containing analysis results to format.
+        data: Results dictionary or result dataclass to format.
         format_type: Output format type. One of:
             - "json": Pretty-printed JSON.
             - "markdown": Markdown with headings and lists.
@@ -668,58 +1380,208 @@ def format_output(data: dict, format_type: str) -> str:
         str: Formatted string representation of the data.
     """
     if format_type == "json":
-        return json.dumps(data, indent=2, default=str)
+        return json.dumps(_plain(data), indent=2, default=str)
     
     elif format_type == "markdown":
-        lines = ["# Regulatory Analysis Results\n"]
-        
-        def dict_to_md(d: dict, level: int = 2) -> list:
-            result = []
-            for key, value in d.items():
-                heading = "#" * level
-                if isinstance(value, dict):
-                    result.append(f"{heading} {key.replace('_', ' ').title()}\n")
-                    result.extend(dict_to_md(value, level + 1))
-                elif isinstance(value, list):
-                    result.append(f"{heading} {key.replace('_', ' ').title()}\n")
-                    for item in value:
-                        if isinstance(item, dict):
-                            for k, v in item.items():
-                                result.append(f"- **{k}**: {v}")
-                            result.append("")
-                        else:
-                            result.append(f"- {item}")
-                else:
-                    result.append(f"- **{key.replace('_', ' ').title()}**: {value}")
-            return result
-        
-        lines.extend(dict_to_md(data))
-        return "\n".join(lines)
+        return "\n".join(_iter_markdown_lines(data))
     
     else:  # text
-        lines = []
-        
-        def dict_to_text(d: dict, indent: int = 0) -> list:
-            result = []
-            prefix = "  " * indent
-            for key, value in d.items():
-                if isinstance(value, dict):
-                    result.append(f"{prefix}{key.replace('_', ' ').upper()}:")
-                    result.extend(dict_to_text(value, indent + 1))
-                elif isinstance(value, list):
-                    result.append(f"{prefix}{key.replace('_', ' ').upper()}:")
-                    for item in value:
-                        if isinstance(item, dict):
-                            for k, v in item.items():
-                                result.append(f"{prefix}  - {k}: {v}")
-                        else:
-                            result.append(f"{prefix}  - {item}")
-                else:
-                    result.append(f"{prefix}{key.replace('_', ' ')}: {value}")
-            return result
-        
-        lines.extend(dict_to_text(data))
-        return "\n".join(lines)
+        return "\n".join(_iter_text_lines(data))
+
+
+def _result_items(value):
+    """Return the (key, value) pairs of a nested result, if it has any.
+
+    Results are dictionaries or the slotted result dataclasses; dataclass
+    fields are yielded in declaration order.
+
+    Args:
+        value: Any value found in a results structure.
+
+    Returns:
+        Iterator of (key, value) pairs, or None if the value is a list or
+        a scalar.
+    """
+    if isinstance(value, dict):
+        return iter(value.items())
+    if hasattr(type(value), "__dataclass_fields__"):
+        return ((f.name, getattr(value, f.name)) for f in fields(value))
+    return None
+
+
+@lru_cache(maxsize=256)
+def _pretty(key: str, case: Optional[str] = None) -> str:
+    """Return the display label for a result key.
+
+    Args:
+        key: Result dictionary key (snake_case).
+        case: Optional str method applied to the label ("title" or "upper").
+
+    Returns:
+        str: The key with underscores replaced by spaces.
+    """
+    label = key.replace('_', ' ')
+    return getattr(label, case)() if case else label
+
+
+def _iter_markdown_lines(data: ResultData):
+    """Yield the lines of the markdown rendering of a results structure.
+
+    Nested dictionaries and result dataclasses are walked depth-first with an explicit stack of
+    item iterators; each level of nesting adds a heading level.
+
+    Args:
+        data: Results dictionary or result dataclass.
+
+    Yields:
+        str: Output lines, without trailing newlines.
+    """
+    yield "# Regulatory Analysis Results\n"
+    
+    stack = [(_result_items(data), 2)]
+    while stack:
+        items, level = stack[-1]
+        heading = "#" * level
+        for key, value in items:
+            nested = _result_items(value)
+            if nested is not None:
+                yield f"{heading} {_pretty(key, 'title')}\n"
+                stack.append((nested, level + 1))
+                break
+            elif isinstance(value, list):
+                yield f"{heading} {_pretty(key, 'title')}\n"
+                for item in value:
+                    item_fields = _result_items(item)
+                    if item_fields is not None:
+                        for k, v in item_fields:
+                            yield f"- **{k}**: {v}"
+                        yield ""
+                    else:
+                        yield f"- {item}"
+            else:
+                yield f"- **{_pretty(key, 'title')}**: {value}"
+        else:
+            stack.pop()
+
+
+def _iter_text_lines(data: ResultData):
+    """Yield the lines of the plain text rendering of a results structure.
+
+    Nested dictionaries and result dataclasses are walked depth-first with an explicit stack of
+    item iterators; each level of nesting adds two spaces of indentation.
+
+    Args:
+        data: Results dictionary or result dataclass.
+
+    Yields:
+        str: Output lines, without trailing newlines.
+    """
+    stack = [(_result_items(data), "")]
+    while stack:
+        items, prefix = stack[-1]
+        for key, value in items:
+            nested = _result_items(value)
+            if nested is not None:
+                yield f"{prefix}{_pretty(key, 'upper')}:"
+                stack.append((nested, prefix + "  "))
+                break
+            elif isinstance(value, list):
+                yield f"{prefix}{_pretty(key, 'upper')}:"
+                for item in value:
+                    item_fields = _result_items(item)
+                    if item_fields is not None:
+                        for k, v in item_fields:
+                            yield f"{prefix}  - {k}: {v}"
+                    else:
+                        yield f"{prefix}  - {item}"
+            else:
+                yield f"{prefix}{_pretty(key)}: {value}"
+        else:
+            stack.pop()
+
+
+def format_output_to_stream(data: ResultData, format_type: str, fp) -> None:
+    """Write formatted output data to an open text stream.
+
+    Same output as `format_output`, but written incrementally instead of
+    being materialized as one string first.
+
+    Args:
+        data: Results dictionary or result dataclass to format.
+        format_type: Output format type ("json", "markdown", or "text").
+        fp: Writable text stream (e.g. an open file or sys.stdout).
+    """
+    if format_type == "json":
+        json.dump(_plain(data), fp, indent=2, default=str)
+        return
+    
+    if format_type == "markdown":
+        lines = _iter_markdown_lines(data)
+    else:
+        lines = _iter_text_lines(data)
+    
+    for line in lines:
+        fp.write(line)
+        break
+    for line in lines:
+        fp.write("\n")
+        fp.write(line)
+
+
+def _json_bytes(data: ResultData) -> bytes:
+    """Serialize data as indented UTF-8 JSON.
+
+    Uses orjson when it is installed, which encodes straight to bytes and
+    serializes the result dataclasses natively; otherwise falls back to
+    the standard library.
+
+    Args:
+        data: Results dictionary or result dataclass. Unsupported values
+            are converted with ``str``.
+
+    Returns:
+        bytes: UTF-8 encoded JSON document.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(_plain(data), indent=2, default=str).encode("utf-8")
+    
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def write_output(data: ResultData, format_type: str, output_path: Optional[str] = None) -> None:
+    """Write formatted output data to a file, or to stdout if no path is given.
+
+    JSON files are written as bytes in one call; other formats are streamed
+    through a large write buffer.
+
+    Args:
+        data: Results dictionary or result dataclass to format.
+        format_type: Output format type ("json", "markdown", or "text").
+        output_path: Optional output file path.
+    """
+    if output_path and format_type == "json":
+        Path(output_path).write_bytes(_json_bytes(data))
+    elif output_path:
+        with open(output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as fp:
+            format_output_to_stream(data, format_type, fp)
+    else:
+        format_output_to_stream(data, format_type, sys.stdout)
+        sys.stdout.write("\n")
+
+
+# Subcommand name -> handler
+COMMANDS = {
+    "analyze": analyze_document,
+    "compare": compare_documents,
+    "report": generate_report,
+    "demo": run_demo,
+}
 
 
 def main() -> int:
@@ -738,18 +1600,12 @@ def main() -> int:
         parser.print_help()
         return 0
     
-    if args.command == "analyze":
-        return analyze_document(args)
-    elif args.command == "compare":
-        return compare_documents(args)
-    elif args.command == "report":
-        return generate_report(args)
-    elif args.command == "demo":
-        return run_demo(args)
-    else:
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
         return 1
-
+    
+    return handler(args)
 
 if __name__ == "__main__":
     sys.exit(main())
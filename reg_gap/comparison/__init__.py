@@ -1,8 +1,13 @@
 """Comparison module for semantic analysis and jurisdictional comparison."""
 
-from .semantic_diff import SemanticDiff, ClauseDifference, DifferenceType
-from .jurisdictional import JurisdictionalComparator, JurisdictionalGap
-from .ambiguity import AmbiguityDetector, AmbiguityReport
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .semantic_diff import SemanticDiff, ClauseDifference, DifferenceType
+    from .jurisdictional import JurisdictionalComparator, JurisdictionalGap
+    from .ambiguity import AmbiguityDetector, AmbiguityReport
 
 __all__ = [
     "SemanticDiff",
@@ -13,3 +18,16 @@ __all__ = [
     "AmbiguityDetector",
     "AmbiguityReport",
 ]
+
+# Public names are imported from their submodules on first access (PEP 562)
+_EXPORTS = {
+    "SemanticDiff": ".semantic_diff",
+    "ClauseDifference": ".semantic_diff",
+    "DifferenceType": ".semantic_diff",
+    "JurisdictionalComparator": ".jurisdictional",
+    "JurisdictionalGap": ".jurisdictional",
+    "AmbiguityDetector": ".ambiguity",
+    "AmbiguityReport": ".ambiguity",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
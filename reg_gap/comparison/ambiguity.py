@@ -5,10 +5,20 @@ Identifies language that could be interpreted multiple ways,
 creating enforcement uncertainty and compliance risk.
 """
 
+import heapq
 import re
+from array import array
+from collections import Counter
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Iterator, Optional, Sequence
+
+from ..parsing.scanner import MultiPatternScanner
 
 
 class AmbiguityType(Enum):
@@ -23,7 +33,151 @@ class AmbiguityType(Enum):
     REFERENCE_AMBIGUITY = "reference_ambiguity"  # Unclear cross-references
 
 
-@dataclass
+# Serialized value of each ambiguity type, looked up without the Enum.value descriptor
+_TYPE_VALUES = {t: t.value for t in AmbiguityType}
+
+# Quoted phrases that may be terms needing a definition
+_QUOTED_TERM_RE = re.compile(r'"([^"]{2,50})"')
+
+# Common quoted words that aren't terms
+_SKIP_PHRASES = frozenset({'and', 'or', 'the', 'a', 'an', 'means', 'shall'})
+
+# Interpretation range attached to every vague standard
+_VAGUE_INTERPRETATIONS = (
+    "Conservative: Most restrictive interpretation",
+    "Moderate: Industry standard interpretation",
+    "Liberal: Least restrictive interpretation",
+)
+
+# Detectors yield each match as a row tuple:
+# (position, source, text_start, text_end, ambiguity_type, trigger_phrase,
+#  severity, confidence, context_start, context_end, interpretation_range)
+# where the matched text is source[text_start:text_end], with a source of
+# None standing for the analyzed text, and the context is the analyzed
+# text's [context_start:context_end] slice.
+_ROW_FIELDS = 11
+_ROW_SEVERITY = 6
+
+# Texts longer than this may be split into chunks of this size and
+# scanned on several worker processes
+PARALLEL_CHUNK_SIZE = 1 << 18
+
+# Characters each chunk's scan window extends past the chunk on both
+# sides; must exceed the longest match plus its context margin
+_WINDOW_OVERLAP = 256
+
+
+@lru_cache(maxsize=None)
+def _keyword_scanner(keywords: tuple[str, ...], flags: int = 0) -> MultiPatternScanner:
+    """Build a single-pass scanner for vague standard keywords, once per table.
+
+    Args:
+        keywords: Tuple of keyword phrases.
+        flags: Regex flags for the scanner.
+
+    Returns:
+        MultiPatternScanner: Whole-word scanner for the case-folded
+            keywords, whose pattern indices follow the order of `keywords`.
+    """
+    return MultiPatternScanner.for_keywords(
+        [keyword.casefold() for keyword in keywords], flags
+    )
+
+
+@lru_cache(maxsize=None)
+def _vague_table(
+    standards: tuple[tuple[str, tuple[str, float]], ...]
+) -> tuple[tuple[str, str, float], ...]:
+    """Flatten vague standards for match lookup, once per table.
+
+    Args:
+        standards: Tuple of (keyword, (description, severity)) items.
+
+    Returns:
+        tuple: (lowercase keyword, description, severity) per keyword, in
+            the order of `standards`.
+    """
+    return tuple(
+        (keyword.lower(), description, severity)
+        for keyword, (description, severity) in standards
+    )
+
+
+@lru_cache(maxsize=None)
+def _category_scanner(
+    tables: tuple[tuple[AmbiguityType, tuple[tuple[str, str, float], ...]], ...],
+    flags: int = 0
+) -> tuple[MultiPatternScanner, list[tuple[AmbiguityType, str, float]], bool]:
+    """Fuse several pattern tables into one scanner, once per set of tables.
+
+    Args:
+        tables: Tuple of (ambiguity type, pattern table) pairs, where each
+            pattern table holds (regex string, description, severity) tuples.
+        flags: Regex flags for the scanner.
+
+    Returns:
+        tuple: (scanner, meta, folded), where meta[i] is the (ambiguity
+            type, description, severity) of the scanner's pattern i, with
+            pattern indices following table order, and folded tells whether
+            every pattern is unchanged by case folding, so that scanning
+            case-folded text case-sensitively matches like IGNORECASE.
+    """
+    patterns = []
+    meta = []
+    for ambiguity_type, table in tables:
+        for pattern, description, severity in table:
+            patterns.append(pattern)
+            meta.append((ambiguity_type, description, severity))
+    folded = all(pattern.casefold() == pattern for pattern in patterns)
+    return MultiPatternScanner(patterns, flags), meta, folded
+
+
+def _scan_window(
+    detector: "AmbiguityDetector",
+    window: str,
+    offset: int,
+    keep_start: int,
+    keep_end: int
+) -> list[tuple]:
+    """Scan one window of a document for vague standards and pattern ambiguity.
+
+    Runs in a worker process for chunked detection. Only matches starting
+    in [keep_start, keep_end) of the window are kept; the rest of the
+    window gives them their surrounding text.
+
+    Args:
+        detector: Detector whose scanners to use.
+        window: Slice of the document to scan.
+        offset: Position of the window in the document.
+        keep_start: Window position where kept matches may start.
+        keep_end: Window position before which kept matches must start.
+
+    Returns:
+        list[tuple]: Match rows with positions relative to the document.
+    """
+    merged = heapq.merge(
+        detector._detect_vague_standards(window),
+        detector._detect_pattern_ambiguity(window, detector._pattern_tables),
+        key=itemgetter(0)
+    )
+    
+    rows = []
+    for row in merged:
+        if not keep_start <= row[0] < keep_end:
+            continue
+        position, source, text_start, text_end, *fields, context_start, context_end, interpretations = row
+        if source is None:
+            text_start += offset
+            text_end += offset
+        rows.append((
+            position + offset, source, text_start, text_end, *fields,
+            context_start + offset, context_end + offset, interpretations
+        ))
+    
+    return rows
+
+
+@dataclass(slots=True)
 class AmbiguityInstance:
     """A specific instance of ambiguity in text."""
     
@@ -45,7 +199,7 @@ class AmbiguityInstance:
         """
         return {
             'text': self.text,
-            'ambiguity_type': self.ambiguity_type.value,
+            'ambiguity_type': _TYPE_VALUES[self.ambiguity_type],
             'trigger_phrase': self.trigger_phrase,
             'position': self.position,
             'severity': self.severity,
@@ -55,7 +209,136 @@ class AmbiguityInstance:
         }
 
 
-@dataclass
+class _MatchBuffer(SequenceABC):
+    """
+    Columnar store of detected matches.
+    
+    Holds each match field in its own column and builds AmbiguityInstance
+    objects (with their matched text and context slices) only when an
+    instance is accessed, so callers that only need statistics or a few
+    instances skip most allocations. Pickles as a plain list of instances.
+    """
+    
+    __slots__ = (
+        '_text', '_instances', 'positions', 'sources', 'text_starts',
+        'text_ends', 'types', 'triggers', 'severities', 'confidences',
+        'context_starts', 'context_ends', 'interpretations'
+    )
+    
+    def __init__(self, text: str, rows: list[tuple]):
+        """Transpose detector rows into columns.
+        
+        Args:
+            text: The analyzed text that context spans refer to.
+            rows: Match row tuples, in report order.
+        """
+        self._text = text
+        self._instances = [None] * len(rows)
+        (
+            self.positions, self.sources, self.text_starts, self.text_ends,
+            self.types, self.triggers, severities, self.confidences,
+            self.context_starts, self.context_ends, self.interpretations
+        ) = tuple(zip(*rows)) or ((),) * _ROW_FIELDS
+        self.severities = array('d', severities)
+    
+    def __len__(self) -> int:
+        return len(self._instances)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        instance = self._instances[index]
+        if instance is None:
+            instance = self._instances[index] = self._materialize(index)
+        return instance
+    
+    def __iter__(self) -> Iterator[AmbiguityInstance]:
+        for index in range(len(self._instances)):
+            yield self[index]
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SequenceABC) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+    
+    def __reduce__(self):
+        return (list, (list(self),))
+    
+    def to_dicts(self) -> list[dict]:
+        """Serialize every match without building instance objects.
+
+        Context strings are sliced here, at serialization time. Matches
+        already materialized as instances are serialized from the instance.
+
+        Returns:
+            list[dict]: One dictionary per match, as AmbiguityInstance.to_dict
+                would produce.
+        """
+        text = self._text
+        dicts = []
+        
+        for index, instance in enumerate(self._instances):
+            if instance is not None:
+                dicts.append(instance.to_dict())
+                continue
+            interpretations = self.interpretations[index]
+            dicts.append({
+                'text': self._matched_text(index),
+                'ambiguity_type': _TYPE_VALUES[self.types[index]],
+                'trigger_phrase': self.triggers[index],
+                'position': self.positions[index],
+                'severity': self.severities[index],
+                'confidence': self.confidences[index],
+                'context': text[self.context_starts[index]:self.context_ends[index]],
+                'interpretation_range': list(interpretations) if interpretations else []
+            })
+        
+        return dicts
+    
+    def _matched_text(self, index: int) -> str:
+        """Slice the matched text of one match.
+
+        Args:
+            index: Index of the match.
+
+        Returns:
+            str: The matched text.
+        """
+        source = self.sources[index]
+        if source is None:
+            source = self._text
+        return source[self.text_starts[index]:self.text_ends[index]]
+    
+    def _materialize(self, index: int) -> AmbiguityInstance:
+        """Build the AmbiguityInstance for one match.
+        
+        Args:
+            index: Index of the match.
+        
+        Returns:
+            AmbiguityInstance: The match as an instance object.
+        """
+        if index < 0:
+            index += len(self._instances)
+        interpretations = self.interpretations[index]
+        
+        return AmbiguityInstance(
+            text=self._matched_text(index),
+            ambiguity_type=self.types[index],
+            trigger_phrase=self.triggers[index],
+            position=self.positions[index],
+            severity=self.severities[index],
+            confidence=self.confidences[index],
+            context=self._text[self.context_starts[index]:self.context_ends[index]],
+            interpretation_range=list(interpretations) if interpretations else []
+        )
+
+
+@dataclass(slots=True)
 class AmbiguityReport:
     """Report of ambiguity analysis."""
     
@@ -65,7 +348,7 @@ class AmbiguityReport:
     instances_by_type: dict[AmbiguityType, int]
     high_severity_count: int
     ambiguity_score: float  # 0-1, higher = more ambiguous
-    instances: list[AmbiguityInstance]
+    instances: Sequence[AmbiguityInstance]
     recommendations: list[str]
     
     def to_dict(self) -> dict:
@@ -80,12 +363,42 @@ class AmbiguityReport:
             'document_id': self.document_id,
             'jurisdiction': self.jurisdiction,
             'total_instances': self.total_instances,
-            'instances_by_type': {k.value: v for k, v in self.instances_by_type.items()},
+            'instances_by_type': {_TYPE_VALUES[k]: v for k, v in self.instances_by_type.items()},
             'high_severity_count': self.high_severity_count,
             'ambiguity_score': self.ambiguity_score,
-            'instances': [i.to_dict() for i in self.instances],
+            'instances': self._instance_dicts(),
             'recommendations': self.recommendations
         }
+    
+    def _instance_dicts(self) -> list[dict]:
+        """Serialize the report's instances.
+
+        Returns:
+            list[dict]: One dictionary per instance. A columnar buffer is
+                serialized directly, without materializing its instances.
+        """
+        if isinstance(self.instances, _MatchBuffer):
+            return self.instances.to_dicts()
+        return [i.to_dict() for i in self.instances]
+    
+    def most_severe(self, n: int) -> list[AmbiguityInstance]:
+        """Return the n most severe instances.
+
+        Instances of equal severity keep their report (position) order.
+        Only the returned instances are materialized.
+
+        Args:
+            n: Maximum number of instances to return.
+
+        Returns:
+            list[AmbiguityInstance]: Up to n instances, most severe first.
+        """
+        instances = self.instances
+        if isinstance(instances, _MatchBuffer):
+            severities = instances.severities
+            indices = heapq.nlargest(n, range(len(severities)), key=severities.__getitem__)
+            return [instances[i] for i in indices]
+        return heapq.nlargest(n, instances, key=attrgetter('severity'))
 
 
 class AmbiguityDetector:
@@ -96,8 +409,8 @@ class AmbiguityDetector:
     language that creates enforcement uncertainty.
     """
     
-    # Vague standard phrases
-    VAGUE_STANDARDS = {
+    # Vague standard phrases (read-only, so the shared scanners stay valid)
+    VAGUE_STANDARDS = MappingProxyType({
         'reasonable': ('Reasonable under the circumstances', 0.6),
         'appropriate': ('Appropriate measures', 0.6),
         'adequate': ('Adequate safeguards', 0.6),
@@ -118,7 +431,7 @@ class AmbiguityDetector:
         'as needed': ('As needed basis', 0.6),
         'as appropriate': ('As appropriate', 0.6),
         'in the ordinary course': ('In the ordinary course of business', 0.5),
-    }
+    })
     
     # Scope-unclear phrases
     SCOPE_UNCLEAR_PATTERNS = [
@@ -152,6 +465,19 @@ class AmbiguityDetector:
         (r'\bunusual\b', 'Unusual threshold undefined', 0.5),
     ]
     
+    # Type-specific recommendations: (type, count it must exceed, text)
+    TYPE_RECOMMENDATIONS = [
+        (AmbiguityType.VAGUE_STANDARD, 3,
+         "Multiple vague standards detected. Consider adopting conservative interpretations "
+         "and documenting compliance rationale."),
+        (AmbiguityType.TIMING_UNCLEAR, 2,
+         "Timing requirements are ambiguous. Seek clarification from regulators or "
+         "adopt most restrictive reasonable timeframes."),
+        (AmbiguityType.THRESHOLD_UNCLEAR, 2,
+         "Materiality/threshold definitions are unclear. Document your interpretation "
+         "methodology and seek legal review."),
+    ]
+    
     def __init__(
         self,
         defined_terms: Optional[set[str]] = None,
@@ -166,20 +492,27 @@ class AmbiguityDetector:
         """
         self.defined_terms = defined_terms or set()
         self.severity_threshold = severity_threshold
+        self._defined_terms_lower = frozenset(t.lower() for t in self.defined_terms)
         
-        # Compile patterns
-        self._scope_patterns = [(re.compile(p, re.IGNORECASE), d, s) 
-                                 for p, d, s in self.SCOPE_UNCLEAR_PATTERNS]
-        self._timing_patterns = [(re.compile(p, re.IGNORECASE), d, s) 
-                                  for p, d, s in self.TIMING_UNCLEAR_PATTERNS]
-        self._threshold_patterns = [(re.compile(p, re.IGNORECASE), d, s) 
-                                     for p, d, s in self.THRESHOLD_UNCLEAR_PATTERNS]
+        # Compiled patterns are shared by all detectors using the same tables
+        self._vague_keywords = tuple(self.VAGUE_STANDARDS)
+        self._vague_scanner = _keyword_scanner(self._vague_keywords)
+        self._vague_ignorecase_scanner = _keyword_scanner(self._vague_keywords, re.IGNORECASE)
+        self._vague_table = _vague_table(tuple(self.VAGUE_STANDARDS.items()))
+        self._pattern_tables = (
+            (AmbiguityType.SCOPE_UNCLEAR, tuple(self.SCOPE_UNCLEAR_PATTERNS)),
+            (AmbiguityType.TIMING_UNCLEAR, tuple(self.TIMING_UNCLEAR_PATTERNS)),
+            (AmbiguityType.THRESHOLD_UNCLEAR, tuple(self.THRESHOLD_UNCLEAR_PATTERNS)),
+        )
     
     def detect(
         self,
         text: str,
         document_id: str = "unknown",
-        jurisdiction: Optional[str] = None
+        jurisdiction: Optional[str] = None,
+        defined_terms: Optional[set[str]] = None,
+        word_count: Optional[int] = None,
+        num_workers: int = 1
     ) -> AmbiguityReport:
         """
         Detect ambiguity in regulatory text.
@@ -188,57 +521,61 @@ class AmbiguityDetector:
             text: Regulatory text to analyze
             document_id: Identifier for the document
             jurisdiction: Optional jurisdiction
+            defined_terms: Terms defined in this document; overrides the
+                detector's defined_terms for this call, so one detector
+                can be reused across documents
+            word_count: Number of whitespace-separated words in the text,
+                if already known (e.g. from NormalizedText.word_count);
+                counted from the text otherwise
+            num_workers: Number of worker processes for scanning texts
+                longer than PARALLEL_CHUNK_SIZE; 1 scans in-process
             
         Returns:
             AmbiguityReport with all detected ambiguities
         """
-        instances = []
-        
-        # Detect vague standards
-        instances.extend(self._detect_vague_standards(text))
-        
-        # Detect scope ambiguity
-        instances.extend(self._detect_pattern_ambiguity(
-            text, self._scope_patterns, AmbiguityType.SCOPE_UNCLEAR
-        ))
-        
-        # Detect timing ambiguity
-        instances.extend(self._detect_pattern_ambiguity(
-            text, self._timing_patterns, AmbiguityType.TIMING_UNCLEAR
-        ))
-        
-        # Detect threshold ambiguity
-        instances.extend(self._detect_pattern_ambiguity(
-            text, self._threshold_patterns, AmbiguityType.THRESHOLD_UNCLEAR
-        ))
+        # Each detector yields rows in position order, so merging the
+        # streams keeps matches sorted by position without a full sort.
+        # Ties keep detector order: vague standards, scope, timing,
+        # threshold, then undefined terms.
+        if num_workers > 1 and len(text) > PARALLEL_CHUNK_SIZE:
+            merged = heapq.merge(
+                self._parallel_detect(text, num_workers),
+                self._detect_undefined_terms(text, defined_terms),
+                key=itemgetter(0)
+            )
+        else:
+            merged = heapq.merge(
+                self._detect_vague_standards(text),
+                self._detect_pattern_ambiguity(text, self._pattern_tables),
+                self._detect_undefined_terms(text, defined_terms),
+                key=itemgetter(0)
+            )
         
-        # Detect undefined terms
-        instances.extend(self._detect_undefined_terms(text))
+        import numpy as np
         
         # Filter by severity threshold
-        instances = [i for i in instances if i.severity >= self.severity_threshold]
-        
-        # Sort by position
-        instances = sorted(instances, key=lambda x: x.position)
+        severity_threshold = self.severity_threshold
+        instances = _MatchBuffer(text, [
+            row for row in merged if row[_ROW_SEVERITY] >= severity_threshold
+        ])
         
-        # Calculate statistics
-        instances_by_type = {}
-        for inst in instances:
-            if inst.ambiguity_type not in instances_by_type:
-                instances_by_type[inst.ambiguity_type] = 0
-            instances_by_type[inst.ambiguity_type] += 1
-        
-        high_severity_count = sum(1 for i in instances if i.severity >= 0.7)
+        # Calculate statistics from the buffer's columns
+        instances_by_type = dict(Counter(instances.types))
+        severities = np.frombuffer(instances.severities, dtype=np.float64)
+        high_severity_count = int(np.count_nonzero(severities >= 0.7))
         
         # Calculate overall ambiguity score
         if instances:
-            word_count = len(text.split())
+            if word_count is None:
+                word_count = len(text.split())
             ambiguity_score = min(1.0, len(instances) / (word_count / 100))
         else:
             ambiguity_score = 0.0
         
         # Generate recommendations
-        recommendations = self._generate_recommendations(instances, instances_by_type)
+        recommendations = self._generate_recommendations(
+            len(instances), high_severity_count, instances_by_type
+        )
         
         return AmbiguityReport(
             document_id=document_id,
@@ -251,87 +588,170 @@ class AmbiguityDetector:
             recommendations=recommendations
         )
     
-    def _detect_vague_standards(self, text: str) -> list[AmbiguityInstance]:
+    def detect_batch(
+        self,
+        texts: Sequence[str],
+        document_ids: Optional[Sequence[str]] = None,
+        jurisdiction: Optional[str] = None,
+        num_workers: int = 1
+    ) -> list[AmbiguityReport]:
+        """
+        Detect ambiguity in several regulatory texts.
+        
+        Every text is analyzed with this detector's shared scanners. With
+        more than one worker, texts are spread over a process pool, as the
+        scan is CPU-bound.
+        
+        Args:
+            texts: Regulatory texts to analyze
+            document_ids: Optional identifier for each text; defaults to
+                "unknown"
+            jurisdiction: Optional jurisdiction shared by all texts
+            num_workers: Number of worker processes; 1 analyzes in-process
+            
+        Returns:
+            List of AmbiguityReport, one per text, in input order
+        """
+        if document_ids is None:
+            document_ids = ["unknown"] * len(texts)
+        
+        if num_workers <= 1 or len(texts) <= 1:
+            return [
+                self.detect(text, document_id, jurisdiction)
+                for text, document_id in zip(texts, document_ids)
+            ]
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = min(num_workers, len(texts))
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                self.detect, texts, document_ids, repeat(jurisdiction),
+                chunksize=chunksize
+            ))
+    
+    def _parallel_detect(
+        self,
+        text: str,
+        num_workers: int,
+        chunk_size: Optional[int] = None,
+        overlap: int = _WINDOW_OVERLAP
+    ) -> Iterator[tuple]:
+        """Scan a long text for vague standards and pattern ambiguity in chunks.
+
+        The text is split into chunks scanned on a process pool. Each scan
+        window extends `overlap` characters past its chunk on both sides, so
+        word boundaries and matches crossing a chunk edge are seen, and only
+        matches starting inside the chunk are kept.
+
+        Args:
+            text: The regulatory text to analyze.
+            num_workers: Number of worker processes.
+            chunk_size: Number of characters per chunk. Defaults to
+                PARALLEL_CHUNK_SIZE.
+            overlap: Characters each window extends past its chunk.
+
+        Yields:
+            tuple: Match rows in the same order as the in-process scan.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        if chunk_size is None:
+            chunk_size = PARALLEL_CHUNK_SIZE
+        
+        windows = []
+        for chunk_start in range(0, len(text), chunk_size):
+            offset = max(0, chunk_start - overlap)
+            chunk_end = min(len(text), chunk_start + chunk_size)
+            windows.append((
+                text[offset:chunk_end + overlap], offset,
+                chunk_start - offset, chunk_end - offset
+            ))
+        
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(windows))) as pool:
+            results = pool.map(_scan_window, repeat(self), *zip(*windows))
+            for rows in results:
+                yield from rows
+    
+    def _detect_vague_standards(self, text: str) -> Iterator[tuple]:
         """Detect vague standard phrases in regulatory text.
 
-        Scans the text for common vague terms like "reasonable", "appropriate",
-        and "material" that create interpretation uncertainty.
+        Scans the text once for all common vague terms like "reasonable",
+        "appropriate", and "material" that create interpretation uncertainty.
 
         Args:
             text: The regulatory text to analyze.
 
-        Returns:
-            list[AmbiguityInstance]: A list of detected vague standard instances,
-                each containing the matched phrase, context, and severity.
+        Yields:
+            tuple: A match row for each detected vague standard, in position
+                order, holding the matched phrase, context span, and severity.
         """
-        instances = []
-        text_lower = text.lower()
+        # Scanning case-folded text with a case-sensitive scanner is cheaper
+        # than a case-insensitive scan. Folding can lengthen some characters
+        # (e.g. "ß"), which would shift positions, so such text is scanned
+        # case-insensitively as is instead.
+        text_folded = text.casefold()
+        if len(text_folded) == len(text):
+            matches = self._vague_scanner.scan(text_folded)
+        else:
+            matches = self._vague_ignorecase_scanner.scan(text)
         
-        for keyword, (description, severity) in self.VAGUE_STANDARDS.items():
-            pattern = re.compile(rf'\b{re.escape(keyword.lower())}\b', re.IGNORECASE)
+        # Whole-word matches of a keyword are the keyword itself up to case,
+        # so the lowercase keyword serves as the matched text
+        for index, match_start, match_end in matches:
+            keyword, description, severity = self._vague_table[index]
             
-            for match in pattern.finditer(text_lower):
-                # Get context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                
-                instances.append(AmbiguityInstance(
-                    text=match.group(),
-                    ambiguity_type=AmbiguityType.VAGUE_STANDARD,
-                    trigger_phrase=description,
-                    position=match.start(),
-                    severity=severity,
-                    confidence=0.8,
-                    context=context,
-                    interpretation_range=[
-                        "Conservative: Most restrictive interpretation",
-                        "Moderate: Industry standard interpretation",
-                        "Liberal: Least restrictive interpretation"
-                    ]
-                ))
-        
-        return instances
+            yield (
+                match_start, keyword, 0, len(keyword),
+                AmbiguityType.VAGUE_STANDARD, description, severity, 0.8,
+                max(0, match_start - 50), match_end + 50, _VAGUE_INTERPRETATIONS
+            )
     
     def _detect_pattern_ambiguity(
         self,
         text: str,
-        patterns: list[tuple[re.Pattern, str, float]],
-        ambiguity_type: AmbiguityType
-    ) -> list[AmbiguityInstance]:
-        """Detect ambiguity in text using regex patterns.
+        tables: tuple[tuple[AmbiguityType, tuple[tuple[str, str, float], ...]], ...]
+    ) -> Iterator[tuple]:
+        """Detect ambiguity in text using regex pattern tables.
+
+        All tables are fused into one scanner, so the text is scanned once
+        however many tables are given.
 
         Args:
             text: The regulatory text to analyze.
-            patterns: A list of tuples containing (compiled regex pattern,
-                description string, severity float).
-            ambiguity_type: The type of ambiguity being detected.
+            tables: A tuple of (ambiguity type, pattern table) pairs, where
+                each pattern table holds (regex string, description string,
+                severity float) tuples.
 
-        Returns:
-            list[AmbiguityInstance]: A list of detected ambiguity instances
-                matching the provided patterns.
+        Yields:
+            tuple: A match row for each match of the provided patterns,
+                ordered by position and then by table and pattern order.
         """
-        instances = []
-        
-        for pattern, description, severity in patterns:
-            for match in pattern.finditer(text):
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                
-                instances.append(AmbiguityInstance(
-                    text=match.group(),
-                    ambiguity_type=ambiguity_type,
-                    trigger_phrase=description,
-                    position=match.start(),
-                    severity=severity,
-                    confidence=0.7,
-                    context=context
-                ))
-        
-        return instances
-    
-    def _detect_undefined_terms(self, text: str) -> list[AmbiguityInstance]:
+        # As for vague standards, scan case-folded text case-sensitively
+        # when the patterns allow it and folding keeps positions
+        scanner, meta, folded = _category_scanner(tables)
+        text_folded = text.casefold() if folded else text
+        if folded and len(text_folded) == len(text):
+            matches = scanner.scan(text_folded)
+        else:
+            scanner, meta, _ = _category_scanner(tables, re.IGNORECASE)
+            matches = scanner.scan(text)
+        
+        for index, match_start, match_end in matches:
+            ambiguity_type, description, severity = meta[index]
+            
+            yield (
+                match_start, None, match_start, match_end,
+                ambiguity_type, description, severity, 0.7,
+                max(0, match_start - 50), match_end + 50, None
+            )
+    
+    def _detect_undefined_terms(
+        self,
+        text: str,
+        defined_terms: Optional[set[str]] = None
+    ) -> Iterator[tuple]:
         """Detect potentially undefined terms in the regulatory text.
 
         Identifies quoted terms that may require definitions but are not
@@ -340,26 +760,30 @@ class AmbiguityDetector:
 
         Args:
             text: The regulatory text to analyze.
+            defined_terms: Terms defined in the document. Defaults to the
+                detector's defined_terms.
 
-        Returns:
-            list[AmbiguityInstance]: A list of detected undefined term instances.
+        Yields:
+            tuple: A match row for each potentially undefined term, in
+                position order.
         """
-        instances = []
+        # Whole-phrase lookup (multi-word terms included)
+        if defined_terms is None:
+            defined_lower = self._defined_terms_lower
+        else:
+            defined_lower = frozenset(t.lower() for t in defined_terms)
         
         # Look for quoted terms that might need definitions
-        quoted_pattern = re.compile(r'"([^"]{2,50})"')
-        
-        for match in quoted_pattern.finditer(text):
+        for match in _QUOTED_TERM_RE.finditer(text):
             term = match.group(1)
             term_lower = term.lower()
             
             # Skip if it's a defined term
-            if term_lower in {t.lower() for t in self.defined_terms}:
+            if term_lower in defined_lower:
                 continue
             
             # Skip common phrases that aren't terms
-            skip_phrases = {'and', 'or', 'the', 'a', 'an', 'means', 'shall'}
-            if term_lower in skip_phrases:
+            if term_lower in _SKIP_PHRASES:
                 continue
             
             # Check if it looks like a definition
@@ -367,25 +791,17 @@ class AmbiguityDetector:
             if 'means' in after_text or 'shall mean' in after_text:
                 continue
             
-            start = max(0, match.start() - 50)
-            end = min(len(text), match.end() + 50)
-            context = text[start:end]
-            
-            instances.append(AmbiguityInstance(
-                text=term,
-                ambiguity_type=AmbiguityType.UNDEFINED_TERM,
-                trigger_phrase=f"Potentially undefined term: {term}",
-                position=match.start(),
-                severity=0.5,
-                confidence=0.5,
-                context=context
-            ))
-        
-        return instances
+            match_start, match_end = match.span()
+            yield (
+                match_start, None, match.start(1), match.end(1),
+                AmbiguityType.UNDEFINED_TERM, f"Potentially undefined term: {term}",
+                0.5, 0.5, max(0, match_start - 50), match_end + 50, None
+            )
     
     def _generate_recommendations(
         self,
-        instances: list[AmbiguityInstance],
+        total_instances: int,
+        high_severity_count: int,
         by_type: dict[AmbiguityType, int]
     ) -> list[str]:
         """Generate recommendations based on ambiguity analysis results.
@@ -394,58 +810,43 @@ class AmbiguityDetector:
         including legal review guidance and type-specific suggestions.
 
         Args:
-            instances: The list of all detected ambiguity instances.
+            total_instances: The number of detected ambiguity instances.
+            high_severity_count: The number of high-severity instances.
             by_type: A dictionary mapping ambiguity types to their occurrence counts.
 
         Returns:
             list[str]: A list of recommendation strings for addressing
                 the detected ambiguities.
         """
-        recommendations = []
-        
-        if not instances:
-            recommendations.append("No significant ambiguity detected")
-            return recommendations
+        if not total_instances:
+            return ["No significant ambiguity detected"]
         
         # Always emphasize legal review
-        recommendations.append(
+        recommendations = [
             "IMPORTANT: This analysis identifies potential ambiguity but does not provide legal advice. "
             "Consult qualified legal counsel for interpretation guidance."
-        )
+        ]
         
         # Type-specific recommendations
-        if by_type.get(AmbiguityType.VAGUE_STANDARD, 0) > 3:
-            recommendations.append(
-                "Multiple vague standards detected. Consider adopting conservative interpretations "
-                "and documenting compliance rationale."
-            )
-        
-        if by_type.get(AmbiguityType.TIMING_UNCLEAR, 0) > 2:
-            recommendations.append(
-                "Timing requirements are ambiguous. Seek clarification from regulators or "
-                "adopt most restrictive reasonable timeframes."
-            )
-        
-        if by_type.get(AmbiguityType.THRESHOLD_UNCLEAR, 0) > 2:
-            recommendations.append(
-                "Materiality/threshold definitions are unclear. Document your interpretation "
-                "methodology and seek legal review."
-            )
+        for ambiguity_type, count_threshold, recommendation in self.TYPE_RECOMMENDATIONS:
+            if by_type.get(ambiguity_type, 0) > count_threshold:
+                recommendations.append(recommendation)
         
-        high_severity = sum(1 for i in instances if i.severity >= 0.7)
-        if high_severity > 5:
+        if high_severity_count > 5:
             recommendations.append(
-                f"HIGH PRIORITY: {high_severity} high-severity ambiguities detected. "
+                f"HIGH PRIORITY: {high_severity_count} high-severity ambiguities detected. "
                 "Prioritize legal review of these items."
             )
         
         return recommendations
     
-    def get_ambiguity_ranking(self, instances: list[AmbiguityInstance]) -> list[AmbiguityInstance]:
+    def get_ambiguity_ranking(self, instances: Sequence[AmbiguityInstance]) -> list[AmbiguityInstance]:
         """Rank ambiguities by severity for prioritization.
 
         Sorts ambiguity instances in descending order by severity first,
-        then by confidence as a secondary sort key.
+        then by confidence as a secondary sort key. The sort is stable and
+        runs in NumPy; a report's instance buffer is ranked from its columns
+        without materializing the instances first.
 
         Args:
             instances: The list of ambiguity instances to rank.
@@ -454,4 +855,20 @@ class AmbiguityDetector:
             list[AmbiguityInstance]: The sorted list of ambiguity instances,
                 with highest severity and confidence items first.
         """
-        return sorted(instances, key=lambda x: (-x.severity, -x.confidence))
+        import numpy as np
+        
+        if isinstance(instances, _MatchBuffer):
+            severities = np.frombuffer(instances.severities, dtype=np.float64)
+            confidences = np.asarray(instances.confidences, dtype=np.float64)
+        else:
+            instances = list(instances)
+            severities = np.fromiter(
+                (i.severity for i in instances), dtype=np.float64, count=len(instances)
+            )
+            confidences = np.fromiter(
+                (i.confidence for i in instances), dtype=np.float64, count=len(instances)
+            )
+        
+        # lexsort orders by the last key first
+        order = np.lexsort((-confidences, -severities))
+        return [instances[i] for i in order.tolist()]
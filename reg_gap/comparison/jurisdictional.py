@@ -9,13 +9,55 @@ Compares regulations across different jurisdictions to identify:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from multiprocessing.context import BaseContext
+from types import MappingProxyType
+from typing import Iterator, Optional
+
+import numpy as np
 
 from ..parsing.clause_extractor import RegulatoryClause, ClauseType
 from ..parsing.definitions import Definition
 from .semantic_diff import SemanticDiff, ClauseDifference, DifferenceType
 
 
+# Comparator, profiles, and clause features of the generate_gap_matrix
+# call a worker process serves
+_worker_context: Optional[tuple] = None
+
+
+def _init_gap_worker(
+    comparator: "JurisdictionalComparator",
+    profiles: list["JurisdictionProfile"],
+    features: list
+) -> None:
+    """Receive the comparator, profiles, and clause features once per worker.
+
+    Args:
+        comparator: Comparator used for every pair.
+        profiles: Profiles being compared.
+        features: Each profile's clause features, from
+            `SemanticDiff.clause_features`.
+    """
+    global _worker_context
+    _worker_context = (comparator, profiles, features)
+
+
+def _compare_pair(i: int, j: int) -> list["JurisdictionalGap"]:
+    """Compare the clauses and definitions of two of the worker's profiles.
+
+    Args:
+        i: Index of the first profile.
+        j: Index of the second profile.
+
+    Returns:
+        list[JurisdictionalGap]: Clause and definition gaps between the two
+            profiles.
+    """
+    comparator, profiles, features = _worker_context
+    return comparator._compare_content(profiles[i], profiles[j], features[i], features[j])
+
+
 class GapType(Enum):
     """Types of jurisdictional gaps."""
     COVERAGE_GAP = "coverage_gap"  # Requirement exists in A but not B
@@ -28,7 +70,7 @@ class GapType(Enum):
     AMBIGUITY = "ambiguity"
 
 
-@dataclass
+@dataclass(slots=True)
 class JurisdictionalGap:
     """Represents a gap between jurisdictions."""
     
@@ -79,15 +121,30 @@ class JurisdictionProfile:
     def __post_init__(self):
         self._count_clause_types()
     
+    @cached_property
+    def terms_lower(self) -> dict[str, Definition]:
+        """dict[str, Definition]: Definitions keyed by lowercased term."""
+        return {d.term.lower(): d for d in self.definitions}
+    
     def _count_clause_types(self):
         """Count clauses by type and update instance counters.
 
         Updates the obligation_count, prohibition_count, and permission_count
         attributes based on the clause types present in the clauses list.
         """
-        self.obligation_count = sum(1 for c in self.clauses if c.clause_type == ClauseType.OBLIGATION)
-        self.prohibition_count = sum(1 for c in self.clauses if c.clause_type == ClauseType.PROHIBITION)
-        self.permission_count = sum(1 for c in self.clauses if c.clause_type == ClauseType.PERMISSION)
+        obligations = prohibitions = permissions = 0
+        for clause in self.clauses:
+            clause_type = clause.clause_type
+            if clause_type is ClauseType.OBLIGATION:
+                obligations += 1
+            elif clause_type is ClauseType.PROHIBITION:
+                prohibitions += 1
+            elif clause_type is ClauseType.PERMISSION:
+                permissions += 1
+        
+        self.obligation_count = obligations
+        self.prohibition_count = prohibitions
+        self.permission_count = permissions
 
 
 class JurisdictionalComparator:
@@ -98,6 +155,15 @@ class JurisdictionalComparator:
     create compliance challenges for multi-jurisdictional operations.
     """
     
+    # Gap type reported for each kind of clause difference
+    GAP_TYPES = MappingProxyType({
+        DifferenceType.STRICTER: GapType.STRICTER_IN_A,
+        DifferenceType.LOOSER: GapType.STRICTER_IN_B,
+        DifferenceType.AMBIGUOUS: GapType.AMBIGUITY,
+        DifferenceType.CONFLICTING: GapType.SCOPE_DIFFERENCE,
+        DifferenceType.NOVEL: GapType.COVERAGE_GAP,
+    })
+    
     def __init__(self, semantic_diff: Optional[SemanticDiff] = None):
         """
         Initialize comparator.
@@ -122,12 +188,46 @@ class JurisdictionalComparator:
         Returns:
             List of identified gaps
         """
+        gaps = self._compare_content(profile_a, profile_b)
+        
+        # Analyze overall regulatory burden
+        burden_gaps = self._analyze_regulatory_burden(profile_a, profile_b)
+        gaps.extend(burden_gaps)
+        
+        return gaps
+    
+    def _compare_content(
+        self,
+        profile_a: JurisdictionProfile,
+        profile_b: JurisdictionProfile,
+        features_a=None,
+        features_b=None
+    ) -> list[JurisdictionalGap]:
+        """Find the clause and definition gaps between two profiles.
+
+        Args:
+            profile_a: First jurisdiction profile.
+            profile_b: Second jurisdiction profile.
+            features_a: Optional precomputed clause features of profile_a,
+                from `SemanticDiff.clause_features`.
+            features_b: Optional precomputed clause features of profile_b.
+
+        Returns:
+            list[JurisdictionalGap]: Clause gaps followed by definitional
+                conflicts, as in `compare` but without burden gaps.
+        """
         gaps = []
         
         # Compare clauses semantically
-        clause_diffs = self.semantic_diff.compare_clauses(
+        if features_a is None:
+            features_a = self.semantic_diff.clause_features(profile_a.clauses)
+        if features_b is None:
+            features_b = self.semantic_diff.clause_features(profile_b.clauses)
+        clause_diffs = self.semantic_diff.compare_prepared(
             profile_a.clauses,
             profile_b.clauses,
+            features_a,
+            features_b,
             profile_a.jurisdiction,
             profile_b.jurisdiction
         )
@@ -140,17 +240,13 @@ class JurisdictionalComparator:
         
         # Check for definitional conflicts
         definition_gaps = self._compare_definitions(
-            profile_a.definitions,
-            profile_b.definitions,
+            profile_a.terms_lower,
+            profile_b.terms_lower,
             profile_a.jurisdiction,
             profile_b.jurisdiction
         )
         gaps.extend(definition_gaps)
         
-        # Analyze overall regulatory burden
-        burden_gaps = self._analyze_regulatory_burden(profile_a, profile_b)
-        gaps.extend(burden_gaps)
-        
         return gaps
     
     def _diff_to_gap(
@@ -171,18 +267,10 @@ class JurisdictionalComparator:
                 is significant, or None if the clauses are equivalent.
         """
         
-        if diff.difference_type == DifferenceType.EQUIVALENT:
+        if diff.difference_type is DifferenceType.EQUIVALENT:
             return None
         
-        gap_type_map = {
-            DifferenceType.STRICTER: GapType.STRICTER_IN_A,
-            DifferenceType.LOOSER: GapType.STRICTER_IN_B,
-            DifferenceType.AMBIGUOUS: GapType.AMBIGUITY,
-            DifferenceType.CONFLICTING: GapType.SCOPE_DIFFERENCE,
-            DifferenceType.NOVEL: GapType.COVERAGE_GAP,
-        }
-        
-        gap_type = gap_type_map.get(diff.difference_type, GapType.AMBIGUITY)
+        gap_type = self.GAP_TYPES.get(diff.difference_type, GapType.AMBIGUITY)
         
         # Generate recommendations (NOTE: these are for review, not action)
         recommendations = self._generate_recommendations(diff, gap_type)
@@ -212,19 +300,19 @@ class JurisdictionalComparator:
         """
         recommendations = []
         
-        if gap_type == GapType.COVERAGE_GAP:
+        if gap_type is GapType.COVERAGE_GAP:
             recommendations.append(
                 "REVIEW REQUIRED: Evaluate whether this requirement applies to your operations"
             )
-        elif gap_type == GapType.STRICTER_IN_A:
+        elif gap_type is GapType.STRICTER_IN_A:
             recommendations.append(
                 "LEGAL REVIEW: First jurisdiction may have stricter requirements"
             )
-        elif gap_type == GapType.STRICTER_IN_B:
+        elif gap_type is GapType.STRICTER_IN_B:
             recommendations.append(
                 "LEGAL REVIEW: Second jurisdiction may have stricter requirements"
             )
-        elif gap_type == GapType.AMBIGUITY:
+        elif gap_type is GapType.AMBIGUITY:
             recommendations.append(
                 "HIGH PRIORITY REVIEW: Ambiguous language creates enforcement uncertainty"
             )
@@ -253,9 +341,9 @@ class JurisdictionalComparator:
         base_severity = 0.5
         
         # Higher severity for prohibitions and obligations
-        if diff.clause_a.clause_type == ClauseType.PROHIBITION:
+        if diff.clause_a.clause_type is ClauseType.PROHIBITION:
             base_severity += 0.2
-        elif diff.clause_a.clause_type == ClauseType.OBLIGATION:
+        elif diff.clause_a.clause_type is ClauseType.OBLIGATION:
             base_severity += 0.15
         
         # Higher severity for ambiguous or conflicting
@@ -269,8 +357,8 @@ class JurisdictionalComparator:
     
     def _compare_definitions(
         self,
-        defs_a: list[Definition],
-        defs_b: list[Definition],
+        terms_a: dict[str, Definition],
+        terms_b: dict[str, Definition],
         jurisdiction_a: str,
         jurisdiction_b: str
     ) -> list[JurisdictionalGap]:
@@ -280,8 +368,10 @@ class JurisdictionalComparator:
         which may create compliance ambiguity or conflicts.
 
         Args:
-            defs_a: Definitions from the first jurisdiction.
-            defs_b: Definitions from the second jurisdiction.
+            terms_a: Definitions from the first jurisdiction, keyed by
+                lowercased term (see `JurisdictionProfile.terms_lower`).
+            terms_b: Definitions from the second jurisdiction, keyed the
+                same way.
             jurisdiction_a: Name of the first jurisdiction.
             jurisdiction_b: Name of the second jurisdiction.
 
@@ -291,12 +381,8 @@ class JurisdictionalComparator:
         """
         gaps = []
         
-        # Build lookup by term
-        terms_a = {d.term.lower(): d for d in defs_a}
-        terms_b = {d.term.lower(): d for d in defs_b}
-        
         # Find common terms with different definitions
-        common_terms = set(terms_a.keys()) & set(terms_b.keys())
+        common_terms = terms_a.keys() & terms_b.keys()
         
         for term in common_terms:
             def_a = terms_a[term]
@@ -341,58 +427,154 @@ class JurisdictionalComparator:
                 differences in regulatory burden (e.g., one jurisdiction
                 having 50% more obligations than another).
         """
-        gaps = []
-        
-        # Compare obligation counts
         if profile_a.obligation_count > profile_b.obligation_count * 1.5:
-            gaps.append(JurisdictionalGap(
-                gap_type=GapType.SCOPE_DIFFERENCE,
-                jurisdiction_a=profile_a.jurisdiction,
-                jurisdiction_b=profile_b.jurisdiction,
-                description=f"{profile_a.jurisdiction} has significantly more obligations ({profile_a.obligation_count} vs {profile_b.obligation_count})",
-                severity=0.6,
-                confidence=0.9,
-                recommendations=[
-                    "Review additional obligations for applicability",
-                    "Consider compliance burden in operational planning"
-                ],
-                requires_legal_review=True
-            ))
-        elif profile_b.obligation_count > profile_a.obligation_count * 1.5:
-            gaps.append(JurisdictionalGap(
-                gap_type=GapType.SCOPE_DIFFERENCE,
-                jurisdiction_a=profile_a.jurisdiction,
-                jurisdiction_b=profile_b.jurisdiction,
-                description=f"{profile_b.jurisdiction} has significantly more obligations ({profile_b.obligation_count} vs {profile_a.obligation_count})",
-                severity=0.6,
-                confidence=0.9,
-                recommendations=[
-                    "Review additional obligations for applicability",
-                    "Consider compliance burden in operational planning"
-                ],
-                requires_legal_review=True
-            ))
+            return [self._burden_gap(profile_a, profile_b, profile_a, profile_b)]
+        if profile_b.obligation_count > profile_a.obligation_count * 1.5:
+            return [self._burden_gap(profile_a, profile_b, profile_b, profile_a)]
+        return []
+    
+    def _burden_matrix(
+        self,
+        profiles: list[JurisdictionProfile]
+    ) -> dict[tuple[int, int], list[JurisdictionalGap]]:
+        """Analyze regulatory burden for every pair of profiles at once.
+
+        Equivalent to `_analyze_regulatory_burden` on each pair (i, j) with
+        i < j, but compares all obligation counts in one array operation.
+
+        Args:
+            profiles: Jurisdiction profiles being compared.
+
+        Returns:
+            dict[tuple[int, int], list[JurisdictionalGap]]: Burden gaps keyed
+                by profile index pair; pairs without a gap are omitted.
+        """
+        counts = np.array([p.obligation_count for p in profiles], dtype=np.float64)
+        heavier = counts[:, None] > counts[None, :] * 1.5
         
-        return gaps
+        burden = {}
+        for i, j in zip(*np.nonzero(np.triu(heavier | heavier.T, k=1))):
+            profile_a, profile_b = profiles[i], profiles[j]
+            if heavier[i, j]:
+                gap = self._burden_gap(profile_a, profile_b, profile_a, profile_b)
+            else:
+                gap = self._burden_gap(profile_a, profile_b, profile_b, profile_a)
+            burden[(int(i), int(j))] = [gap]
+        return burden
+    
+    def _burden_gap(
+        self,
+        profile_a: JurisdictionProfile,
+        profile_b: JurisdictionProfile,
+        heavier: JurisdictionProfile,
+        lighter: JurisdictionProfile
+    ) -> JurisdictionalGap:
+        """Build the gap for a pair where one profile has far more obligations.
+
+        Args:
+            profile_a: Profile of the first jurisdiction.
+            profile_b: Profile of the second jurisdiction.
+            heavier: Whichever of the two has more obligations.
+            lighter: The other profile.
+
+        Returns:
+            JurisdictionalGap: A scope-difference gap describing the burden.
+        """
+        return JurisdictionalGap(
+            gap_type=GapType.SCOPE_DIFFERENCE,
+            jurisdiction_a=profile_a.jurisdiction,
+            jurisdiction_b=profile_b.jurisdiction,
+            description=f"{heavier.jurisdiction} has significantly more obligations ({heavier.obligation_count} vs {lighter.obligation_count})",
+            severity=0.6,
+            confidence=0.9,
+            recommendations=[
+                "Review additional obligations for applicability",
+                "Consider compliance burden in operational planning"
+            ],
+            requires_legal_review=True
+        )
     
     def generate_gap_matrix(
         self,
-        profiles: list[JurisdictionProfile]
+        profiles: list[JurisdictionProfile],
+        num_workers: int = 1,
+        mp_context: Optional[BaseContext] = None
     ) -> dict[tuple[str, str], list[JurisdictionalGap]]:
         """
         Generate a matrix of gaps between all jurisdiction pairs.
         
         Args:
             profiles: List of jurisdiction profiles
+            num_workers: Number of worker processes; 1 compares in-process
+            mp_context: Multiprocessing context for the worker pool
+                (default: the platform's start method)
             
         Returns:
             Dictionary mapping (jurisdiction_a, jurisdiction_b) to gaps
         """
-        matrix = {}
+        return dict(self.iter_gap_matrix(profiles, num_workers, mp_context))
+    
+    def iter_gap_matrix(
+        self,
+        profiles: list[JurisdictionProfile],
+        num_workers: int = 1,
+        mp_context: Optional[BaseContext] = None
+    ) -> Iterator[tuple[tuple[str, str], list[JurisdictionalGap]]]:
+        """
+        Compare all jurisdiction pairs, yielding each pair's gaps as it is ready.
+        
+        Lets callers write out or discard each pair's gaps without holding
+        the whole matrix in memory.
+        
+        Each profile's clauses are embedded (or tokenized) once and reused
+        for all of its pairs. Pairs are independent, so with more than one
+        worker they are compared in a process pool; each worker receives
+        the comparator, profiles, and features once rather than with every
+        pair. These are pickled for workers that do not fork, so the pool
+        works under any start method.
+        
+        Args:
+            profiles: List of jurisdiction profiles
+            num_workers: Number of worker processes; 1 compares in-process
+            mp_context: Multiprocessing context for the worker pool
+                (default: the platform's start method)
+            
+        Yields:
+            ((jurisdiction_a, jurisdiction_b), gaps) for every pair of
+            profiles, in the same order as `generate_gap_matrix`
+        """
+        pairs = [
+            (i, j)
+            for i in range(len(profiles))
+            for j in range(i + 1, len(profiles))
+        ]
+        
+        # Burden gaps come from one pass over all obligation counts and are
+        # appended to each pair's clause and definition gaps, as in compare
+        burden = self._burden_matrix(profiles)
+        features = [self.semantic_diff.clause_features(p.clauses) for p in profiles]
+        
+        if num_workers <= 1 or len(pairs) <= 1:
+            for i, j in pairs:
+                gaps = self._compare_content(profiles[i], profiles[j], features[i], features[j])
+                yield (profiles[i].jurisdiction, profiles[j].jurisdiction), gaps + burden.get((i, j), [])
+            return
         
-        for i, profile_a in enumerate(profiles):
-            for profile_b in profiles[i + 1:]:
-                gaps = self.compare(profile_a, profile_b)
-                matrix[(profile_a.jurisdiction, profile_b.jurisdiction)] = gaps
+        from concurrent.futures import ProcessPoolExecutor
         
-        return matrix
+        workers = min(num_workers, len(pairs))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_gap_worker,
+            initargs=(self, profiles, features)
+        ) as pool:
+            futures = [pool.submit(_compare_pair, i, j) for i, j in pairs]
+            try:
+                for (i, j), future in zip(pairs, futures):
+                    gaps = future.result()
+                    yield (profiles[i].jurisdiction, profiles[j].jurisdiction), gaps + burden.get((i, j), [])
+            finally:
+                # Don't run the remaining comparisons if the caller stops early
+                for future in futures:
+                    future.cancel()
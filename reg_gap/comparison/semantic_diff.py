@@ -7,14 +7,207 @@ Compares clauses across documents and versions to identify:
 - Ambiguous differences
 """
 
+import math
+
 import numpy as np
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Callable
+from typing import Callable, Optional
 
 from ..parsing.clause_extractor import RegulatoryClause, ClauseType
 
 
+def _jaccard(words_a: frozenset[str], words_b: frozenset[str]) -> float:
+    """Calculate the Jaccard similarity of two word sets.
+
+    Args:
+        words_a: First word set.
+        words_b: Second word set.
+
+    Returns:
+        float: Jaccard similarity between 0.0 and 1.0, or 0.0 if either
+            set is empty.
+    """
+    if not words_a or not words_b:
+        return 0.0
+    
+    # The union size follows from the intersection, so only one set is built
+    shared = len(words_a & words_b)
+    return shared / (len(words_a) + len(words_b) - shared)
+
+
+# Keyword similarity scores only the candidate pairs found through an
+# inverted index, rather than every pair, for at least this many pairs at
+# a similarity threshold of at least BLOCKING_MIN_THRESHOLD. Below either,
+# scoring every pair in bulk is faster.
+BLOCKING_MIN_PAIRS = 1_000_000
+BLOCKING_MIN_THRESHOLD = 0.7
+
+# Maximum number of cells in the word incidence blocks of _pairwise_jaccard
+_INCIDENCE_BLOCK_CELLS = 1 << 24
+
+
+def _incidence(word_sets: list[frozenset[str]], vocabulary: dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """List which vocabulary words each word set contains.
+
+    Args:
+        word_sets: Word sets to index.
+        vocabulary: Column index of each word of interest.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (rows, columns) of the nonzero
+            entries of the sets' word incidence matrix, sorted by column.
+    """
+    rows, columns = [], []
+    for row, words in enumerate(word_sets):
+        for word in words:
+            column = vocabulary.get(word)
+            if column is not None:
+                rows.append(row)
+                columns.append(column)
+    
+    rows = np.array(rows, dtype=np.intp)
+    columns = np.array(columns, dtype=np.intp)
+    order = np.argsort(columns, kind='stable')
+    return rows[order], columns[order]
+
+
+def _pairwise_jaccard(words_a: list[frozenset[str]], words_b: list[frozenset[str]]) -> np.ndarray:
+    """Calculate the Jaccard similarity of every pair of word sets.
+
+    Intersection sizes come from products of 0/1 word incidence matrices
+    over the words the two sides share, taken in blocks of words to bound
+    memory. Results equal `_jaccard` on each pair.
+
+    Args:
+        words_a: First list of word sets.
+        words_b: Second list of word sets.
+
+    Returns:
+        np.ndarray: Matrix of shape (len(words_a), len(words_b)).
+    """
+    shared = set().union(*words_a) & set().union(*words_b)
+    vocabulary = {word: column for column, word in enumerate(shared)}
+    rows_a, columns_a = _incidence(words_a, vocabulary)
+    rows_b, columns_b = _incidence(words_b, vocabulary)
+    
+    # Counts stay exact in float32 up to 2**24 shared words
+    intersections = np.zeros((len(words_a), len(words_b)), dtype=np.float32)
+    block = max(1, min(len(vocabulary), _INCIDENCE_BLOCK_CELLS // (len(words_a) + len(words_b))))
+    for start in range(0, len(vocabulary), block):
+        stop = start + block
+        lo_a, hi_a = np.searchsorted(columns_a, (start, stop))
+        lo_b, hi_b = np.searchsorted(columns_b, (start, stop))
+        if lo_a == hi_a or lo_b == hi_b:
+            continue
+        incidence_a = np.zeros((len(words_a), block), dtype=np.float32)
+        incidence_a[rows_a[lo_a:hi_a], columns_a[lo_a:hi_a] - start] = 1.0
+        incidence_b = np.zeros((len(words_b), block), dtype=np.float32)
+        incidence_b[rows_b[lo_b:hi_b], columns_b[lo_b:hi_b] - start] = 1.0
+        intersections += incidence_a @ incidence_b.T
+    
+    shared_counts = intersections.astype(np.float64)
+    sizes_a = np.array([len(words) for words in words_a], dtype=np.float64)
+    sizes_b = np.array([len(words) for words in words_b], dtype=np.float64)
+    unions = sizes_a[:, None] + sizes_b[None, :] - shared_counts
+    
+    # Pairs with an empty set have similarity 0.0, as in _jaccard
+    similarities = np.zeros_like(shared_counts)
+    nonempty = (sizes_a > 0)[:, None] & (sizes_b > 0)[None, :]
+    np.divide(shared_counts, unions, out=similarities, where=nonempty)
+    return similarities
+
+
+def _prefix_filtered_jaccard(
+    words_a: list[frozenset[str]],
+    words_b: list[frozenset[str]],
+    threshold: float
+) -> np.ndarray:
+    """Calculate the Jaccard similarities that can reach a threshold.
+
+    Uses prefix filtering: with every set's words ordered from rarest to
+    most common, two sets whose similarity reaches the threshold must
+    share a word among the first few of each. An inverted index over
+    those prefixes yields the candidate pairs, and only they are scored.
+
+    Args:
+        words_a: First list of word sets.
+        words_b: Second list of word sets.
+        threshold: Similarity threshold, greater than 0.
+
+    Returns:
+        np.ndarray: Matrix of shape (len(words_a), len(words_b)) holding the
+            exact similarity of every pair that reaches the threshold. Other
+            entries may be 0.0.
+    """
+    frequency = Counter()
+    for words in words_a:
+        frequency.update(words)
+    for words in words_b:
+        frequency.update(words)
+    
+    def prefix(words: frozenset[str]) -> list[str]:
+        # Slightly lower the overlap bound so rounding never shortens a prefix
+        length = len(words) - math.ceil(threshold * len(words) - 1e-9) + 1
+        return sorted(words, key=lambda word: (frequency[word], word))[:length]
+    
+    index: dict[str, list[int]] = {}
+    for j, words in enumerate(words_b):
+        for word in prefix(words):
+            index.setdefault(word, []).append(j)
+    
+    similarities = np.zeros((len(words_a), len(words_b)))
+    for i, words in enumerate(words_a):
+        candidates = set()
+        for word in prefix(words):
+            candidates.update(index.get(word, ()))
+        row = similarities[i]
+        for j in candidates:
+            row[j] = _jaccard(words, words_b[j])
+    return similarities
+
+
+class _LRUCache(OrderedDict):
+    """Dictionary that evicts its least recently used entries past a size limit."""
+    
+    def __init__(self, maxsize: int = 128):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep.
+        """
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __reduce__(self):
+        # OrderedDict's reduce recreates the cache with no arguments and
+        # restores attributes only after the entries, so pass the size limit
+        # to the constructor before the entries are inserted
+        return type(self), (self.maxsize,), None, None, iter(self.items())
+    
+    def get(self, key, default=None):
+        """Look up a key, marking it as recently used.
+
+        Args:
+            key: Key to look up.
+            default: Value returned if the key is not cached.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        if key in self:
+            self.move_to_end(key)
+            return self[key]
+        return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class DifferenceType(Enum):
     """Classification of regulatory differences."""
     STRICTER = "stricter"
@@ -25,7 +218,7 @@ class DifferenceType(Enum):
     NOVEL = "novel"  # No equivalent in comparison
 
 
-@dataclass
+@dataclass(slots=True)
 class ClauseDifference:
     """Represents a difference between two clauses."""
     
@@ -90,7 +283,9 @@ class SemanticDiff:
     def __init__(
         self,
         embedding_model: Optional[Callable[[str], np.ndarray]] = None,
-        similarity_threshold: float = 0.7
+        similarity_threshold: float = 0.7,
+        cache_size: int = 50_000,
+        optimal_matching: bool = False
     ):
         """
         Initialize SemanticDiff.
@@ -99,10 +294,27 @@ class SemanticDiff:
             embedding_model: Optional function to generate embeddings.
                             If None, uses simple keyword-based comparison.
             similarity_threshold: Minimum similarity to consider clauses related
+            cache_size: Maximum number of clause texts whose embeddings and
+                prepared features are kept; the least recently used are
+                evicted first
+            optimal_matching: Whether to pair clauses so that their total
+                similarity is maximal, rather than greedily in order.
+                Requires SciPy; without it, greedy matching is used
         """
         self.embedding_model = embedding_model
         self.similarity_threshold = similarity_threshold
-        self._embeddings_cache: dict[str, np.ndarray] = {}
+        self.cache_size = cache_size
+        self.optimal_matching = optimal_matching
+        self._embeddings_cache: _LRUCache = _LRUCache(cache_size)
+        
+        # Each distinct indicator phrase with the categories it counts toward
+        # (stricter, looser, ambiguous), so a text is searched once per phrase
+        categories = (self.STRICTER_INDICATORS, self.LOOSER_INDICATORS, self.AMBIGUITY_INDICATORS)
+        self._indicator_table = tuple(
+            (phrase, tuple(int(phrase in indicators) for indicators in categories))
+            for phrase in sorted(set().union(*categories))
+        )
+        self._prep_cache: _LRUCache = _LRUCache(cache_size)
     
     def compare_clauses(
         self,
@@ -123,27 +335,77 @@ class SemanticDiff:
         Returns:
             List of ClauseDifference objects
         """
+        return self.compare_prepared(
+            clauses_a,
+            clauses_b,
+            self.clause_features(clauses_a),
+            self.clause_features(clauses_b),
+            jurisdiction_a,
+            jurisdiction_b
+        )
+    
+    def clause_features(
+        self,
+        clauses: list[RegulatoryClause]
+    ) -> np.ndarray | list[frozenset[str]]:
+        """Compute the similarity features of a set of clauses.
+
+        Computing them once lets a clause set that takes part in many
+        comparisons be embedded or tokenized only once (see
+        `compare_prepared`).
+
+        Args:
+            clauses: Clauses to prepare.
+
+        Returns:
+            np.ndarray | list[frozenset[str]]: With an embedding model, a
+                float32 matrix with one normalized embedding per clause;
+                otherwise each clause's set of lowercase words.
+        """
+        texts = [c.text for c in clauses]
+        if self.embedding_model:
+            if not texts:
+                return np.zeros((0, 0), dtype=np.float32)
+            return self._embed_batch(texts)
+        return [self._prep(text)[0] for text in texts]
+    
+    def compare_prepared(
+        self,
+        clauses_a: list[RegulatoryClause],
+        clauses_b: list[RegulatoryClause],
+        features_a: np.ndarray | list[frozenset[str]],
+        features_b: np.ndarray | list[frozenset[str]],
+        jurisdiction_a: str = "Source",
+        jurisdiction_b: str = "Target"
+    ) -> list[ClauseDifference]:
+        """Compare two sets of regulatory clauses with precomputed features.
+
+        Same as `compare_clauses`, but takes each set's similarity features
+        from `clause_features` instead of computing them.
+
+        Args:
+            clauses_a: Clauses from first document/jurisdiction.
+            clauses_b: Clauses from second document/jurisdiction.
+            features_a: `clause_features(clauses_a)`.
+            features_b: `clause_features(clauses_b)`.
+            jurisdiction_a: Label for first set.
+            jurisdiction_b: Label for second set.
+
+        Returns:
+            list[ClauseDifference]: The differences, as from
+                `compare_clauses`.
+        """
         differences = []
-        matched_b = set()
+        similarities = self._similarity_matrix(features_a, features_b)
+        matches = self._match(similarities)
+        matched_b = np.zeros(len(clauses_b), dtype=bool)
         
-        for clause_a in clauses_a:
-            best_match = None
-            best_similarity = 0.0
-            
-            for i, clause_b in enumerate(clauses_b):
-                if i in matched_b:
-                    continue
-                
-                similarity = self._calculate_similarity(clause_a.text, clause_b.text)
-                
-                if similarity > best_similarity and similarity >= self.similarity_threshold:
-                    best_match = clause_b
-                    best_similarity = similarity
-                    best_match_idx = i
-            
-            if best_match:
-                matched_b.add(best_match_idx)
-                diff = self._analyze_difference(clause_a, best_match, best_similarity)
+        for i, (clause_a, best_match_idx) in enumerate(zip(clauses_a, matches.tolist())):
+            if best_match_idx >= 0:
+                matched_b[best_match_idx] = True
+                diff = self._analyze_difference(
+                    clause_a, clauses_b[best_match_idx], float(similarities[i, best_match_idx])
+                )
             else:
                 diff = ClauseDifference(
                     clause_a=clause_a,
@@ -159,7 +421,7 @@ class SemanticDiff:
         
         # Find clauses in B with no match in A
         for i, clause_b in enumerate(clauses_b):
-            if i not in matched_b:
+            if not matched_b[i]:
                 diff = ClauseDifference(
                     clause_a=clause_b,  # Note: using clause_a field for consistency
                     clause_b=None,
@@ -173,6 +435,110 @@ class SemanticDiff:
         
         return differences
     
+    def _match(self, similarities: np.ndarray) -> np.ndarray:
+        """Pair clauses one-to-one from their similarity matrix.
+
+        Only pairs with a positive similarity of at least the threshold can
+        be matched. By default each row in turn takes its most similar
+        unmatched column (the first one on ties). With `optimal_matching`
+        and SciPy installed, the pairing maximizes the total similarity
+        instead.
+
+        Args:
+            similarities: Matrix of shape (N, M) from `_similarity_matrix`.
+
+        Returns:
+            np.ndarray: For each row, the index of its matched column, or -1
+                if the row is unmatched.
+        """
+        if self.optimal_matching and similarities.size:
+            try:
+                from scipy.optimize import linear_sum_assignment
+            except ImportError:
+                pass
+            else:
+                allowed = (similarities > 0.0) & (similarities >= self.similarity_threshold)
+                rows, cols = linear_sum_assignment(np.where(allowed, similarities, 0.0), maximize=True)
+                keep = allowed[rows, cols]
+                matches = np.full(len(similarities), -1, dtype=np.intp)
+                matches[rows[keep]] = cols[keep]
+                return matches
+        
+        return self._greedy_match(similarities)
+    
+    def _greedy_match(self, similarities: np.ndarray) -> np.ndarray:
+        """Match each row to its most similar unmatched column, in row order.
+
+        Args:
+            similarities: Matrix of shape (N, M) from `_similarity_matrix`.
+
+        Returns:
+            np.ndarray: For each row, the index of its matched column, or -1
+                if the row is unmatched.
+        """
+        num_rows, num_cols = similarities.shape
+        matches = np.full(num_rows, -1, dtype=np.intp)
+        if not num_cols:
+            return matches
+        
+        matched = np.zeros(num_cols, dtype=bool)
+        for i in range(num_rows):
+            # Pick the first best unmatched column, as a linear scan would
+            row = np.where(matched, -np.inf, similarities[i])
+            best = int(np.argmax(row))
+            if row[best] > 0.0 and row[best] >= self.similarity_threshold:
+                matched[best] = True
+                matches[i] = best
+        
+        return matches
+    
+    def _similarity_matrix(
+        self,
+        features_a: np.ndarray | list[frozenset[str]],
+        features_b: np.ndarray | list[frozenset[str]]
+    ) -> np.ndarray:
+        """Calculate the similarity of every pair of clauses.
+
+        With an embedding model, the cosine similarities come from a single
+        product of the embedding matrices. Otherwise pairs get the
+        keyword-based Jaccard similarity: for large inputs only pairs that
+        may reach the similarity threshold are scored, and the rest are
+        left at 0.0.
+
+        Args:
+            features_a: First clause set's features, from `clause_features`.
+            features_b: Second clause set's features, from `clause_features`.
+
+        Returns:
+            np.ndarray: Matrix of shape (len(features_a), len(features_b))
+                whose entry [i, j] is the similarity of clauses i and j, or
+                0.0 for keyword pairs skipped as unable to match.
+        """
+        if not len(features_a) or not len(features_b):
+            return np.zeros((len(features_a), len(features_b)))
+        
+        if self.embedding_model:
+            return features_a @ features_b.T
+        
+        if (
+            self.similarity_threshold >= BLOCKING_MIN_THRESHOLD
+            and len(features_a) * len(features_b) >= BLOCKING_MIN_PAIRS
+        ):
+            return _prefix_filtered_jaccard(features_a, features_b, self.similarity_threshold)
+        return _pairwise_jaccard(features_a, features_b)
+    
+    def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed several texts as the rows of one matrix.
+
+        Args:
+            texts: Non-empty list of texts to embed.
+
+        Returns:
+            np.ndarray: float32 matrix with one normalized embedding per
+                text, as returned by `_get_embedding`.
+        """
+        return np.stack([self._get_embedding(text) for text in texts])
+    
     def _calculate_similarity(self, text_a: str, text_b: str) -> float:
         """Calculate semantic similarity between two texts.
 
@@ -203,33 +569,32 @@ class SemanticDiff:
         Returns:
             float: Cosine similarity score between 0.0 and 1.0.
         """
-        emb_a = self._get_embedding(text_a)
-        emb_b = self._get_embedding(text_b)
-        
-        # Cosine similarity
-        dot_product = np.dot(emb_a, emb_b)
-        norm_a = np.linalg.norm(emb_a)
-        norm_b = np.linalg.norm(emb_b)
-        
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        
-        return float(dot_product / (norm_a * norm_b))
+        # Cached embeddings are unit length (or zero), so the dot product
+        # is the cosine similarity
+        return float(self._get_embedding(text_a) @ self._get_embedding(text_b))
     
     def _get_embedding(self, text: str) -> np.ndarray:
         """Get or compute embedding for text.
 
-        Caches embeddings to avoid redundant computation.
+        Embeddings are stored as L2-normalized float32 vectors, so cosine
+        similarity needs no norms at comparison time, and cached to avoid
+        redundant computation.
 
         Args:
             text: The text to embed.
 
         Returns:
-            np.ndarray: The embedding vector for the text.
+            np.ndarray: The unit-length float32 embedding vector for the
+                text, or a zero vector if the model returned one.
         """
-        if text not in self._embeddings_cache:
-            self._embeddings_cache[text] = self.embedding_model(text)
-        return self._embeddings_cache[text]
+        embedding = self._embeddings_cache.get(text)
+        if embedding is None:
+            embedding = np.array(self.embedding_model(text), dtype=np.float32)
+            norm = np.linalg.norm(embedding)
+            if norm > 0:
+                embedding /= norm
+            self._embeddings_cache[text] = embedding
+        return embedding
     
     def _keyword_similarity(self, text_a: str, text_b: str) -> float:
         """Simple keyword-based similarity when embeddings unavailable.
@@ -243,17 +608,36 @@ class SemanticDiff:
         Returns:
             float: Jaccard similarity score between 0.0 and 1.0.
         """
-        words_a = set(text_a.lower().split())
-        words_b = set(text_b.lower().split())
-        
-        if not words_a or not words_b:
-            return 0.0
-        
-        intersection = words_a & words_b
-        union = words_a | words_b
-        
-        # Jaccard similarity
-        return len(intersection) / len(union)
+        return _jaccard(self._prep(text_a)[0], self._prep(text_b)[0])
+    
+    def _prep(self, text: str) -> tuple[frozenset[str], tuple[int, int, int]]:
+        """Get or compute the lowercase-derived features of a clause text.
+
+        The text is lowercased once and both features are cached, since
+        the same clause is compared and analyzed against many others.
+
+        Args:
+            text: Clause text to examine.
+
+        Returns:
+            tuple: (word_set, indicator_counts), where word_set is the set of
+                lowercase words and indicator_counts holds the numbers of
+                distinct stricter, looser, and ambiguity indicators found.
+        """
+        prepared = self._prep_cache.get(text)
+        if prepared is None:
+            lowered = text.lower()
+            stricter = looser = ambiguous = 0
+            for phrase, (is_stricter, is_looser, is_ambiguous) in self._indicator_table:
+                if phrase in lowered:
+                    stricter += is_stricter
+                    looser += is_looser
+                    ambiguous += is_ambiguous
+            prepared = self._prep_cache[text] = (
+                frozenset(lowered.split()),
+                (stricter, looser, ambiguous)
+            )
+        return prepared
     
     def _analyze_difference(
         self,
@@ -275,16 +659,9 @@ class SemanticDiff:
             ClauseDifference: Analysis result including difference type,
                 confidence, risk factors, and whether legal review is required.
         """
-        text_a = clause_a.text.lower()
-        text_b = clause_b.text.lower()
-        
         # Count indicators
-        stricter_a = sum(1 for ind in self.STRICTER_INDICATORS if ind in text_a)
-        stricter_b = sum(1 for ind in self.STRICTER_INDICATORS if ind in text_b)
-        looser_a = sum(1 for ind in self.LOOSER_INDICATORS if ind in text_a)
-        looser_b = sum(1 for ind in self.LOOSER_INDICATORS if ind in text_b)
-        ambiguous_a = sum(1 for ind in self.AMBIGUITY_INDICATORS if ind in text_a)
-        ambiguous_b = sum(1 for ind in self.AMBIGUITY_INDICATORS if ind in text_b)
+        stricter_a, looser_a, ambiguous_a = self._prep(clause_a.text)[1]
+        stricter_b, looser_b, ambiguous_b = self._prep(clause_b.text)[1]
         
         # Determine difference type
         risk_factors = []
@@ -308,7 +685,7 @@ class SemanticDiff:
             analysis = "Significant ambiguity in clause language"
             confidence = 0.5
             risk_factors.append("ambiguous_language")
-        elif clause_a.clause_type != clause_b.clause_type:
+        elif clause_a.clause_type is not clause_b.clause_type:
             diff_type = DifferenceType.CONFLICTING
             analysis = f"Clause type mismatch: {clause_a.clause_type.value} vs {clause_b.clause_type.value}"
             confidence = 0.8
@@ -349,7 +726,7 @@ class SemanticDiff:
             list[ClauseDifference]: Differences where the first clause is
                 stricter than the second.
         """
-        return [d for d in differences if d.difference_type == DifferenceType.STRICTER]
+        return [d for d in differences if d.difference_type is DifferenceType.STRICTER]
     
     def find_looser_clauses(
         self,
@@ -364,7 +741,7 @@ class SemanticDiff:
             list[ClauseDifference]: Differences where the first clause is
                 looser than the second.
         """
-        return [d for d in differences if d.difference_type == DifferenceType.LOOSER]
+        return [d for d in differences if d.difference_type is DifferenceType.LOOSER]
     
     def get_review_required(
         self,
@@ -1,14 +1,32 @@
 """Ingestion module for loading and normalizing regulatory documents."""
 
-from .loaders import DocumentLoader, PDFLoader, HTMLLoader, DOCXLoader, TextLoader, UniversalLoader
-from .normalizer import TextNormalizer
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .loaders import DocumentLoader, PDFLoader, HTMLLoader, DOCXLoader, TextLoader, UniversalLoader
+    from .normalizer import TextNormalizer
 
 __all__ = [
-    "DocumentLoader", 
-    "PDFLoader", 
-    "HTMLLoader", 
-    "DOCXLoader", 
+    "DocumentLoader",
+    "PDFLoader",
+    "HTMLLoader",
+    "DOCXLoader",
     "TextLoader",
     "UniversalLoader",
-    "TextNormalizer"
+    "TextNormalizer",
 ]
+
+# Public names are imported from their submodules on first access (PEP 562)
+_EXPORTS = {
+    "DocumentLoader": ".loaders",
+    "PDFLoader": ".loaders",
+    "HTMLLoader": ".loaders",
+    "DOCXLoader": ".loaders",
+    "TextLoader": ".loaders",
+    "UniversalLoader": ".loaders",
+    "TextNormalizer": ".normalizer",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
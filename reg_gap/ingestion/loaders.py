@@ -2,16 +2,34 @@
 Document loaders for PDF, HTML, and DOCX regulatory texts.
 """
 
+import hashlib
+import importlib.util
+import mmap
 import os
+import pickle
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import re
 
 
-@dataclass
+# Text files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1 << 20
+
+# Markup removed by the fallback HTML stripper
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Elements whose text is dropped from loaded HTML
+_HTML_SKIP_TAGS = ('script', 'style', 'nav', 'footer', 'header')
+
+
+@dataclass(slots=True)
 class RegulatoryDocument:
     """Represents a loaded regulatory document."""
     
@@ -31,6 +49,12 @@ class RegulatoryDocument:
 class DocumentLoader(ABC):
     """Abstract base class for document loaders."""
     
+    # Lowercase file extensions this loader handles
+    extensions: tuple[str, ...] = ()
+    
+    # Whether UniversalLoader may keep this loader's output in its disk cache
+    cacheable: bool = True
+    
     @abstractmethod
     def load(self, path: str, jurisdiction: str, **kwargs) -> RegulatoryDocument:
         """Load a document from the given path."""
@@ -45,6 +69,8 @@ class DocumentLoader(ABC):
 class PDFLoader(DocumentLoader):
     """Loader for PDF regulatory documents."""
     
+    extensions = ('.pdf',)
+    
     def supports(self, path: str) -> bool:
         """Check if this loader supports the given file path.
 
@@ -54,7 +80,7 @@ class PDFLoader(DocumentLoader):
         Returns:
             True if the file is a PDF, False otherwise.
         """
-        return path.lower().endswith('.pdf')
+        return path.lower().endswith(self.extensions)
     
     def load(self, path: str, jurisdiction: str, **kwargs) -> RegulatoryDocument:
         """
@@ -71,21 +97,16 @@ class PDFLoader(DocumentLoader):
         if not os.path.exists(path):
             raise FileNotFoundError(f"PDF file not found: {path}")
         
-        try:
-            import pypdf
-            
-            text_parts = []
-            with open(path, 'rb') as f:
-                reader = pypdf.PdfReader(f)
-                for page in reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-            
-            content = "\n\n".join(text_parts)
-            
-        except ImportError:
-            # Fallback: return placeholder for testing without pypdf
+        # Fastest available extractor first
+        for extract in (self._extract_pymupdf, self._extract_pdfplumber, self._extract_pypdf):
+            try:
+                text_parts = extract(path)
+            except ImportError:
+                continue
+            content = "\n\n".join(part for part in text_parts if part)
+            break
+        else:
+            # Fallback: return placeholder for testing without a PDF library
             content = self._fallback_load(path)
         
         return RegulatoryDocument(
@@ -98,8 +119,60 @@ class PDFLoader(DocumentLoader):
             metadata=kwargs.get("metadata", {})
         )
     
+    def _extract_pymupdf(self, path: str) -> list[str]:
+        """Extract page texts with PyMuPDF.
+
+        Args:
+            path: Path to the PDF file.
+
+        Returns:
+            List of page texts, in page order.
+
+        Raises:
+            ImportError: If PyMuPDF is not installed.
+        """
+        import fitz
+        
+        with fitz.open(path) as doc:
+            return [page.get_text("text") for page in doc]
+    
+    def _extract_pdfplumber(self, path: str) -> list[str]:
+        """Extract page texts with pdfplumber.
+
+        Args:
+            path: Path to the PDF file.
+
+        Returns:
+            List of page texts, in page order.
+
+        Raises:
+            ImportError: If pdfplumber is not installed.
+        """
+        import pdfplumber
+        
+        with pdfplumber.open(path) as pdf:
+            return [page.extract_text() for page in pdf.pages]
+    
+    def _extract_pypdf(self, path: str) -> list[str]:
+        """Extract page texts with pypdf.
+
+        Args:
+            path: Path to the PDF file.
+
+        Returns:
+            List of page texts, in page order.
+
+        Raises:
+            ImportError: If pypdf is not installed.
+        """
+        import pypdf
+        
+        with open(path, 'rb') as f:
+            reader = pypdf.PdfReader(f)
+            return [page.extract_text() for page in reader.pages]
+    
     def _fallback_load(self, path: str) -> str:
-        """Fallback when pypdf is not available.
+        """Fallback when no PDF library is available.
 
         Args:
             path: Path to the PDF file.
@@ -113,6 +186,8 @@ class PDFLoader(DocumentLoader):
 class HTMLLoader(DocumentLoader):
     """Loader for HTML regulatory documents."""
     
+    extensions = ('.html', '.htm')
+    
     def supports(self, path: str) -> bool:
         """Check if this loader supports the given file path.
 
@@ -122,7 +197,7 @@ class HTMLLoader(DocumentLoader):
         Returns:
             True if the file is an HTML file, False otherwise.
         """
-        return path.lower().endswith(('.html', '.htm'))
+        return path.lower().endswith(self.extensions)
     
     def load(self, path: str, jurisdiction: str, **kwargs) -> RegulatoryDocument:
         """
@@ -139,23 +214,13 @@ class HTMLLoader(DocumentLoader):
         if not os.path.exists(path):
             raise FileNotFoundError(f"HTML file not found: {path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        try:
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-                element.decompose()
-            
-            content = soup.get_text(separator='\n', strip=True)
-            
-        except ImportError:
-            # Fallback: basic HTML tag stripping
-            content = self._strip_html_tags(html_content)
+        # lxml parses the raw (possibly memory-mapped) bytes; only the
+        # fallbacks need the document as a str
+        with _read_bytes(path) as html_bytes:
+            try:
+                content = self._extract_lxml(html_bytes)
+            except ImportError:
+                content = self._extract_soup(_decode_text(html_bytes))
         
         return RegulatoryDocument(
             content=content,
@@ -167,6 +232,73 @@ class HTMLLoader(DocumentLoader):
             metadata=kwargs.get("metadata", {})
         )
     
+    _lxml_parser = None
+    
+    @classmethod
+    def _extract_lxml(cls, html_bytes: bytes | mmap.mmap) -> str:
+        """Extract text by walking an lxml.html tree directly.
+
+        The parser is created once and reused for every document. It reads
+        the UTF-8 bytes directly, so no intermediate str is built; invalid
+        byte sequences become U+FFFD.
+
+        Args:
+            html_bytes: Raw HTML bytes or a memory map of the file.
+
+        Returns:
+            Text of each node, stripped, one per line.
+
+        Raises:
+            ImportError: If lxml is not installed.
+        """
+        from lxml import etree, html as lxml_html
+        
+        if cls._lxml_parser is None:
+            cls._lxml_parser = lxml_html.HTMLParser(huge_tree=True, encoding='utf-8')
+        
+        try:
+            root = lxml_html.document_fromstring(html_bytes, cls._lxml_parser)
+        except etree.ParserError:
+            # Raised for documents with no content at all
+            return ""
+        
+        # Clear rather than drop so the text following each element stays
+        # a separate string, as it is in BeautifulSoup
+        for element in list(root.iter(*_HTML_SKIP_TAGS)):
+            element.clear(keep_tail=True)
+        for node in root.iter(etree.Comment, etree.ProcessingInstruction):
+            node.text = ""
+        
+        stripped = (text.strip() for text in root.itertext())
+        return '\n'.join(text for text in stripped if text)
+    
+    def _extract_soup(self, html_content: str) -> str:
+        """Extract text with BeautifulSoup, or the regex fallback.
+
+        Args:
+            html_content: Raw HTML string.
+
+        Returns:
+            Extracted text.
+        """
+        try:
+            from bs4 import BeautifulSoup, FeatureNotFound
+        except ImportError:
+            # Fallback: basic HTML tag stripping
+            return self._strip_html_tags(html_content)
+        
+        # Prefer the C-based lxml parser when it is installed
+        try:
+            soup = BeautifulSoup(html_content, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # Remove script and style elements
+        for element in soup.find_all(list(_HTML_SKIP_TAGS)):
+            element.decompose()
+        
+        return soup.get_text(separator='\n', strip=True)
+    
     def _strip_html_tags(self, html: str) -> str:
         """Basic HTML tag stripping without BeautifulSoup.
 
@@ -176,16 +308,18 @@ class HTMLLoader(DocumentLoader):
         Returns:
             Plain text with HTML tags, scripts, and styles removed.
         """
-        clean = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        clean = re.sub(r'<style[^>]*>.*?</style>', '', clean, flags=re.DOTALL | re.IGNORECASE)
-        clean = re.sub(r'<[^>]+>', ' ', clean)
-        clean = re.sub(r'\s+', ' ', clean)
-        return clean.strip()
+        clean = _SCRIPT_RE.sub('', html)
+        clean = _STYLE_RE.sub('', clean)
+        clean = _TAG_RE.sub(' ', clean)
+        # Collapse whitespace runs and strip the ends in one step
+        return ' '.join(clean.split())
 
 
 class DOCXLoader(DocumentLoader):
     """Loader for DOCX regulatory documents."""
     
+    extensions = ('.docx',)
+    
     def supports(self, path: str) -> bool:
         """Check if this loader supports the given file path.
 
@@ -195,7 +329,7 @@ class DOCXLoader(DocumentLoader):
         Returns:
             True if the file is a DOCX file, False otherwise.
         """
-        return path.lower().endswith('.docx')
+        return path.lower().endswith(self.extensions)
     
     def load(self, path: str, jurisdiction: str, **kwargs) -> RegulatoryDocument:
         """
@@ -247,6 +381,11 @@ class DOCXLoader(DocumentLoader):
 class TextLoader(DocumentLoader):
     """Loader for plain text regulatory documents."""
     
+    extensions = ('.txt',)
+    
+    # Rereading plain text is as fast as unpickling it
+    cacheable = False
+    
     def supports(self, path: str) -> bool:
         """Check if this loader supports the given file path.
 
@@ -256,7 +395,7 @@ class TextLoader(DocumentLoader):
         Returns:
             True if the file is a plain text file, False otherwise.
         """
-        return path.lower().endswith('.txt')
+        return path.lower().endswith(self.extensions)
     
     def load(self, path: str, jurisdiction: str, **kwargs) -> RegulatoryDocument:
         """Load a plain text document.
@@ -275,8 +414,7 @@ class TextLoader(DocumentLoader):
         if not os.path.exists(path):
             raise FileNotFoundError(f"Text file not found: {path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_text(path)
         
         return RegulatoryDocument(
             content=content,
@@ -289,17 +427,106 @@ class TextLoader(DocumentLoader):
         )
 
 
+def _read_text(path: str) -> str:
+    """Read a UTF-8 text file.
+
+    Files of at least MMAP_THRESHOLD bytes are decoded straight from a
+    memory map instead of being read into an intermediate bytes buffer
+    first. Newlines are translated the same way as text-mode reads.
+
+    Args:
+        path: Path to the text file.
+
+    Returns:
+        The decoded file content.
+    """
+    if os.path.getsize(path) < MMAP_THRESHOLD:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    with _read_bytes(path) as data:
+        return _decode_text(data)
+
+
+@contextmanager
+def _read_bytes(path: str) -> Iterator[bytes | mmap.mmap]:
+    """Provide the raw bytes of a file.
+
+    Files of at least MMAP_THRESHOLD bytes are memory-mapped rather than
+    read; the map is only valid inside the ``with`` block.
+
+    Args:
+        path: Path to the file.
+
+    Yields:
+        The file content as bytes, or a read-only memory map of it.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _decode_text(data: bytes | mmap.mmap) -> str:
+    """Decode UTF-8 bytes, translating newlines as text-mode reads do.
+
+    Args:
+        data: Raw file content.
+
+    Returns:
+        The decoded text.
+    """
+    content = str(data, 'utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _extension(path: str) -> str:
+    """Return the lowercase extension of a path, including the dot.
+
+    Unlike ``os.path.splitext``, a leading dot counts, so ``.txt`` has the
+    extension ``.txt`` just as ``supports`` would treat it.
+
+    Args:
+        path: File path or name.
+
+    Returns:
+        str: The extension, or an empty string if the name has no dot.
+    """
+    dot = path.rfind('.')
+    if dot < 0 or '/' in path[dot:] or os.sep in path[dot:]:
+        return ''
+    return path[dot:].lower()
+
+
 class UniversalLoader:
     """Universal loader that selects appropriate loader based on file type."""
     
-    def __init__(self):
-        """Initialize the UniversalLoader with all available document loaders."""
+    def __init__(self, use_cache: bool = True):
+        """Initialize the UniversalLoader with all available document loaders.
+
+        Args:
+            use_cache: Whether to keep extracted documents in an on-disk cache
+                under ``$XDG_CACHE_HOME/reg_gap/documents`` (default
+                ``~/.cache``), so unchanged files are not parsed again.
+        """
+        self.use_cache = use_cache
         self.loaders = [
             PDFLoader(),
             HTMLLoader(),
             DOCXLoader(),
             TextLoader(),
         ]
+        
+        # Dispatch by extension; the first loader listed for one wins
+        self._by_extension = {
+            extension: loader
+            for loader in reversed(self.loaders)
+            for extension in loader.extensions
+        }
     
     def load(self, path: str, jurisdiction: str, **kwargs) -> RegulatoryDocument:
         """Load a document using the appropriate loader.
@@ -315,35 +542,200 @@ class UniversalLoader:
         Raises:
             ValueError: If no loader supports the given file type.
         """
-        for loader in self.loaders:
-            if loader.supports(path):
-                return loader.load(path, jurisdiction, **kwargs)
+        loader = self._by_extension.get(_extension(path))
+        if loader is None:
+            raise ValueError(f"Unsupported file type: {path}")
+        
+        if not (self.use_cache and loader.cacheable):
+            return loader.load(path, jurisdiction, **kwargs)
+        
+        try:
+            cache_path = _document_cache_path(path, os.stat(path))
+        except OSError:
+            # Let the loader report the missing or unreadable file
+            return loader.load(path, jurisdiction, **kwargs)
         
-        raise ValueError(f"Unsupported file type: {path}")
+        doc = _read_cached_document(cache_path)
+        if doc is None:
+            doc = loader.load(path, jurisdiction, **kwargs)
+            _write_cached_document(cache_path, doc)
+            return doc
+        
+        # The cache holds the extracted content; the rest comes from this call
+        return replace(
+            doc,
+            source_path=path,
+            jurisdiction=jurisdiction,
+            version=kwargs.get("version", "1.0"),
+            effective_date=kwargs.get("effective_date"),
+            metadata=kwargs.get("metadata", {})
+        )
     
-    def load_directory(self, directory: str, jurisdiction: str, **kwargs) -> list[RegulatoryDocument]:
+    def load_directory(
+        self,
+        directory: str,
+        jurisdiction: str,
+        num_workers: int = 1,
+        **kwargs
+    ) -> list[RegulatoryDocument]:
         """Load all supported documents from a directory.
 
         Args:
             directory: Path to the directory to scan.
             jurisdiction: Regulatory jurisdiction to assign to all documents.
+            num_workers: Number of worker processes; 1 loads in-process.
             **kwargs: Additional metadata passed to each loader.
 
         Returns:
             List of RegulatoryDocument objects for all successfully loaded files.
         """
-        documents = []
-        path = Path(directory)
+        return list(self.iter_directory(directory, jurisdiction, num_workers, **kwargs))
+    
+    def iter_directory(
+        self,
+        directory: str,
+        jurisdiction: str,
+        num_workers: int = 1,
+        **kwargs
+    ) -> Iterator[RegulatoryDocument]:
+        """Load supported documents from a directory, yielding each as it is ready.
+
+        Lets callers process or discard each document without holding the
+        whole directory in memory. Files are parsed independently, so with
+        more than one worker they are loaded in a process pool.
+
+        Args:
+            directory: Path to the directory to scan.
+            jurisdiction: Regulatory jurisdiction to assign to all documents.
+            num_workers: Number of worker processes; 1 loads in-process.
+            **kwargs: Additional metadata passed to each loader.
+
+        Yields:
+            RegulatoryDocument for each successfully loaded file, in the same
+            order as `load_directory`.
+        """
+        tasks = [
+            str(file_path)
+            for file_path in Path(directory).rglob("*")
+            if _extension(file_path.name) in self._by_extension and file_path.is_file()
+        ]
+        
+        if num_workers <= 1 or len(tasks) <= 1:
+            for file_path in tasks:
+                try:
+                    yield self.load(file_path, jurisdiction, **kwargs)
+                except Exception as e:
+                    print(f"Warning: Failed to load {file_path}: {e}")
+            return
         
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                for loader in self.loaders:
-                    if loader.supports(str(file_path)):
-                        try:
-                            doc = loader.load(str(file_path), jurisdiction, **kwargs)
-                            documents.append(doc)
-                        except Exception as e:
-                            print(f"Warning: Failed to load {file_path}: {e}")
-                        break
+        from concurrent.futures import ProcessPoolExecutor
         
-        return documents
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(tasks))) as pool:
+            futures = [
+                pool.submit(_load_one, self, file_path, jurisdiction, kwargs)
+                for file_path in tasks
+            ]
+            try:
+                for file_path, future in zip(tasks, futures):
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        print(f"Warning: Failed to load {file_path}: {e}")
+            finally:
+                # Don't load the remaining files if the caller stops early
+                for future in futures:
+                    future.cancel()
+
+
+def _load_one(
+    loader: UniversalLoader,
+    path: str,
+    jurisdiction: str,
+    kwargs: dict
+) -> RegulatoryDocument:
+    """Load one document in a worker process.
+
+    Args:
+        loader: Loader to load the file with.
+        path: Path to the document file.
+        jurisdiction: Regulatory jurisdiction to assign to the document.
+        kwargs: Additional metadata passed to the loader.
+
+    Returns:
+        The loaded RegulatoryDocument.
+    """
+    return loader.load(path, jurisdiction, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _parser_fingerprint() -> str:
+    """Describe the package version and the optional parsers installed.
+
+    Extracted text depends on which parser libraries are available, so
+    this is part of every document cache key.
+
+    Returns:
+        str: Package version followed by the importable parser modules.
+    """
+    from .. import __version__
+    
+    parsers = ('fitz', 'pdfplumber', 'pypdf', 'bs4', 'lxml', 'docx')
+    available = [name for name in parsers if importlib.util.find_spec(name) is not None]
+    return ','.join([__version__, *available])
+
+
+def _document_cache_path(path: str, stat: os.stat_result) -> Path:
+    """Locate the cache entry for the document at `path`.
+
+    Entries are keyed by the absolute path, modification time, and size of
+    the file, so an edited or replaced file is parsed again.
+
+    Args:
+        path: Path to the document file.
+        stat: Result of ``os.stat(path)``.
+
+    Returns:
+        Path: Location of the cache file (which may not exist yet).
+    """
+    digest = hashlib.blake2b(os.path.abspath(path).encode('utf-8'), digest_size=16)
+    digest.update(_parser_fingerprint().encode('utf-8'))
+    
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    name = f"{digest.hexdigest()}-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+    return Path(cache_root, "reg_gap", "documents", name)
+
+
+def _read_cached_document(path: Path) -> Optional[RegulatoryDocument]:
+    """Load a cached document, or None if missing or unreadable."""
+    try:
+        with open(path, "rb") as fp:
+            doc = pickle.load(fp)
+    except Exception:
+        # A damaged entry can fail anywhere in the unpickler or in a
+        # reconstructed object, so any error is a cache miss
+        return None
+    return doc if isinstance(doc, RegulatoryDocument) else None
+
+
+def _write_cached_document(path: Path, doc: RegulatoryDocument) -> None:
+    """Store a loaded document in the cache, ignoring filesystem errors.
+
+    Entries for earlier versions of the same file (same path hash, other
+    modification time or size) are deleted, since they can no longer hit.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(doc, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+    
+    path_hash = path.name.split("-", 1)[0]
+    for stale in path.parent.glob(f"{path_hash}-*.pkl"):
+        if stale != path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
@@ -2,10 +2,332 @@
 Text normalization for regulatory documents.
 """
 
+import itertools
 import re
 import unicodedata
+from collections.abc import Mapping, Sequence as SequenceABC
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+
+# Horizontal whitespace that is not already a single space, and runs of
+# three or more newlines (spelled out so the engine can search for the
+# literal prefix)
+_SPACE_RUN_RE = re.compile(r'[^\S\n]{2,}|[^\S\n ]')
+_NEWLINE_RUN_RE = re.compile(r'\n\n\n+')
+
+# ASCII horizontal whitespace mapped to a space, and runs of spaces
+_ASCII_SPACE_TABLE = str.maketrans(dict.fromkeys('\t\x0b\x0c\r\x1c\x1d\x1e\x1f', ' '))
+_SPACES_RE = re.compile(r'  +')
+
+# Sentence-ending punctuation, counted once per run
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+# Characters of text counted at a time by _count_words_and_sentences
+_COUNT_CHUNK_SIZE = 1 << 20
+
+# Characters of a section's content shown in its preview
+_PREVIEW_LENGTH = 500
+
+# Raw characters iter_normalize buffers before normalizing up to the last
+# paragraph break
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Citation references dropped when remove_citations is set
+_REFERENCE_RES = (re.compile(r'\[\d+\]'), re.compile(r'\(\d{4}\)'))
+
+# Definition phrasings recognized by extract_definitions
+_DEFINITION_RES = tuple(
+    re.compile(p, re.IGNORECASE) for p in (
+        r'"([^"]+)"\s+(?:means|shall mean|refers to|is defined as)',
+        r'"([^"]+)"\s+has the meaning',
+        r'(?:the term|The term)\s+"([^"]+)"',
+    )
+)
+
+# Matches wherever any of _DEFINITION_RES does, with the shared quoted-term
+# prefix factored out so it is tried once per position
+_DEFINITION_FINDER = re.compile(
+    r'"[^"]+"\s+(?:means|shall mean|refers to|is defined as|has the meaning)'
+    r'|the term\s+"[^"]+"',
+    re.IGNORECASE
+)
+
+
+def _count_words_and_sentences(text: str) -> tuple[int, int]:
+    """Count the words and sentence endings in text.
+
+    Counts a chunk at a time, so the word and punctuation lists built along
+    the way stay small however long the text is. Chunks end at whitespace,
+    so no word or run of sentence-ending punctuation is split between two.
+
+    Args:
+        text: Text to count.
+
+    Returns:
+        tuple: (word count, sentence count), as ``len(text.split())`` and
+            the number of runs of sentence-ending punctuation.
+    """
+    words = sentences = 0
+    start = 0
+    while start < len(text):
+        end = min(start + _COUNT_CHUNK_SIZE, len(text))
+        while end < len(text) and not text[end].isspace():
+            end += 1
+        
+        chunk = text[start:end]
+        words += len(chunk.split())
+        sentences += len(_SENTENCE_END_RE.findall(chunk))
+        start = end
+    
+    return words, sentences
+
+
+# Built-in legal citation patterns and their replacements. No replacement
+# contains a period, so none can take part in a later citation match
+_CITATION_PATTERNS = (
+    (r'\bU\.S\.C\.', 'USC'),
+    (r'\bC\.F\.R\.', 'CFR'),
+    (r'\bFed\.\s*Reg\.', 'FedReg'),
+    (r'\bS\.E\.C\.', 'SEC'),
+)
+
+# Word boundary that leads the built-in citation patterns
+_WORD_BOUNDARY = r'\b'
+
+
+@lru_cache(maxsize=None)
+def _compile_citation_patterns(
+    patterns: tuple[tuple[str, str], ...]
+) -> tuple[tuple[tuple[re.Pattern, str], ...], Optional[re.Pattern]]:
+    """Compile citation patterns, once per pattern set.
+
+    Args:
+        patterns: Tuple of (regex string, replacement) pairs.
+
+    Returns:
+        tuple: (compiled, finder), where compiled holds the (compiled
+            pattern, replacement) pairs in the same order and finder matches
+            wherever any of the patterns does. Leading word boundaries are
+            left out of the finder so the regex engine can skip ahead to the
+            first literal. The finder is None unless patterns is the
+            built-in table: with other patterns a later one may match across
+            an earlier one's replacement, so each must be applied in turn.
+    """
+    compiled = tuple((re.compile(p), replacement) for p, replacement in patterns)
+    
+    finder = None
+    if patterns == _CITATION_PATTERNS:
+        bodies = (p.removeprefix(_WORD_BOUNDARY) for p, _ in patterns)
+        finder = re.compile('|'.join(f'(?:{body})' for body in bodies))
+    
+    return compiled, finder
+
+
+def _scan_patterns(
+    patterns: Sequence[re.Pattern], finder: re.Pattern, text: str
+) -> Iterator[tuple[int, re.Match]]:
+    """Find the matches of several patterns in one pass over text.
+
+    The finder stops only where some pattern matches; each pattern is then
+    tried at that position, skipping overlaps with its own previous match.
+    Per pattern this gives exactly the matches of ``finditer``, and overall
+    the order of a stable sort of those results by start position. Patterns
+    must not match the empty string.
+
+    Args:
+        patterns: Compiled patterns to match.
+        finder: Compiled pattern matching wherever any of patterns does.
+        text: Text to scan.
+
+    Yields:
+        tuple: (pattern index, match) pairs.
+    """
+    last_end = [0] * len(patterns)
+    pos = 0
+    while (found := finder.search(text, pos)) is not None:
+        start = found.start()
+        for index, pattern in enumerate(patterns):
+            if start < last_end[index]:
+                continue
+            match = pattern.match(text, start)
+            if match is not None:
+                last_end[index] = match.end()
+                yield index, match
+        pos = start + 1
+
+
+# Line-start prefix shared by the built-in section header patterns
+_LINE_START = '(?:^|\\n)'
+
+
+@lru_cache(maxsize=None)
+def _compile_section_patterns(patterns: tuple[str, ...]) -> tuple[list[re.Pattern], re.Pattern]:
+    """Compile section header patterns, once per pattern set.
+
+    Args:
+        patterns: Tuple of section header regex strings.
+
+    Returns:
+        tuple: (compiled patterns, finder), all in MULTILINE mode. The
+            finder matches wherever any of the patterns does. When every
+            pattern starts with the same line-start prefix, the finder
+            matches that prefix once rather than per alternative.
+    """
+    compiled = [re.compile(p, re.MULTILINE) for p in patterns]
+    
+    if all(p.startswith(_LINE_START) for p in patterns):
+        bodies = '|'.join(f'(?:{p[len(_LINE_START):]})' for p in patterns)
+        finder = re.compile(f'{_LINE_START}(?:{bodies})', re.MULTILINE)
+    else:
+        finder = re.compile('|'.join(f'(?:{p})' for p in patterns), re.MULTILINE)
+    
+    return compiled, finder
+
+
+@dataclass(slots=True, eq=False)
+class Section(Mapping):
+    """
+    A section of normalized text.
+    
+    Also reads as a mapping with the keys id, start, end, content, and
+    full_content, so code written against section dictionaries keeps
+    working.
+    """
+    
+    id: str
+    start: int
+    end: int
+    full_content: str
+    
+    @property
+    def content(self) -> str:
+        """str: Preview of the content, truncated to 500 characters."""
+        if len(self.full_content) > _PREVIEW_LENGTH:
+            return self.full_content[:_PREVIEW_LENGTH] + '...'
+        return self.full_content
+    
+    def __getitem__(self, key: str):
+        if key not in _SECTION_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_SECTION_KEYS)
+    
+    def __len__(self) -> int:
+        return len(_SECTION_KEYS)
+    
+    def as_dict(self) -> dict:
+        """Convert to a dictionary.
+
+        Returns:
+            dict: The section's id, start, end, content, and full_content.
+        """
+        return {key: getattr(self, key) for key in _SECTION_KEYS}
+
+
+# Keys a Section reads as, in dictionary order
+_SECTION_KEYS = ('id', 'start', 'end', 'content', 'full_content')
+
+
+class SectionTable(SequenceABC):
+    """
+    Columnar store of extracted sections.
+    
+    Holds section IDs and offsets in their own columns, with start and end
+    offsets as integer arrays for vectorized range queries. Each Section,
+    and its content slice of the text, is built only when the section is
+    accessed. Pickles as a plain list of sections.
+    """
+    
+    __slots__ = ('_text', '_offset', '_sections', 'ids', 'starts', 'ends', 'header_ends')
+    
+    def __init__(
+        self,
+        text: str,
+        ids: Sequence[str],
+        starts: Sequence[int],
+        ends: Sequence[int],
+        header_ends: Sequence[int],
+        offset: int = 0
+    ):
+        """Store section columns.
+        
+        Args:
+            text: The normalized text that offsets refer to.
+            ids: Section identifiers, in document order.
+            starts: Character position where each section's header starts.
+            ends: Character position where each section ends.
+            header_ends: Character position where each section's header ends
+                and its content begins.
+            offset: Position of text within a longer document, added to
+                every stored position.
+        """
+        self._text = text
+        self._offset = offset
+        self._sections = [None] * len(ids)
+        self.ids = tuple(ids)
+        self.starts = np.asarray(starts, dtype=np.intp) + offset
+        self.ends = np.asarray(ends, dtype=np.intp) + offset
+        self.header_ends = np.asarray(header_ends, dtype=np.intp) + offset
+    
+    def __len__(self) -> int:
+        return len(self._sections)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        section = self._sections[index]
+        if section is None:
+            section = self._sections[index] = self._materialize(index)
+        return section
+    
+    def __iter__(self) -> Iterator[Section]:
+        for index in range(len(self._sections)):
+            yield self[index]
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SequenceABC) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+    
+    def __reduce__(self):
+        return (list, (list(self),))
+    
+    def to_dicts(self) -> list[dict]:
+        """Return every section as a dictionary.
+
+        Returns:
+            list[dict]: One dictionary per section, as Section.as_dict
+                would produce.
+        """
+        return [section.as_dict() for section in self]
+    
+    def _materialize(self, index: int) -> Section:
+        """Build the Section for one row.
+        
+        Args:
+            index: Index of the section.
+        
+        Returns:
+            Section: The section, with its content sliced from the text.
+        """
+        return Section(
+            id=self.ids[index],
+            start=int(self.starts[index]),
+            end=int(self.ends[index]),
+            full_content=self._text[
+                self.header_ends[index] - self._offset:self.ends[index] - self._offset
+            ].strip()
+        )
 
 
 @dataclass
@@ -14,7 +336,7 @@ class NormalizedText:
     
     original: str
     normalized: str
-    sections: list[dict]
+    sections: SectionTable
     word_count: int
     sentence_count: int
 
@@ -39,19 +361,32 @@ class TextNormalizer:
         r'(?:^|\n)(\d+(?:\.\d+)*)\s*[.:]',
     ]
     
+    # Section header patterns used by each jurisdiction family, keyed by the
+    # jurisdiction code prefix (e.g. "US" for "US-SEC"). Families not listed
+    # use the full SECTION_PATTERNS set.
+    JURISDICTION_SECTION_PATTERNS = {
+        "US": [
+            r'(?:^|\n)(?:Section|SECTION|§)\s*(\d+(?:\.\d+)*)',
+            r'(?:^|\n)(?:Rule|RULE)\s*(\d+(?:\.\d+)*)',
+            r'(?:^|\n)(?:Part|PART)\s*(\d+(?:\.\d+)*)',
+            r'(?:^|\n)(\d+(?:\.\d+)*)\s*[.:]',
+        ],
+        "EU": [
+            r'(?:^|\n)(?:Section|SECTION|§)\s*(\d+(?:\.\d+)*)',
+            r'(?:^|\n)(?:Article|ARTICLE)\s*(\d+(?:\.\d+)*)',
+            r'(?:^|\n)(\d+(?:\.\d+)*)\s*[.:]',
+        ],
+    }
+    
     # Legal citation patterns
-    CITATION_PATTERNS = [
-        (r'\bU\.S\.C\.', 'USC'),
-        (r'\bC\.F\.R\.', 'CFR'),
-        (r'\bFed\.\s*Reg\.', 'FedReg'),
-        (r'\bS\.E\.C\.', 'SEC'),
-    ]
+    CITATION_PATTERNS = list(_CITATION_PATTERNS)
     
     def __init__(
         self,
         lowercase: bool = False,
         remove_citations: bool = False,
-        preserve_structure: bool = True
+        preserve_structure: bool = True,
+        section_patterns: Optional[list[str]] = None
     ):
         """Initialize the TextNormalizer.
 
@@ -59,21 +394,127 @@ class TextNormalizer:
             lowercase: If True, convert all text to lowercase.
             remove_citations: If True, remove citation references from text.
             preserve_structure: If True, maintain paragraph and section structure.
+            section_patterns: Section header patterns to extract sections with.
+                Defaults to SECTION_PATTERNS.
         """
         self.lowercase = lowercase
         self.remove_citations = remove_citations
         self.preserve_structure = preserve_structure
+        self._section_patterns, self._section_finder = _compile_section_patterns(
+            tuple(section_patterns or self.SECTION_PATTERNS)
+        )
+        self._citation_patterns = _compile_citation_patterns(
+            tuple(map(tuple, self.CITATION_PATTERNS))
+        )
+    
+    @classmethod
+    def for_jurisdiction(cls, jurisdiction: Optional[str], **kwargs) -> "TextNormalizer":
+        """Create a normalizer specialized to a jurisdiction's section headers.
+
+        Only the header styles used by the jurisdiction family are searched
+        for, e.g. US documents are not scanned for "Article N" headers.
+        Unknown jurisdictions get the full pattern set.
+
+        Args:
+            jurisdiction: Jurisdiction code (e.g. "US-SEC", "EU-MiFID").
+            **kwargs: Other TextNormalizer options.
+
+        Returns:
+            TextNormalizer: Normalizer using the jurisdiction's section patterns.
+        """
+        family = (jurisdiction or "").split("-", 1)[0].upper()
+        return cls(section_patterns=cls.JURISDICTION_SECTION_PATTERNS.get(family), **kwargs)
     
-    def normalize(self, text: str) -> NormalizedText:
+    def normalize(self, text: Union[str, bytes, memoryview]) -> NormalizedText:
         """
         Normalize regulatory text.
         
         Args:
-            text: Raw regulatory text
+            text: Raw regulatory text, or UTF-8 encoded bytes (including a
+                memoryview or memory map of a file)
             
         Returns:
             NormalizedText with normalized content and metadata
         """
+        if not isinstance(text, str):
+            text = str(text, 'utf-8')
+        
+        return self._normalize(text)
+    
+    def iter_normalize(
+        self,
+        chunks: Iterable[str],
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[NormalizedText]:
+        """
+        Normalize a long text piece by piece, yielding each piece as it is ready.
+        
+        Lets memory-constrained callers process documents too large to hold
+        in memory several times over. The raw text is buffered until about
+        chunk_size characters have arrived, then normalized up to the last
+        paragraph break (or line break, if there is none). Sections do not
+        span pieces, and statistics are per piece. Each piece is yielded
+        once the next non-empty one is normalized, or the input ends.
+        
+        Args:
+            chunks: Raw regulatory text, in order, in pieces of any size
+            chunk_size: Raw characters to buffer before normalizing
+            
+        Yields:
+            NormalizedText for each non-empty piece. Section positions refer
+            to the normalized pieces joined with blank lines ("\\n\\n"), and
+            match a whole-document normalize of that text wherever a piece
+            starts with a section header.
+        """
+        offset = 0
+        buffer = ''
+        previous = None
+        
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                buffer += chunk
+                if len(buffer) < chunk_size:
+                    continue
+                split = buffer.rfind('\n\n')
+                if split < 0:
+                    split = buffer.rfind('\n')
+                if split < 0:
+                    continue
+                piece, buffer = buffer[:split], buffer[split:]
+            else:
+                piece, buffer = buffer, ''
+            
+            result = self._normalize(piece, offset)
+            if not result.normalized:
+                continue
+            
+            sections = result.sections
+            if previous is not None and len(sections) and sections.starts[0] == offset:
+                # In the joined text this header matches at the separator's
+                # second newline, and the previous section runs up to it
+                sections.starts[0] -= 1
+                if len(previous.sections):
+                    previous.sections.ends[-1] += 1
+            
+            if previous is not None:
+                yield previous
+            offset += len(result.normalized) + 2
+            previous = result
+        
+        if previous is not None:
+            yield previous
+    
+    def _normalize(self, text: str, offset: int = 0) -> NormalizedText:
+        """Normalize decoded regulatory text.
+
+        Args:
+            text: Raw regulatory text.
+            offset: Position of the normalized text within a longer
+                normalized document, added to section positions.
+
+        Returns:
+            NormalizedText with normalized content and metadata.
+        """
         original = text
         
         # Unicode normalization (NFKC for compatibility)
@@ -89,15 +530,14 @@ class TextNormalizer:
         normalized = self._normalize_citations(normalized)
         
         # Extract sections
-        sections = self._extract_sections(normalized)
+        sections = self._extract_sections(normalized, offset)
         
         # Optional lowercase
         if self.lowercase:
             normalized = normalized.lower()
         
         # Count statistics
-        word_count = len(normalized.split())
-        sentence_count = len(re.findall(r'[.!?]+', normalized))
+        word_count, sentence_count = _count_words_and_sentences(normalized)
         
         return NormalizedText(
             original=original,
@@ -118,14 +558,19 @@ class TextNormalizer:
             for paragraphs).
         """
         # Replace multiple spaces with single space
-        text = re.sub(r'[^\S\n]+', ' ', text)
+        if text.isascii():
+            # str.translate is fast on ASCII strings, and leaves only runs of
+            # plain spaces for the regex engine to find
+            text = _SPACES_RE.sub(' ', text.translate(_ASCII_SPACE_TABLE))
+        else:
+            text = _SPACE_RUN_RE.sub(' ', text)
         
         # Normalize multiple newlines to double newline (paragraph break)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _NEWLINE_RUN_RE.sub('\n\n', text)
         
-        # Remove leading/trailing whitespace from lines
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
+        # Remove leading/trailing whitespace from lines, which is now at
+        # most one space at either end
+        text = text.replace(' \n', '\n').replace('\n ', '\n')
         
         return text.strip()
     
@@ -141,89 +586,150 @@ class TextNormalizer:
         Returns:
             Text with normalized citation formats.
         """
-        for pattern, replacement in self.CITATION_PATTERNS:
-            text = re.sub(pattern, replacement, text)
+        compiled, finder = self._citation_patterns
+        
+        if finder is not None:
+            replaced = self._replace_citations(text, compiled, finder)
+            if replaced is not None:
+                text = replaced
+                compiled = ()
+        
+        for pattern, replacement in compiled:
+            text = pattern.sub(replacement, text)
         
         if self.remove_citations:
             # Remove common citation formats
-            text = re.sub(r'\[\d+\]', '', text)
-            text = re.sub(r'\(\d{4}\)', '', text)
+            for pattern in _REFERENCE_RES:
+                text = pattern.sub('', text)
         
         return text
     
-    def _extract_sections(self, text: str) -> list[dict]:
+    def _replace_citations(
+        self,
+        text: str,
+        compiled: tuple[tuple[re.Pattern, str], ...],
+        finder: re.Pattern
+    ) -> Optional[str]:
+        """Replace all citation styles in a single pass over the text.
+
+        Only used for the built-in patterns, none of whose replacements can
+        be part of another citation. Gives the same result as one ``sub``
+        per pattern whenever no two citations overlap or run together,
+        which is checked as it goes.
+
+        Args:
+            text: Input text containing legal citations.
+            compiled: (compiled pattern, replacement) pairs, in priority order.
+            finder: Pattern matching wherever any of the patterns does.
+
+        Returns:
+            The text with citations replaced, or None if citations overlap
+            or run together and each pattern must be applied in turn.
+        """
+        pieces = []
+        last_end = 0
+        found = finder.search(text)
+        while found is not None:
+            start = found.start()
+            for pattern, replacement in compiled:
+                match = pattern.match(text, start)
+                if match is not None:
+                    break
+            else:
+                found = finder.search(text, start + 1)
+                continue
+            
+            end = match.end()
+            if end == start:
+                return None
+            
+            # A citation starting inside or right after this one may be
+            # rewritten differently when each pattern is applied in turn
+            found = finder.search(text, start + 1)
+            while found is not None and found.start() <= end:
+                if any(pattern.match(text, found.start()) for pattern, _ in compiled):
+                    return None
+                found = finder.search(text, found.start() + 1)
+            
+            pieces.append(text[last_end:start])
+            pieces.append(replacement)
+            last_end = end
+        
+        pieces.append(text[last_end:])
+        return ''.join(pieces)
+    
+    def _extract_sections(self, text: str, offset: int = 0) -> SectionTable:
         """Extract section structure from text.
 
-        Identifies sections, articles, rules, and parts using common
-        regulatory document patterns.
+        Identifies sections, articles, rules, and parts using the configured
+        section header patterns, in a single pass over the text.
 
         Args:
             text: Normalized regulatory text.
+            offset: Position of text within a longer document, added to
+                section positions.
 
         Returns:
-            List of section dictionaries containing:
+            SectionTable of sections, each a Section with:
                 - id: Section identifier (e.g., "1.2.3")
                 - start: Character position where section starts
                 - end: Character position where section ends
                 - content: Truncated content (max 500 chars)
                 - full_content: Complete section content
         """
-        sections = []
+        # Every match as [start, header_end, end], ordered by start
+        matches = []
+        last_match = [None] * len(self._section_patterns)
+        ids = []
         
-        for pattern in self.SECTION_PATTERNS:
-            matches = list(re.finditer(pattern, text, re.MULTILINE))
-            
-            for i, match in enumerate(matches):
-                section_id = match.group(1)
-                start = match.end()
-                
-                # End is either next section or end of text
-                if i + 1 < len(matches):
-                    end = matches[i + 1].start()
-                else:
-                    end = len(text)
-                
-                content = text[start:end].strip()
-                
-                sections.append({
-                    'id': section_id,
-                    'start': match.start(),
-                    'end': end,
-                    'content': content[:500] + '...' if len(content) > 500 else content,
-                    'full_content': content
-                })
-        
-        # Sort by position and deduplicate
-        sections = sorted(sections, key=lambda x: x['start'])
-        return self._deduplicate_sections(sections)
-    
-    def _deduplicate_sections(self, sections: list[dict]) -> list[dict]:
+        for index, match in _scan_patterns(self._section_patterns, self._section_finder, text):
+            start = match.start()
+            # A section ends where the next header of the same style starts
+            if last_match[index] is not None:
+                last_match[index][2] = start
+            last_match[index] = entry = [start, match.end(), len(text)]
+            matches.append(entry)
+            ids.append(match.group(1))
+        
+        keep = self._deduplicate_sections(ids, matches)
+        return SectionTable(
+            text,
+            [ids[i] for i in keep],
+            [matches[i][0] for i in keep],
+            [matches[i][2] for i in keep],
+            [matches[i][1] for i in keep],
+            offset
+        )
+    
+    def _deduplicate_sections(self, ids: list[str], matches: list[list[int]]) -> list[int]:
         """Remove overlapping section extractions.
 
         When multiple patterns match the same text region, keeps the most
         specific section (longest ID) or non-overlapping sections.
 
         Args:
-            sections: List of section dictionaries sorted by start position.
+            ids: Section identifiers, sorted by start position.
+            matches: [start, header_end, end] of each section, in the same
+                order.
 
         Returns:
-            Deduplicated list of non-overlapping sections.
+            Indices of the non-overlapping sections to keep, in order.
         """
-        if not sections:
-            return []
+        keep = []
         
-        deduplicated = [sections[0]]
-        
-        for section in sections[1:]:
-            last = deduplicated[-1]
+        for index, (start, _, end) in enumerate(matches):
+            if not keep:
+                keep.append(index)
+                continue
+            last = keep[-1]
             # If this section starts after the last one ends, include it
-            if section['start'] >= last['end']:
-                deduplicated.append(section)
+            if start >= matches[last][2]:
+                keep.append(index)
             # If this section is more specific (longer ID), replace
-            elif len(section['id']) > len(last['id']):
-                deduplicated[-1] = section
+            elif len(ids[index]) > len(ids[last]):
+                keep[-1] = index
         
-        return deduplicated
+        return keep
     
     def extract_definitions(self, text: str) -> list[dict]:
         """Extract defined terms from regulatory text.
@@ -242,26 +748,23 @@ class TextNormalizer:
                 - context: Surrounding text (up to 200 chars after match)
                 - position: Character position of the definition
         """
-        definitions = []
+        # One pass over the text, keeping results grouped by pattern
+        found = [[] for _ in _DEFINITION_RES]
+        for index, match in _scan_patterns(_DEFINITION_RES, _DEFINITION_FINDER, text):
+            found[index].append(match)
         
-        patterns = [
-            r'"([^"]+)"\s+(?:means|shall mean|refers to|is defined as)',
-            r'"([^"]+)"\s+has the meaning',
-            r'(?:the term|The term)\s+"([^"]+)"',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                term = match.group(1)
-                # Get context (100 chars after the match)
-                context_start = match.start()
-                context_end = min(match.end() + 200, len(text))
-                context = text[context_start:context_end]
-                
-                definitions.append({
-                    'term': term,
-                    'context': context,
-                    'position': match.start()
-                })
+        definitions = []
+        for match in itertools.chain.from_iterable(found):
+            term = match.group(1)
+            # Get context (100 chars after the match)
+            context_start = match.start()
+            context_end = min(match.end() + 200, len(text))
+            context = text[context_start:context_end]
+            
+            definitions.append({
+                'term': term,
+                'context': context,
+                'position': match.start()
+            })
         
         return definitions
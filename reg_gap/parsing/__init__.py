@@ -1,8 +1,14 @@
 """Parsing module for extracting regulatory clauses, entities, and definitions."""
 
-from .clause_extractor import ClauseExtractor, RegulatoryClause
-from .entity_recognizer import EntityRecognizer, RegulatoryEntity
-from .definitions import DefinitionExtractor, Definition
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .clause_extractor import ClauseExtractor, RegulatoryClause
+    from .entity_recognizer import EntityRecognizer, RegulatoryEntity
+    from .definitions import DefinitionExtractor, Definition
+    from .fused import FusedPipeline
 
 __all__ = [
     "ClauseExtractor",
@@ -11,4 +17,18 @@ __all__ = [
     "RegulatoryEntity",
     "DefinitionExtractor",
     "Definition",
+    "FusedPipeline",
 ]
+
+# Public names are imported from their submodules on first access (PEP 562)
+_EXPORTS = {
+    "ClauseExtractor": ".clause_extractor",
+    "RegulatoryClause": ".clause_extractor",
+    "EntityRecognizer": ".entity_recognizer",
+    "RegulatoryEntity": ".entity_recognizer",
+    "DefinitionExtractor": ".definitions",
+    "Definition": ".definitions",
+    "FusedPipeline": ".fused",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -11,8 +11,37 @@ Identifies and classifies regulatory clauses as:
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
 from typing import Optional
 
+from .scanner import MultiPatternScanner, _first_chars, _required_literals
+
+
+# Documents with more sentences than this may be split into chunks of this
+# many sentences and extracted on several worker processes
+PARALLEL_CHUNK_SIZE = 4096
+
+# Abbreviations whose period does not end a sentence
+_ABBREVIATIONS = ('Mr', 'Mrs', 'Dr', 'Inc', 'Ltd', 'etc', 'vs', r'i\.e', r'e\.g')
+
+# Whitespace after sentence-ending punctuation, unless the punctuation is
+# an abbreviation's period
+_SENTENCE_BREAK_RE = re.compile(
+    r'(?<=[.!?])' + ''.join(rf'(?<!\b{a}\.)' for a in _ABBREVIATIONS) + r'\s+'
+)
+
+# An abbreviation's period followed by a line break or other non-space
+# whitespace, which is read as a single space
+_ABBREVIATION_BREAK_RE = re.compile(r'\b(' + '|'.join(_ABBREVIATIONS) + r')\.[^\S ]')
+_PERIOD_BREAK_RE = re.compile(r'\.[^\S ]')
+
+# A modal verb and the action it governs, gated on the modals' first letters
+_ACTION_RE = re.compile(
+    r'(?=[cmsw])(?:shall|must|may|will|should|can)\s+(?:not\s+)?(\w+(?:\s+\w+)?)',
+    re.IGNORECASE
+)
+
 
 class ClauseType(Enum):
     """Types of regulatory clauses."""
@@ -23,9 +52,14 @@ class ClauseType(Enum):
     DEFINITION = "definition"
     EXCEPTION = "exception"
     UNKNOWN = "unknown"
+    
+    # Members are singletons compared by identity, so hash them by identity
+    # too. Enum's default hashes the member name in Python code, which is
+    # most of the cost of a dict lookup keyed by clause type.
+    __hash__ = object.__hash__
 
 
-@dataclass
+@dataclass(slots=True)
 class RegulatoryClause:
     """Represents an extracted regulatory clause."""
     
@@ -56,6 +90,67 @@ class RegulatoryClause:
         }
 
 
+@lru_cache(maxsize=None)
+def _compile_alternation(patterns: tuple[str, ...], flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile patterns into one alternation, once per table.
+
+    When every pattern starts with a known character, the alternation is
+    gated on those characters so that other positions are rejected before
+    any alternative is tried.
+
+    Args:
+        patterns: Tuple of regex pattern strings to combine.
+        flags: Regex flags for the alternation. Case-insensitive by default.
+
+    Returns:
+        re.Pattern: Pattern matching any of the input patterns, each
+            wrapped in its own capture group.
+    """
+    combined = '|'.join(f'({p})' for p in patterns)
+    first_chars = _first_chars(patterns, flags)
+    if first_chars:
+        combined = f'(?=[{re.escape(first_chars)}])(?:{combined})'
+    return re.compile(combined, flags)
+
+
+@lru_cache(maxsize=None)
+def _compile_each(patterns: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Compile each pattern of a table on its own, once per table.
+
+    Args:
+        patterns: Tuple of regex pattern strings.
+
+    Returns:
+        tuple[re.Pattern, ...]: The case-insensitive compiled patterns, in
+            table order.
+    """
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+@lru_cache(maxsize=None)
+def _compile_phrase_table(
+    patterns: tuple[str, ...]
+) -> tuple[MultiPatternScanner, tuple[re.Pattern, ...], Optional[tuple[str, ...]]]:
+    """Compile a table of phrase patterns, once per table.
+
+    Args:
+        patterns: Tuple of case-insensitive regex pattern strings, each with
+            one capture group for the extracted phrase.
+
+    Returns:
+        tuple: (scanner, compiled, keywords), a single-pass scanner over all
+            the patterns, each pattern compiled on its own for reading the
+            captured phrase of a match, and the lowercase ASCII literal each
+            pattern starts with, or None if some pattern has no such literal.
+    """
+    keywords = _required_literals(patterns)
+    if keywords is not None and all(keyword.isascii() for keyword in keywords):
+        keywords = tuple(keyword.lower() for keyword in keywords)
+    else:
+        keywords = None
+    return MultiPatternScanner(patterns, re.IGNORECASE), _compile_each(patterns), keywords
+
+
 class ClauseExtractor:
     """
     Extracts and classifies regulatory clauses.
@@ -97,6 +192,38 @@ class ClauseExtractor:
         r'\b(?:exemption|exempt from)\b',
     ]
     
+    # Definition patterns (case-sensitive)
+    DEFINITION_PATTERNS = [
+        r'"[^"]+" means',
+        r'"[^"]+" shall mean',
+        r'(?:the term|The term) "[^"]+"',
+        r'"[^"]+" is defined as',
+    ]
+    
+    # Common regulatory subjects at the start of a clause
+    SUBJECT_PATTERNS = [
+        r'^((?:The |A |An )?(?:registrant|issuer|broker|dealer|investment adviser|'
+        r'fund|person|entity|company|firm|institution|bank|covered person))',
+        r'^((?:The |A |An )?(?:licensee|applicant|member|participant|customer|client))',
+        r'^(No (?:person|entity|one|broker|dealer|adviser))',
+    ]
+    
+    # Phrases extracted as conditions and exceptions of a clause
+    CONDITION_PHRASE_PATTERNS = [
+        r'if\s+([^,;.]+)',
+        r'when\s+([^,;.]+)',
+        r'where\s+([^,;.]+)',
+        r'provided that\s+([^,;.]+)',
+        r'subject to\s+([^,;.]+)',
+    ]
+    
+    EXCEPTION_PHRASE_PATTERNS = [
+        r'except\s+(?:that\s+)?([^,;.]+)',
+        r'unless\s+([^,;.]+)',
+        r'excluding\s+([^,;.]+)',
+        r'other than\s+([^,;.]+)',
+    ]
+    
     def __init__(self, min_clause_length: int = 20, max_clause_length: int = 1000):
         """Initialize the clause extractor with length constraints.
 
@@ -115,6 +242,20 @@ class ClauseExtractor:
         self._permission_re = self._compile_patterns(self.PERMISSION_PATTERNS)
         self._condition_re = self._compile_patterns(self.CONDITION_PATTERNS)
         self._exception_re = self._compile_patterns(self.EXCEPTION_PATTERNS)
+        
+        # Clause types in order of specificity, with their combined and
+        # individual patterns
+        self._classifiers = (
+            (ClauseType.PROHIBITION, self._prohibition_re, _compile_each(tuple(self.PROHIBITION_PATTERNS))),
+            (ClauseType.OBLIGATION, self._obligation_re, _compile_each(tuple(self.OBLIGATION_PATTERNS))),
+            (ClauseType.PERMISSION, self._permission_re, _compile_each(tuple(self.PERMISSION_PATTERNS))),
+            (ClauseType.EXCEPTION, self._exception_re, _compile_each(tuple(self.EXCEPTION_PATTERNS))),
+            (ClauseType.CONDITION, self._condition_re, _compile_each(tuple(self.CONDITION_PATTERNS))),
+        )
+        self._definition_re = _compile_alternation(tuple(self.DEFINITION_PATTERNS), 0)
+        self._subject_re = self._compile_patterns(self.SUBJECT_PATTERNS)
+        self._condition_phrases = _compile_phrase_table(tuple(self.CONDITION_PHRASE_PATTERNS))
+        self._exception_phrases = _compile_phrase_table(tuple(self.EXCEPTION_PHRASE_PATTERNS))
     
     def _compile_patterns(self, patterns: list[str]) -> re.Pattern:
         """Compile a list of regex patterns into a single compiled pattern.
@@ -124,41 +265,104 @@ class ClauseExtractor:
 
         Returns:
             A compiled regex pattern that matches any of the input patterns,
-            case-insensitive.
+            case-insensitive. Shared by all extractors using the same patterns.
         """
-        combined = '|'.join(f'({p})' for p in patterns)
-        return re.compile(combined, re.IGNORECASE)
+        return _compile_alternation(tuple(patterns))
     
-    def extract(self, text: str, section_id: Optional[str] = None) -> list[RegulatoryClause]:
+    def extract(
+        self,
+        text: str,
+        section_id: Optional[str] = None,
+        num_workers: int = 1
+    ) -> list[RegulatoryClause]:
         """
         Extract regulatory clauses from text.
         
         Args:
             text: Regulatory text to analyze
             section_id: Optional section identifier for context
+            num_workers: Number of worker processes for texts with more
+                than PARALLEL_CHUNK_SIZE sentences; 1 extracts in-process
             
         Returns:
             List of extracted RegulatoryClause objects
         """
-        clauses = []
-        
         # Split into sentences
         sentences = self._split_sentences(text)
         
-        for i, sentence in enumerate(sentences):
+        if num_workers > 1 and len(sentences) > PARALLEL_CHUNK_SIZE:
+            return self._parallel_extract(sentences, section_id, num_workers)
+        
+        return self._extract_sentences(sentences, 0, section_id)
+    
+    def _parallel_extract(
+        self,
+        sentences: list[str],
+        section_id: Optional[str],
+        num_workers: int
+    ) -> list[RegulatoryClause]:
+        """Extract clauses from chunks of sentences on a process pool.
+
+        Sentences are classified independently, so each chunk is extracted
+        on its own and the results are joined in order.
+
+        Args:
+            sentences: Sentences of the text, in order.
+            section_id: Optional section identifier for context.
+            num_workers: Number of worker processes.
+
+        Returns:
+            List of extracted RegulatoryClause objects, the same as
+            extracting all sentences in-process.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        chunk_size = PARALLEL_CHUNK_SIZE
+        positions = range(0, len(sentences), chunk_size)
+        chunks = [sentences[position:position + chunk_size] for position in positions]
+        
+        clauses = []
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(chunks))) as pool:
+            results = pool.map(
+                self._extract_sentences, chunks, positions, repeat(section_id)
+            )
+            for chunk_clauses in results:
+                clauses.extend(chunk_clauses)
+        
+        return clauses
+    
+    def _extract_sentences(
+        self,
+        sentences: list[str],
+        first_position: int,
+        section_id: Optional[str]
+    ) -> list[RegulatoryClause]:
+        """Classify sentences and extract the clauses among them.
+
+        Args:
+            sentences: Consecutive sentences of the text.
+            first_position: Position of the first sentence in the text.
+            section_id: Optional section identifier for context.
+
+        Returns:
+            List of extracted RegulatoryClause objects.
+        """
+        clauses = []
+        
+        for i, sentence in enumerate(sentences, first_position):
             if len(sentence) < self.min_clause_length:
                 continue
             if len(sentence) > self.max_clause_length:
                 sentence = sentence[:self.max_clause_length] + "..."
             
-            clause_type = self._classify_clause(sentence)
+            clause_type, matches = self._classify_clause(sentence)
             
             if clause_type != ClauseType.UNKNOWN:
                 clause = RegulatoryClause(
                     text=sentence,
                     clause_type=clause_type,
                     section_id=section_id,
-                    confidence=self._calculate_confidence(sentence, clause_type),
+                    confidence=self._calculate_confidence(sentence, matches),
                     position=i
                 )
                 
@@ -184,18 +388,20 @@ class ClauseExtractor:
         Returns:
             List of sentence strings, stripped of leading/trailing whitespace.
         """
-        # Handle common abbreviations to avoid false splits
-        text = re.sub(r'\b(Mr|Mrs|Dr|Inc|Ltd|etc|vs|i\.e|e\.g)\.\s', r'\1<PERIOD> ', text)
-        
-        # Split on sentence-ending punctuation
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        # Restore periods
-        sentences = [s.replace('<PERIOD>', '.') for s in sentences]
+        sentences = []
+        for sentence in _SENTENCE_BREAK_RE.split(text):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            # Only a period that did not end the sentence can be followed
+            # by whitespace here, so most sentences skip the substitution
+            if _PERIOD_BREAK_RE.search(sentence):
+                sentence = _ABBREVIATION_BREAK_RE.sub(r'\1. ', sentence)
+            sentences.append(sentence)
         
-        return [s.strip() for s in sentences if s.strip()]
+        return sentences
     
-    def _classify_clause(self, sentence: str) -> ClauseType:
+    def _classify_clause(self, sentence: str) -> tuple[ClauseType, int]:
         """Classify a sentence by its regulatory nature.
 
         Checks patterns in order of specificity: prohibitions first (most
@@ -206,24 +412,31 @@ class ClauseExtractor:
             sentence: The sentence to classify.
 
         Returns:
-            The ClauseType that best matches the sentence, or UNKNOWN if
-            no patterns match.
+            tuple: (clause_type, matches), the ClauseType that best matches
+                the sentence, or UNKNOWN if no patterns match, and how many
+                of that type's patterns match the sentence. The count is 0
+                for definitions and unknown sentences.
         """
-        # Check patterns in order of specificity
-        if self._prohibition_re.search(sentence):
-            return ClauseType.PROHIBITION
-        if self._obligation_re.search(sentence):
-            return ClauseType.OBLIGATION
-        if self._permission_re.search(sentence):
-            return ClauseType.PERMISSION
-        if self._exception_re.search(sentence):
-            return ClauseType.EXCEPTION
-        if self._condition_re.search(sentence):
-            return ClauseType.CONDITION
+        for clause_type, combined, each in self._classifiers:
+            match = combined.search(sentence)
+            if match is None:
+                continue
+            
+            # The alternation reports the leftmost match, and at that
+            # position the first pattern that matches, so patterns before
+            # it can only match later on and none match any earlier
+            start = match.start()
+            found = match.lastindex - 1
+            matches = 1
+            for index, pattern in enumerate(each):
+                if index != found and pattern.search(sentence, start + (index < found)):
+                    matches += 1
+            return clause_type, matches
+        
         if self._is_definition(sentence):
-            return ClauseType.DEFINITION
+            return ClauseType.DEFINITION, 0
         
-        return ClauseType.UNKNOWN
+        return ClauseType.UNKNOWN, 0
     
     def _is_definition(self, sentence: str) -> bool:
         """Check if a sentence is a regulatory definition.
@@ -237,15 +450,9 @@ class ClauseExtractor:
         Returns:
             True if the sentence matches a definition pattern, False otherwise.
         """
-        definition_patterns = [
-            r'"[^"]+" means',
-            r'"[^"]+" shall mean',
-            r'(?:the term|The term) "[^"]+"',
-            r'"[^"]+" is defined as',
-        ]
-        return any(re.search(p, sentence) for p in definition_patterns)
+        return self._definition_re.search(sentence) is not None
     
-    def _calculate_confidence(self, sentence: str, clause_type: ClauseType) -> float:
+    def _calculate_confidence(self, sentence: str, matches: int) -> float:
         """Calculate a confidence score for the clause classification.
 
         Confidence starts at 0.5 and increases based on the number of
@@ -254,7 +461,8 @@ class ClauseExtractor:
 
         Args:
             sentence: The classified sentence.
-            clause_type: The assigned clause type.
+            matches: Number of the assigned type's patterns that match the
+                sentence, as returned by _classify_clause.
 
         Returns:
             A confidence score between 0.5 and 1.0.
@@ -262,17 +470,7 @@ class ClauseExtractor:
         confidence = 0.5  # Base confidence
         
         # Multiple indicators increase confidence
-        patterns = {
-            ClauseType.OBLIGATION: self.OBLIGATION_PATTERNS,
-            ClauseType.PROHIBITION: self.PROHIBITION_PATTERNS,
-            ClauseType.PERMISSION: self.PERMISSION_PATTERNS,
-            ClauseType.CONDITION: self.CONDITION_PATTERNS,
-            ClauseType.EXCEPTION: self.EXCEPTION_PATTERNS,
-        }
-        
-        if clause_type in patterns:
-            matches = sum(1 for p in patterns[clause_type] if re.search(p, sentence, re.IGNORECASE))
-            confidence += min(0.4, matches * 0.15)
+        confidence += min(0.4, matches * 0.15)
         
         # Longer sentences with clear structure are more confident
         if len(sentence.split()) > 10:
@@ -292,18 +490,11 @@ class ClauseExtractor:
         Returns:
             The extracted subject string, or None if no subject pattern matches.
         """
-        # Common regulatory subjects
-        subject_patterns = [
-            r'^((?:The |A |An )?(?:registrant|issuer|broker|dealer|investment adviser|'
-            r'fund|person|entity|company|firm|institution|bank|covered person))',
-            r'^((?:The |A |An )?(?:licensee|applicant|member|participant|customer|client))',
-            r'^(No (?:person|entity|one|broker|dealer|adviser))',
-        ]
-        
-        for pattern in subject_patterns:
-            match = re.search(pattern, sentence, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        # Every pattern is anchored, so the alternation picks the first
+        # pattern that matches, and its outermost group is the subject
+        match = self._subject_re.match(sentence)
+        if match:
+            return match.group(match.lastindex).strip()
         
         return None
     
@@ -321,8 +512,7 @@ class ClauseExtractor:
             no modal verb pattern is found.
         """
         # Look for modal + verb patterns
-        action_pattern = r'(?:shall|must|may|will|should|can)\s+(?:not\s+)?(\w+(?:\s+\w+)?)'
-        match = re.search(action_pattern, sentence, re.IGNORECASE)
+        match = _ACTION_RE.search(sentence)
         if match:
             return match.group(1).strip()
         
@@ -341,21 +531,7 @@ class ClauseExtractor:
             List of condition strings found in the sentence. Empty list
             if no conditions are found.
         """
-        conditions = []
-        
-        condition_patterns = [
-            r'if\s+([^,;.]+)',
-            r'when\s+([^,;.]+)',
-            r'where\s+([^,;.]+)',
-            r'provided that\s+([^,;.]+)',
-            r'subject to\s+([^,;.]+)',
-        ]
-        
-        for pattern in condition_patterns:
-            for match in re.finditer(pattern, sentence, re.IGNORECASE):
-                conditions.append(match.group(1).strip())
-        
-        return conditions
+        return self._extract_phrases(sentence, self._condition_phrases)
     
     def _extract_exceptions(self, sentence: str) -> list[str]:
         """Extract exception clauses from a sentence.
@@ -370,20 +546,36 @@ class ClauseExtractor:
             List of exception strings found in the sentence. Empty list
             if no exceptions are found.
         """
-        exceptions = []
-        
-        exception_patterns = [
-            r'except\s+(?:that\s+)?([^,;.]+)',
-            r'unless\s+([^,;.]+)',
-            r'excluding\s+([^,;.]+)',
-            r'other than\s+([^,;.]+)',
-        ]
+        return self._extract_phrases(sentence, self._exception_phrases)
+    
+    def _extract_phrases(
+        self,
+        sentence: str,
+        table: tuple[MultiPatternScanner, tuple[re.Pattern, ...], Optional[tuple[str, ...]]]
+    ) -> list[str]:
+        """Extract the phrases captured by a phrase pattern table.
+
+        Args:
+            sentence: The sentence to extract phrases from.
+            table: Scanner, compiled patterns, and keywords from
+                _compile_phrase_table.
+
+        Returns:
+            List of captured phrases, grouped by pattern in table order and
+            by position within each pattern.
+        """
+        scanner, compiled, keywords = table
         
-        for pattern in exception_patterns:
-            for match in re.finditer(pattern, sentence, re.IGNORECASE):
-                exceptions.append(match.group(1).strip())
+        # Most clauses contain none of the keywords. For ASCII text,
+        # lowercasing matches case-insensitive matching exactly, so a
+        # substring check rules the patterns out without scanning.
+        if keywords is not None and sentence.isascii():
+            folded = sentence.lower()
+            if not any(keyword in folded for keyword in keywords):
+                return []
         
-        return exceptions
+        hits = sorted(scanner.scan(sentence))
+        return [compiled[index].match(sentence, start).group(1).strip() for index, start, _ in hits]
     
     def extract_all_types(self, text: str) -> dict[ClauseType, list[RegulatoryClause]]:
         """Extract clauses from text and group them by clause type.
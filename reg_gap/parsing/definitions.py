@@ -9,6 +9,7 @@ Extracts defined terms and their definitions, enabling:
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 
@@ -43,6 +44,35 @@ class Definition:
         }
 
 
+@lru_cache(maxsize=None)
+def _compile_definition_patterns(
+    patterns: tuple[tuple[str, float], ...]
+) -> list[tuple[re.Pattern, float]]:
+    """Compile (pattern, confidence) pairs, once per pattern table.
+
+    Args:
+        patterns: Tuple of (regex string, confidence) pairs.
+
+    Returns:
+        list[tuple[re.Pattern, float]]: The same table with each regex
+            compiled case-insensitively with DOTALL.
+    """
+    return [(re.compile(p, re.IGNORECASE | re.DOTALL), c) for p, c in patterns]
+
+
+@lru_cache(maxsize=None)
+def _compile_xref_patterns(patterns: tuple[str, ...]) -> list[re.Pattern]:
+    """Compile cross-reference patterns, once per pattern table.
+
+    Args:
+        patterns: Tuple of regex strings.
+
+    Returns:
+        list[re.Pattern]: Case-insensitive compiled patterns.
+    """
+    return [re.compile(p, re.IGNORECASE) for p in patterns]
+
+
 class DefinitionExtractor:
     """
     Extracts and manages regulatory definitions.
@@ -93,9 +123,9 @@ class DefinitionExtractor:
         self.min_definition_length = min_definition_length
         self.max_definition_length = max_definition_length
         
-        # Compile patterns
-        self._patterns = [(re.compile(p, re.IGNORECASE | re.DOTALL), c) for p, c in self.DEFINITION_PATTERNS]
-        self._xref_patterns = [re.compile(p, re.IGNORECASE) for p in self.CROSS_REFERENCE_PATTERNS]
+        # Compiled patterns are shared by all extractors
+        self._patterns = _compile_definition_patterns(tuple(self.DEFINITION_PATTERNS))
+        self._xref_patterns = _compile_xref_patterns(tuple(self.CROSS_REFERENCE_PATTERNS))
     
     def extract(
         self,
@@ -10,6 +10,7 @@ Identifies:
 """
 
 import re
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -325,8 +326,6 @@ class EntityRecognizer:
         """
         entities = self.recognize(text)
         counts = {et: 0 for et in EntityType}
-        
-        for entity in entities:
-            counts[entity.entity_type] += 1
+        counts.update(Counter(entity.entity_type for entity in entities))
         
         return counts
@@ -0,0 +1,96 @@
+"""
+Fused document analysis pipeline.
+
+Runs clause extraction, definition extraction, and ambiguity detection
+over one normalized text through a single entry point, so callers hold
+one set of compiled extractors and definitions flow straight into
+ambiguity detection instead of being rebuilt per command.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from .clause_extractor import ClauseExtractor, RegulatoryClause
+from .definitions import Definition, DefinitionExtractor
+
+if TYPE_CHECKING:
+    from ..comparison.ambiguity import AmbiguityDetector, AmbiguityReport
+
+
+class FusedPipeline:
+    """
+    Runs the per-document extractors as one pipeline.
+
+    The extractors are created once and reused for every document, and
+    the terms found by the definition extractor are handed to the
+    ambiguity detector so they are not flagged as undefined.
+    """
+
+    def __init__(
+        self,
+        clause_extractor: Optional[ClauseExtractor] = None,
+        definition_extractor: Optional[DefinitionExtractor] = None,
+        ambiguity_detector: Optional["AmbiguityDetector"] = None
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            clause_extractor: Clause extractor to use. Defaults to a new
+                ClauseExtractor.
+            definition_extractor: Definition extractor to use. Defaults to a
+                new DefinitionExtractor.
+            ambiguity_detector: Ambiguity detector to use. Defaults to a new
+                AmbiguityDetector, created on first use.
+        """
+        self.clause_extractor = clause_extractor or ClauseExtractor()
+        self.definition_extractor = definition_extractor or DefinitionExtractor()
+        self._ambiguity_detector = ambiguity_detector
+
+    @property
+    def ambiguity_detector(self) -> "AmbiguityDetector":
+        """AmbiguityDetector: Detector used for the ambiguity stage."""
+        if self._ambiguity_detector is None:
+            from ..comparison.ambiguity import AmbiguityDetector
+            self._ambiguity_detector = AmbiguityDetector()
+        return self._ambiguity_detector
+
+    def run(
+        self,
+        text: str,
+        source_document: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+        detect_ambiguity: bool = True,
+        word_count: Optional[int] = None
+    ) -> tuple[list[RegulatoryClause], list[Definition], Optional["AmbiguityReport"]]:
+        """Analyze normalized regulatory text.
+
+        Args:
+            text: Normalized regulatory text to analyze.
+            source_document: Optional source document identifier, recorded on
+                definitions and used as the ambiguity report's document ID.
+            jurisdiction: Optional jurisdiction identifier.
+            detect_ambiguity: Whether to run ambiguity detection.
+            word_count: Optional word count of the text, passed on to the
+                ambiguity detector so it need not recount.
+
+        Returns:
+            tuple: (clauses, definitions, ambiguity_report), where
+                ambiguity_report is None if detection was skipped.
+        """
+        clauses = self.clause_extractor.extract(text)
+        definitions = self.definition_extractor.extract(
+            text,
+            source_document=source_document,
+            jurisdiction=jurisdiction
+        )
+
+        ambiguity_report = None
+        if detect_ambiguity:
+            ambiguity_report = self.ambiguity_detector.detect(
+                text,
+                document_id=source_document or "unknown",
+                jurisdiction=jurisdiction,
+                defined_terms={d.term for d in definitions},
+                word_count=word_count
+            )
+
+        return clauses, definitions, ambiguity_report
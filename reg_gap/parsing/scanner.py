@@ -0,0 +1,229 @@
+"""
+Single-pass scanning for several regex patterns at once.
+
+Running ``finditer`` once per pattern walks the text once per pattern.
+MultiPatternScanner compiles a whole pattern table into one regex that
+stops only at positions where at least one pattern matches, and reports
+every pattern matching there, so the text is walked once.
+"""
+
+import re
+from typing import Iterator, Optional, Sequence
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+
+def _leading_chars(items) -> Optional[set[str]]:
+    """Find the characters a parsed pattern's matches can start with.
+
+    Args:
+        items: Parsed pattern items, as produced by the regex parser.
+
+    Returns:
+        Optional[set[str]]: The possible first characters (before case
+            folding), or None if they cannot be determined cheaply.
+    """
+    for op, av in items:
+        if op is _sre_parse.AT:
+            # Anchors and word boundaries don't consume characters
+            continue
+        if op is _sre_parse.LITERAL:
+            return {chr(av)}
+        if op is _sre_parse.IN:
+            chars = set()
+            for item_op, item_av in av:
+                if item_op is _sre_parse.LITERAL:
+                    chars.add(chr(item_av))
+                elif item_op is _sre_parse.RANGE and item_av[1] - item_av[0] < 64:
+                    chars.update(map(chr, range(item_av[0], item_av[1] + 1)))
+                else:
+                    return None
+            return chars
+        if op is _sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, subpattern = av
+            if add_flags or del_flags:
+                return None
+            return _leading_chars(subpattern)
+        if op is _sre_parse.BRANCH:
+            chars = set()
+            for branch in av[1]:
+                branch_chars = _leading_chars(branch)
+                if branch_chars is None:
+                    return None
+                chars |= branch_chars
+            return chars
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+            return _leading_chars(av[2])
+        return None
+    return None
+
+
+def _leading_literal(items) -> str:
+    """Find the literal text every match of a parsed pattern starts with.
+
+    Args:
+        items: Parsed pattern items, as produced by the regex parser.
+
+    Returns:
+        str: The leading literal characters, possibly empty.
+    """
+    chars = []
+    for op, av in items:
+        if op is _sre_parse.AT and not chars:
+            continue
+        if op is not _sre_parse.LITERAL:
+            break
+        chars.append(chr(av))
+    return ''.join(chars)
+
+
+def _required_literals(patterns: Sequence[str], flags: int = 0) -> Optional[tuple[str, ...]]:
+    """Collect a literal that each pattern's matches must contain.
+
+    Args:
+        patterns: Regex pattern strings.
+        flags: Regex flags the patterns are compiled with.
+
+    Returns:
+        Optional[tuple[str, ...]]: One literal per pattern, or None if
+            matching is case-insensitive or some pattern has no leading
+            literal.
+    """
+    if flags & re.IGNORECASE:
+        return None
+    
+    literals = []
+    for pattern in patterns:
+        try:
+            literal = _leading_literal(_sre_parse.parse(pattern, flags))
+        except Exception:
+            return None
+        if not literal:
+            return None
+        literals.append(literal)
+    return tuple(literals)
+
+
+def _first_chars(patterns: Sequence[str], flags: int = 0) -> Optional[str]:
+    """Collect the characters that matches of any pattern can start with.
+
+    Args:
+        patterns: Regex pattern strings.
+        flags: Regex flags the patterns are compiled with.
+
+    Returns:
+        Optional[str]: The possible first characters, sorted, or None if
+            any pattern's first characters cannot be determined.
+    """
+    chars = set()
+    for pattern in patterns:
+        try:
+            pattern_chars = _leading_chars(_sre_parse.parse(pattern, flags))
+        except Exception:
+            return None
+        if not pattern_chars:
+            return None
+        chars |= pattern_chars
+    return ''.join(sorted(chars))
+
+
+class MultiPatternScanner:
+    """
+    Finds the matches of many regex patterns in one pass over a text.
+
+    The combined regex is a zero-width gate that succeeds wherever any
+    pattern matches, followed by one optional lookahead capture per
+    pattern. Each match of the combined regex therefore reports all
+    patterns that match at that position.
+
+    Case-sensitive scanners first check that the text contains at least
+    one pattern's leading literal, and skip the scan if it does not.
+
+    Results are the same as running ``finditer`` for each pattern in turn:
+    a pattern's matches never overlap each other, though matches of
+    different patterns may. Patterns must not match the empty string or
+    use numbered backreferences.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        flags: int = 0,
+        first_chars: Optional[str] = None
+    ):
+        """Compile the pattern table.
+
+        Args:
+            patterns: Regex pattern strings, in priority order.
+            flags: Regex flags applied to every pattern.
+            first_chars: Optional set of characters that every match must
+                start with (subject to `flags`). Lets the scan skip other
+                positions cheaply. Derived from the patterns when omitted,
+                if they start with literal characters.
+        """
+        self.patterns = list(patterns)
+        if first_chars is None:
+            first_chars = _first_chars(self.patterns, flags)
+        
+        # Texts containing none of these can be skipped without scanning
+        self._literals = _required_literals(self.patterns, flags)
+
+        gate = '|'.join(f'(?:{p})' for p in self.patterns)
+        probes = ''.join(
+            f'(?:(?=(?P<_p{i}>{p})))?' for i, p in enumerate(self.patterns)
+        )
+        prefilter = f'(?=[{re.escape(first_chars)}])' if first_chars else ''
+
+        self._regex = re.compile(f'{prefilter}(?={gate}){probes}', flags)
+        self._groups = [self._regex.groupindex[f'_p{i}'] for i in range(len(self.patterns))]
+
+    @classmethod
+    def for_keywords(cls, keywords: Sequence[str], flags: int = 0) -> "MultiPatternScanner":
+        """Create a scanner for whole-word keyword phrases.
+
+        Each keyword matches as ``\\b<keyword>\\b``, like a word-bounded
+        regex of the escaped keyword.
+
+        Args:
+            keywords: Keyword phrases, in priority order.
+            flags: Regex flags applied to every keyword.
+
+        Returns:
+            MultiPatternScanner: Scanner whose pattern indices follow
+                the order of `keywords`.
+        """
+        return cls(
+            [rf'\b{re.escape(k)}\b' for k in keywords],
+            flags,
+            first_chars=''.join(sorted({k[0] for k in keywords if k}))
+        )
+
+    def scan(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Find all pattern matches in the text.
+
+        Args:
+            text: Text to scan.
+
+        Yields:
+            tuple[int, int, int]: (pattern_index, start, end) for each
+                match, ordered by start position and then pattern index.
+        """
+        literals = self._literals
+        if literals is not None and not any(literal in text for literal in literals):
+            return
+        
+        groups = self._groups
+        last_end = [0] * len(groups)
+
+        for match in self._regex.finditer(text):
+            start = match.start()
+            for index, group in enumerate(groups):
+                end = match.end(group)
+                # Skip unmatched probes and overlaps with the pattern's
+                # previous match, as finditer would
+                if end >= 0 and start >= last_end[index]:
+                    last_end[index] = end
+                    yield index, start, end
@@ -1,7 +1,12 @@
 """Reports module for generating summaries and visualizations."""
 
-from .summaries import ReportGenerator, GapSummary, ComplianceReport
-from .visualizations import Visualizer, HeatmapData
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .summaries import ReportGenerator, GapSummary, ComplianceReport
+    from .visualizations import Visualizer, HeatmapData
 
 __all__ = [
     "ReportGenerator",
@@ -10,3 +15,14 @@ __all__ = [
     "Visualizer",
     "HeatmapData",
 ]
+
+# Public names are imported from their submodules on first access (PEP 562)
+_EXPORTS = {
+    "ReportGenerator": ".summaries",
+    "GapSummary": ".summaries",
+    "ComplianceReport": ".summaries",
+    "Visualizer": ".visualizations",
+    "HeatmapData": ".visualizations",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -7,7 +7,9 @@ Generates structured reports that:
 - Provide actionable (but non-prescriptive) insights
 """
 
+import heapq
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Any
@@ -148,17 +150,13 @@ class ReportGenerator:
                 and the top N most severe gaps.
         """
         # Count by type
-        by_type: dict[str, int] = {}
-        for gap in gaps:
-            type_name = gap.gap_type.value
-            by_type[type_name] = by_type.get(type_name, 0) + 1
+        by_type: dict[str, int] = dict(Counter(g.gap_type.value for g in gaps))
         
         # Count high severity and review required
         high_severity = sum(1 for g in gaps if g.severity >= 0.7)
         requires_review = sum(1 for g in gaps if g.requires_legal_review)
         
         # Get top gaps by severity
-        sorted_gaps = sorted(gaps, key=lambda g: g.severity, reverse=True)
         top_gaps = [
             {
                 'type': g.gap_type.value,
@@ -166,7 +164,7 @@ class ReportGenerator:
                 'severity': g.severity,
                 'recommendations': g.recommendations[:2]  # Limit recommendations
             }
-            for g in sorted_gaps[:top_n]
+            for g in heapq.nlargest(top_n, gaps, key=lambda g: g.severity)
         ]
         
         return GapSummary(
@@ -280,8 +278,7 @@ class ReportGenerator:
             return {'message': 'No severity ratings available'}
         
         counts = {level.name: 0 for level in SeverityLevel}
-        for rating in ratings:
-            counts[rating.level.name] += 1
+        counts.update(Counter(r.level.name for r in ratings))
         
         total = len(ratings)
         avg_score = sum(r.score for r in ratings) / total
@@ -5,9 +5,10 @@ Creates heatmaps, rankings, and other visual representations
 of regulatory gaps and risks.
 """
 
+import heapq
 import json
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Iterable, Optional, Any
 
 from ..comparison.jurisdictional import JurisdictionalGap, GapType
 from ..comparison.ambiguity import AmbiguityInstance, AmbiguityType
@@ -197,7 +198,7 @@ class Visualizer:
     
     def generate_ambiguity_ranking(
         self,
-        ambiguities: list[AmbiguityInstance],
+        ambiguities: Iterable[AmbiguityInstance],
         top_n: int = 20
     ) -> RankingData:
         """Generate ranking of ambiguities by severity.
@@ -206,7 +207,7 @@ class Visualizer:
         formatted for ranking visualization.
 
         Args:
-            ambiguities: List of AmbiguityInstance objects to rank.
+            ambiguities: Iterable of AmbiguityInstance objects to rank.
             top_n: Maximum number of top items to include in the ranking.
                 Defaults to 20.
 
@@ -214,8 +215,8 @@ class Visualizer:
             RankingData: Ranking data structure containing sorted items
                 with name, value, category, confidence, and context fields.
         """
-        # Sort by severity
-        sorted_amb = sorted(ambiguities, key=lambda a: a.severity, reverse=True)[:top_n]
+        # Take the most severe, in descending order
+        sorted_amb = heapq.nlargest(top_n, ambiguities, key=lambda a: a.severity)
         
         items = [
             {
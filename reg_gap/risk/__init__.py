@@ -1,8 +1,13 @@
 """Risk assessment module for enforcement modeling and severity analysis."""
 
-from .enforcement_model import EnforcementModel, EnforcementScenario
-from .severity import SeverityAssessor, SeverityRating
-from .confidence_bounds import ConfidenceBounds, RiskInterval
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .enforcement_model import EnforcementModel, EnforcementScenario
+    from .severity import SeverityAssessor, SeverityRating
+    from .confidence_bounds import ConfidenceBounds, RiskInterval
 
 __all__ = [
     "EnforcementModel",
@@ -12,3 +17,15 @@ __all__ = [
     "ConfidenceBounds",
     "RiskInterval",
 ]
+
+# Public names are imported from their submodules on first access (PEP 562)
+_EXPORTS = {
+    "EnforcementModel": ".enforcement_model",
+    "EnforcementScenario": ".enforcement_model",
+    "SeverityAssessor": ".severity",
+    "SeverityRating": ".severity",
+    "ConfidenceBounds": ".confidence_bounds",
+    "RiskInterval": ".confidence_bounds",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
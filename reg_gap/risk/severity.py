@@ -5,6 +5,7 @@ Provides a consistent framework for rating the severity of
 identified regulatory issues.
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -403,8 +404,7 @@ class SeverityAssessor:
         
         # Count by level
         counts = {level: 0 for level in SeverityLevel}
-        for _, rating in ratings:
-            counts[rating.level] += 1
+        counts.update(Counter(rating.level for _, rating in ratings))
         
         return {
             'total_assessed': len(ratings),
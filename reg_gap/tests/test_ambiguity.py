@@ -3,6 +3,7 @@ Tests for ambiguity detection.
 """
 
 import pytest
+from reg_gap.comparison import ambiguity
 from reg_gap.comparison.ambiguity import AmbiguityDetector, AmbiguityType, AmbiguityInstance
 
 
@@ -49,6 +50,40 @@ class TestAmbiguityDetector:
         assert report.total_instances > 0
         # Should detect both 'material' and 'promptly'
     
+    def test_detect_overlapping_vague_standards(self, detector):
+        """Test that overlapping vague phrases are each detected.
+
+        Verifies that a phrase containing another vague keyword, such as
+        'commercially reasonable', reports both keywords at their own
+        positions, in position order.
+
+        Args:
+            detector: AmbiguityDetector fixture instance.
+        """
+        text = "The firm shall use commercially reasonable efforts."
+        report = detector.detect(text)
+        
+        vague = [
+            (i.text, i.position) for i in report.instances
+            if i.ambiguity_type == AmbiguityType.VAGUE_STANDARD
+        ]
+        assert vague == [("commercially reasonable", 19), ("reasonable", 32)]
+    
+    def test_vague_standard_positions_in_original_text(self, detector):
+        """Test vague standard positions after case-expanding characters.
+
+        Verifies that a character whose lowercase form is longer, such as
+        'İ', does not shift the reported position of a later keyword.
+
+        Args:
+            detector: AmbiguityDetector fixture instance.
+        """
+        text = "İstanbul branches shall act in good faith."
+        report = detector.detect(text)
+        
+        vague = [i for i in report.instances if i.ambiguity_type == AmbiguityType.VAGUE_STANDARD]
+        assert [(i.text, i.position) for i in vague] == [("good faith", text.index("good"))]
+    
     def test_detect_timing_unclear(self, detector):
         """Test detection of unclear timing requirements.
 
@@ -142,7 +177,72 @@ class TestAmbiguityDetector:
         # Should not flag "material change" as undefined
         for inst in undefined:
             assert inst.text.lower() != "material change"
-    
+
+    def test_defined_terms_per_call(self, detector):
+        """Test that defined terms can be supplied per detect call.
+
+        Verifies that a shared detector honors the defined_terms passed
+        to detect without retaining them for later documents.
+
+        Args:
+            detector: AmbiguityDetector fixture instance.
+        """
+        text = 'Firms must notify the "Covered Person" of any change.'
+
+        report = detector.detect(text, defined_terms={"covered person"})
+        undefined = [i for i in report.instances if i.ambiguity_type == AmbiguityType.UNDEFINED_TERM]
+        assert undefined == []
+
+        report = detector.detect(text)
+        undefined = [i for i in report.instances if i.ambiguity_type == AmbiguityType.UNDEFINED_TERM]
+        assert [i.text for i in undefined] == ["Covered Person"]
+
+    def test_detect_batch_matches_detect(self, detector):
+        """Test that batch detection matches per-document detection.
+
+        Verifies that detect_batch returns one report per text, in input
+        order, identical to calling detect on each text, both in-process
+        and across worker processes.
+
+        Args:
+            detector: AmbiguityDetector fixture instance.
+        """
+        texts = [
+            "The firm shall take reasonable steps promptly.",
+            "Significant transactions require review such as audits.",
+            'Notify the "Covered Person" without undue delay.',
+        ]
+        expected = [
+            detector.detect(text, document_id=f"doc{i}").to_dict()
+            for i, text in enumerate(texts)
+        ]
+        ids = [f"doc{i}" for i in range(len(texts))]
+
+        for num_workers in (1, 2):
+            reports = detector.detect_batch(texts, document_ids=ids, num_workers=num_workers)
+            assert [r.to_dict() for r in reports] == expected
+
+    def test_chunked_detect_matches_detect(self, detector, monkeypatch):
+        """Test that chunked parallel detection matches a single scan.
+
+        Verifies that splitting a text into chunks scanned on worker
+        processes finds the same instances, in the same order, including
+        matches that cross chunk boundaries.
+
+        Args:
+            detector: AmbiguityDetector fixture instance.
+            monkeypatch: Pytest fixture used to shrink the chunk size.
+        """
+        text = " ".join([
+            "The firm shall take commercially reasonable steps promptly,",
+            "including but not limited to material changes, as soon as practicable.",
+            'Significant "Covered Persons" must act in good faith from time to time.',
+        ] * 20)
+        expected = detector.detect(text).to_dict()
+
+        monkeypatch.setattr(ambiguity, "PARALLEL_CHUNK_SIZE", 100)
+        assert detector.detect(text, num_workers=2).to_dict() == expected
+
     def test_recommendations_generated(self, detector):
         """Test that recommendations are generated.
 
@@ -195,6 +295,21 @@ class TestAmbiguityDetector:
         positions = [i.position for i in report.instances]
         assert positions == sorted(positions)
     
+    def test_most_severe(self, detector):
+        """Test selecting the most severe instances of a report.
+
+        Verifies that most_severe returns the highest-severity instances
+        first, keeping position order among equal severities.
+
+        Args:
+            detector: AmbiguityDetector fixture instance.
+        """
+        text = "Act in good faith, take reasonable steps, and report material changes promptly."
+        report = detector.detect(text)
+        
+        expected = sorted(report.instances, key=lambda x: x.severity, reverse=True)[:3]
+        assert report.most_severe(3) == expected
+    
     def test_severity_threshold_filter(self):
         """Test severity threshold filtering.
 
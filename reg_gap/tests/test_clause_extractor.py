@@ -3,6 +3,7 @@ Tests for clause extraction.
 """
 
 import pytest
+from reg_gap.parsing import clause_extractor
 from reg_gap.parsing.clause_extractor import ClauseExtractor, ClauseType, RegulatoryClause
 
 
@@ -185,6 +186,29 @@ class TestClauseExtractor:
         assert ClauseType.OBLIGATION in grouped
         assert ClauseType.PROHIBITION in grouped
         assert ClauseType.PERMISSION in grouped
+    
+    def test_parallel_extract_matches_extract(self, extractor, monkeypatch):
+        """Test that chunked parallel extraction matches a single pass.
+
+        Verifies that extracting chunks of sentences on worker processes
+        returns the same clauses, in the same order and with the same
+        positions, as extracting in-process.
+
+        Args:
+            extractor: ClauseExtractor fixture instance.
+            monkeypatch: Pytest fixture used to shrink the chunk size.
+        """
+        text = " ".join([
+            "The registrant shall file reports annually unless exempt.",
+            "Ok.",
+            "No person may engage in fraud except as provided herein.",
+            "The Commission may grant extensions if the filer requests one.",
+        ] * 10)
+        expected = [c.to_dict() for c in extractor.extract(text, section_id="1")]
+
+        monkeypatch.setattr(clause_extractor, "PARALLEL_CHUNK_SIZE", 7)
+        clauses = extractor.extract(text, section_id="1", num_workers=2)
+        assert [c.to_dict() for c in clauses] == expected
 
 
 class TestRegulatoryClause:
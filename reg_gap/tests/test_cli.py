@@ -0,0 +1,292 @@
+"""
+Tests for the command-line interface.
+"""
+
+import json
+import os
+import pickle
+
+import pytest
+from reg_gap import cli
+from reg_gap.comparison.jurisdictional import JurisdictionalComparator
+from reg_gap.tests.test_comparison import REGULATIONS
+
+
+@pytest.fixture
+def documents(tmp_path):
+    """Write each synthetic regulation to its own text file.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    Returns:
+        tuple: (paths, jurisdictions) in REGULATIONS order.
+    """
+    paths = []
+    for jurisdiction, text in REGULATIONS.items():
+        path = tmp_path / f"{jurisdiction}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(str(path))
+    return paths, list(REGULATIONS)
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point the reg_gap cache at an empty temporary directory.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        Path: The temporary XDG_CACHE_HOME.
+    """
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+class _RaisesOnLoad:
+    """Pickles to a call that raises the given exception when unpickled."""
+
+    def __init__(self, call):
+        self.call = call
+
+    def __reduce__(self):
+        return self.call
+
+
+def _run(capsys, *argv):
+    """Run a CLI command and return its exit code and standard output."""
+    args = cli.create_parser().parse_args(list(argv))
+    code = cli.COMMANDS[args.command](args)
+    return code, capsys.readouterr().out
+
+
+def _report_dicts(results, gap_matrix):
+    """Convert `_process_and_compare` output to plain data for comparison."""
+    clauses = [[c.to_dict() for c in profile.clauses] for profile, _, _, _ in results]
+    gaps = {pair: [gap.to_dict() for gap in items] for pair, items in gap_matrix.items()}
+    return clauses, list(gap_matrix), gaps
+
+
+class TestReportWorkers:
+    """The pooled `report` path must match the serial one."""
+
+    def test_pooled_matches_serial(self, documents):
+        """Test that processing and comparing with two workers matches one.
+
+        Args:
+            documents: Document paths and jurisdictions fixture.
+        """
+        paths, jurisdictions = documents
+
+        serial = cli._process_and_compare(paths, jurisdictions, JurisdictionalComparator(), 1)
+        pooled = cli._process_and_compare(paths, jurisdictions, JurisdictionalComparator(), 2)
+
+        assert _report_dicts(*pooled) == _report_dicts(*serial)
+
+    def test_worker_count_defaults_to_available_cpus(self, monkeypatch):
+        """Test that the worker count follows the CPU affinity by default.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        monkeypatch.delenv("REG_GAP_WORKERS", raising=False)
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+
+        assert cli._worker_count(3) == 3
+        assert cli._worker_count(8) == 4
+
+        monkeypatch.setenv("REG_GAP_WORKERS", "1")
+        assert cli._worker_count(8) == 1
+
+    def test_default_report_matches_serial(self, documents, tmp_path, monkeypatch, capsys):
+        """Test that `report` on a multi-core host matches REG_GAP_WORKERS=1.
+
+        Args:
+            documents: Document paths and jurisdictions fixture.
+            tmp_path: Pytest temporary directory fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+            capsys: Pytest output capture fixture.
+        """
+        paths, jurisdictions = documents
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+        process_and_compare = cli._process_and_compare
+        worker_counts = []
+
+        def spy(documents, jurisdictions, comparator, workers):
+            worker_counts.append(workers)
+            return process_and_compare(documents, jurisdictions, comparator, workers)
+
+        monkeypatch.setattr(cli, "_process_and_compare", spy)
+
+        def run(name):
+            output = tmp_path / name
+            args = cli.create_parser().parse_args(
+                ["report", *paths, "-j", *jurisdictions, "-o", str(output), "-f", "json"]
+            )
+            assert cli.generate_report(args) == 0
+            report = json.loads(output.read_text(encoding="utf-8"))
+            del report["generated_at"]
+            return report
+
+        monkeypatch.setenv("REG_GAP_WORKERS", "1")
+        serial = run("serial.json")
+        monkeypatch.delenv("REG_GAP_WORKERS")
+        pooled = run("pooled.json")
+
+        assert worker_counts == [1, 2]
+        assert pooled == serial
+
+
+class TestDemoCache:
+    """The demo reuses its cached analysis and survives bad cache files."""
+
+    def test_second_run_uses_cache(self, cache_home, monkeypatch, capsys):
+        """Test that a second demo run is served from the cache unchanged.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+            capsys: Pytest output capture fixture.
+        """
+        code, first = _run(capsys, "demo")
+        assert code == 0
+        assert len(list((cache_home / "reg_gap").glob("demo_*.pkl"))) == 1
+
+        def fail(regulations):
+            raise AssertionError("demo analysis recomputed despite a cache entry")
+
+        monkeypatch.setattr(cli, "_analyze_demo", fail)
+
+        assert _run(capsys, "demo") == (0, first)
+
+    @pytest.mark.parametrize("contents", [
+        b"not a pickle",
+        pickle.dumps([1, 2]),
+        pickle.dumps(_RaisesOnLoad((int, ("not a number",)))),
+        pickle.dumps(_RaisesOnLoad((divmod, (1,)))),
+    ], ids=["garbage", "wrong-shape", "value-error", "type-error"])
+    def test_bad_cache_file_is_recomputed(self, cache_home, capsys, contents):
+        """Test that an unusable cache entry is replaced by a fresh analysis.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            capsys: Pytest output capture fixture.
+            contents: Bytes written over the cache entry.
+        """
+        code, expected = _run(capsys, "demo", "--no-cache")
+        assert code == 0
+
+        _run(capsys, "demo")
+        (cache_path,) = (cache_home / "reg_gap").glob("demo_*.pkl")
+        cache_path.write_bytes(contents)
+
+        assert _run(capsys, "demo") == (0, expected)
+        assert cli._read_demo_cache(cache_path) is not None
+
+
+class TestAnalyzeCache:
+    """`analyze` caches results by document content and package version."""
+
+    @pytest.fixture
+    def document(self, documents):
+        """Return the path of one synthetic regulation.
+
+        Args:
+            documents: Document paths and jurisdictions fixture.
+
+        Returns:
+            str: Path to the US-SEC regulation.
+        """
+        return documents[0][0]
+
+    @staticmethod
+    def _entries(cache_home):
+        """List the analyze cache entries under `cache_home`."""
+        return list((cache_home / "reg_gap" / "analyze").glob("*.json"))
+
+    def test_second_run_uses_cache(self, document, cache_home, monkeypatch, capsys):
+        """Test that a second analyze run returns identical cached output.
+
+        Args:
+            document: Document path fixture.
+            cache_home: Temporary cache directory fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+            capsys: Pytest output capture fixture.
+        """
+        code, first = _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json")
+        assert code == 0
+        assert len(self._entries(cache_home)) == 1
+
+        def fail(content, document, jurisdiction):
+            raise AssertionError("analysis recomputed despite a cache entry")
+
+        monkeypatch.setattr(cli, "_build_analysis", fail)
+
+        assert _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json") == (0, first)
+
+    def test_no_cache_bypasses_cache(self, document, cache_home, capsys):
+        """Test that --no-cache neither reads nor writes cache entries.
+
+        Args:
+            document: Document path fixture.
+            cache_home: Temporary cache directory fixture.
+            capsys: Pytest output capture fixture.
+        """
+        code, expected = _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json", "--no-cache")
+        assert code == 0
+        assert self._entries(cache_home) == []
+
+        _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json")
+        (entry,) = self._entries(cache_home)
+        stale = json.loads(entry.read_text(encoding="utf-8"))
+        stale["jurisdiction"] = "STALE"
+        entry.write_text(json.dumps(stale), encoding="utf-8")
+
+        assert _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json", "--no-cache") == (0, expected)
+        assert json.loads(entry.read_text(encoding="utf-8")) == stale
+
+    def test_no_cache_skips_document_cache(self, tmp_path, cache_home, capsys):
+        """Test that --no-cache also ignores the parsed-document cache.
+
+        Args:
+            tmp_path: Pytest temporary directory fixture.
+            cache_home: Temporary cache directory fixture.
+            capsys: Pytest output capture fixture.
+        """
+        document = tmp_path / "rule.html"
+        document.write_text(
+            "<html><body><p>Firms must retain records for 5 years.</p></body></html>",
+            encoding="utf-8"
+        )
+        _run(capsys, "analyze", str(document), "-j", "US-SEC", "-f", "json")
+        (entry,) = (cache_home / "reg_gap" / "documents").glob("*.pkl")
+        cached = pickle.loads(entry.read_bytes())
+        cached.content = "Firms shall not trade. Firms shall not advertise."
+        entry.write_bytes(pickle.dumps(cached))
+
+        code, output = _run(capsys, "analyze", str(document), "-j", "US-SEC", "-f", "json", "--no-cache")
+
+        assert code == 0
+        assert '"obligations": 1' in output
+        assert '"prohibitions": 0' in output
+
+    @pytest.mark.parametrize("contents", ["{not json", "[]", "\udcff"], ids=["garbage", "not-a-dict", "bad-utf8"])
+    def test_unreadable_entry_is_recomputed(self, document, cache_home, capsys, contents):
+        """Test that an unusable cache entry is replaced by a fresh analysis.
+
+        Args:
+            document: Document path fixture.
+            cache_home: Temporary cache directory fixture.
+            capsys: Pytest output capture fixture.
+            contents: Text written over the cache entry.
+        """
+        code, expected = _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json")
+        assert code == 0
+        (entry,) = self._entries(cache_home)
+        entry.write_bytes(contents.encode("utf-8", "surrogateescape"))
+
+        assert _run(capsys, "analyze", document, "-j", "US-SEC", "-f", "json") == (0, expected)
+        assert cli._read_cached_results(entry) is not None
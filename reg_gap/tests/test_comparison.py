@@ -0,0 +1,249 @@
+"""
+Tests for semantic diff and jurisdictional comparison.
+"""
+
+import multiprocessing
+import pickle
+import random
+
+import numpy as np
+import pytest
+from reg_gap.parsing.clause_extractor import ClauseExtractor
+from reg_gap.parsing.definitions import DefinitionExtractor
+from reg_gap.comparison.jurisdictional import JurisdictionalComparator, JurisdictionProfile
+from reg_gap.comparison import semantic_diff
+from reg_gap.comparison.semantic_diff import (
+    SemanticDiff,
+    _jaccard,
+    _pairwise_jaccard,
+    _prefix_filtered_jaccard,
+)
+
+
+REGULATIONS = {
+    "US-SEC": """
+    "Covered Person" means any registered broker-dealer or investment adviser.
+    Every covered person shall provide written disclosure of all material
+    conflicts of interest to customers within 30 days of discovery.
+    No covered person shall engage in any transaction that creates a material
+    conflict of interest without prior written consent from the customer.
+    All covered persons must maintain adequate records for 5 years.
+    """,
+    "EU-MiFID": """
+    "Investment Firm" shall mean any legal person that provides investment services.
+    Investment firms are required to disclose all significant conflicts of
+    interest to clients without delay.
+    Investment firms must not enter into transactions creating conflicts
+    unless the client has provided informed consent in advance.
+    Firms shall maintain comprehensive records for a minimum period of 7 years.
+    """,
+    "UK-FCA": """
+    "Firm" means an authorised person carrying on regulated activities.
+    A firm should take reasonable steps to identify conflicts of interest.
+    A firm may provide additional disclosures where appropriate.
+    Firms must retain records of client communications for 5 years.
+    """,
+}
+
+
+def _letter_embedding(text):
+    """Embed text as its letter counts, a cheap picklable embedding model."""
+    counts = np.zeros(26, dtype=np.float32)
+    for char in text.lower():
+        if "a" <= char <= "z":
+            counts[ord(char) - ord("a")] += 1
+    return counts
+
+
+@pytest.fixture
+def profiles():
+    """Create one jurisdiction profile per synthetic regulation.
+
+    Returns:
+        list[JurisdictionProfile]: Profiles with extracted clauses and
+            definitions, in REGULATIONS order.
+    """
+    clause_extractor = ClauseExtractor()
+    definition_extractor = DefinitionExtractor()
+    return [
+        JurisdictionProfile(
+            jurisdiction=jurisdiction,
+            clauses=clause_extractor.extract(text),
+            definitions=definition_extractor.extract(text, jurisdiction=jurisdiction)
+        )
+        for jurisdiction, text in REGULATIONS.items()
+    ]
+
+
+def _gap_dicts(matrix):
+    """Convert a gap matrix to plain dictionaries for comparison."""
+    return {pair: [gap.to_dict() for gap in gaps] for pair, gaps in matrix.items()}
+
+
+class TestPickling:
+    """Comparators are sent to worker processes, so they must pickle."""
+    
+    def test_used_semantic_diff_round_trips(self, profiles):
+        """Test that a SemanticDiff with filled caches survives pickling.
+
+        Args:
+            profiles: Jurisdiction profile fixture.
+        """
+        diff = SemanticDiff(cache_size=4)
+        expected = [d.to_dict() for d in diff.compare_clauses(profiles[0].clauses, profiles[1].clauses)]
+        
+        assert diff._prep_cache
+        
+        restored = pickle.loads(pickle.dumps(diff))
+        
+        assert restored._prep_cache.maxsize == 4
+        assert list(restored._prep_cache) == list(diff._prep_cache)
+        result = restored.compare_clauses(profiles[0].clauses, profiles[1].clauses)
+        assert [d.to_dict() for d in result] == expected
+    
+    def test_used_comparator_round_trips(self, profiles):
+        """Test that a JurisdictionalComparator survives pickling after use.
+
+        Args:
+            profiles: Jurisdiction profile fixture.
+        """
+        comparator = JurisdictionalComparator()
+        expected = _gap_dicts(comparator.generate_gap_matrix(profiles))
+        
+        restored = pickle.loads(pickle.dumps(comparator))
+        
+        assert _gap_dicts(restored.generate_gap_matrix(profiles)) == expected
+
+
+class TestGapMatrixWorkers:
+    """The pooled gap matrix must match the in-process one."""
+    
+    def test_spawned_workers_match_serial(self, profiles):
+        """Test that workers started with spawn produce the serial matrix.
+
+        Spawned workers receive the comparator, profiles, and features by
+        pickling rather than by inheriting them through fork.
+
+        Args:
+            profiles: Jurisdiction profile fixture.
+        """
+        comparator = JurisdictionalComparator()
+        expected = _gap_dicts(comparator.generate_gap_matrix(profiles))
+        
+        result = comparator.generate_gap_matrix(
+            profiles,
+            num_workers=2,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        
+        assert list(result) == list(expected)
+        assert _gap_dicts(result) == expected
+    
+    @pytest.mark.parametrize("embedding_model", [None, _letter_embedding], ids=["keywords", "embeddings"])
+    def test_spawned_stream_matches_serial(self, profiles, embedding_model):
+        """Test that pairs streamed from spawned workers match the serial ones.
+
+        Covers both kinds of clause features shipped to the workers:
+        keyword sets and embedding matrices.
+
+        Args:
+            profiles: Jurisdiction profile fixture.
+            embedding_model: Embedding model for the comparator, or None
+                for keyword similarity.
+        """
+        comparator = JurisdictionalComparator(SemanticDiff(embedding_model=embedding_model))
+        expected = [
+            (pair, [gap.to_dict() for gap in gaps])
+            for pair, gaps in comparator.iter_gap_matrix(profiles)
+        ]
+        
+        stream = comparator.iter_gap_matrix(
+            profiles,
+            num_workers=2,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        
+        assert [(pair, [gap.to_dict() for gap in gaps]) for pair, gaps in stream] == expected
+
+
+def _random_word_sets(rng, count, vocabulary):
+    """Draw word sets with a skewed word frequency, including empty sets."""
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    return [
+        frozenset(rng.choices(vocabulary, weights, k=rng.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+class TestKeywordBlocking:
+    """Prefix-filtered keyword similarity finds every pair above the threshold."""
+    
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("threshold", [0.05, 0.3, 0.5, 0.7, 0.85, 1.0])
+    def test_prefix_filter_matches_exact_jaccard(self, seed, threshold):
+        """Test that every pair reaching the threshold gets its exact similarity.
+
+        Args:
+            seed: Random seed.
+            threshold: Similarity threshold.
+        """
+        rng = random.Random(seed)
+        vocabulary = [f"w{i}" for i in range(rng.choice([5, 20, 80]))]
+        words_a = _random_word_sets(rng, 40, vocabulary)
+        # Near-duplicates of the first side give pairs at high thresholds
+        words_b = _random_word_sets(rng, 30, vocabulary) + [
+            words | {rng.choice(vocabulary)} for words in words_a[:10]
+        ]
+        
+        exact = _pairwise_jaccard(words_a, words_b)
+        filtered = _prefix_filtered_jaccard(words_a, words_b, threshold)
+        
+        for i, a in enumerate(words_a):
+            for j, b in enumerate(words_b):
+                assert exact[i, j] == _jaccard(a, b)
+                if exact[i, j] >= threshold:
+                    assert filtered[i, j] == exact[i, j]
+                else:
+                    assert filtered[i, j] in (0.0, exact[i, j])
+        assert (exact >= threshold).any()
+    
+    def test_compare_prepared_with_blocking_matches_bulk(self, monkeypatch):
+        """Test that forcing the blocked path leaves clause matches unchanged.
+
+        Args:
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        rng = random.Random(0)
+        subjects = ["Firms", "Brokers", "Advisers", "Banks"]
+        actions = ["report", "disclose", "record", "retain", "publish", "review"]
+        objects = ["trades", "conflicts", "fees", "complaints", "holdings", "orders"]
+        extractor = ClauseExtractor()
+        
+        def regulation():
+            return "\n".join(
+                f"{rng.choice(subjects)} shall {rng.choice(actions)} all "
+                f"{rng.choice(objects)} and {rng.choice(objects)} within {rng.randint(1, 9)} days."
+                for _ in range(40)
+            )
+        
+        clauses_a = extractor.extract(regulation())
+        clauses_b = extractor.extract(regulation())
+        
+        def matches():
+            diff = SemanticDiff()
+            return [d.to_dict() for d in diff.compare_clauses(clauses_a, clauses_b)]
+        
+        expected = matches()
+        calls = []
+        prefix_filtered = semantic_diff._prefix_filtered_jaccard
+        
+        def spy(words_a, words_b, threshold):
+            calls.append(threshold)
+            return prefix_filtered(words_a, words_b, threshold)
+        
+        monkeypatch.setattr(semantic_diff, "BLOCKING_MIN_PAIRS", 1)
+        monkeypatch.setattr(semantic_diff, "_prefix_filtered_jaccard", spy)
+        
+        assert matches() == expected
+        assert calls
+        assert any(d["clause_b"] is not None for d in expected)
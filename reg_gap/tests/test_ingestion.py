@@ -0,0 +1,541 @@
+"""
+Tests for document loading and text normalization.
+"""
+
+import mmap
+import os
+import pickle
+import random
+import re
+from concurrent import futures
+
+import pytest
+from reg_gap.ingestion import loaders
+from reg_gap.ingestion.loaders import HTMLLoader, UniversalLoader
+from reg_gap.ingestion.normalizer import Section, SectionTable, TextNormalizer
+
+
+HTML = """<html><head><title>Rule</title><style>p { color: red; }</style></head>
+<body><h1>Section 1. Disclosure</h1>
+<p>Every covered person shall disclose all material conflicts of interest.</p>
+<script>var tracking = true;</script>
+<p>Records must be retained for 5 years.</p></body></html>
+"""
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point the reg_gap cache at an empty temporary directory.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        Path: The temporary XDG_CACHE_HOME.
+    """
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def html_file(tmp_path):
+    """Write a small HTML regulation.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    Returns:
+        Path: Path to the HTML file.
+    """
+    path = tmp_path / "rule.html"
+    path.write_text(HTML, encoding="utf-8")
+    return path
+
+
+class _RaisesOnLoad:
+    """Pickles to a call that raises when unpickled."""
+
+    def __init__(self, call):
+        self.call = call
+
+    def __reduce__(self):
+        return self.call
+
+
+class TestHTMLLoader:
+    """HTMLLoader hands lxml the file's bytes rather than a decoded str."""
+
+    @pytest.mark.parametrize("threshold", [loaders.MMAP_THRESHOLD, 1], ids=["read", "mmap"])
+    def test_lxml_parses_raw_bytes(self, html_file, monkeypatch, threshold):
+        """Test that lxml receives bytes or a memory map and matches BeautifulSoup.
+
+        Args:
+            html_file: HTML document fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+            threshold: Size at which files are memory-mapped.
+        """
+        monkeypatch.setattr(loaders, "MMAP_THRESHOLD", threshold)
+        extract_lxml = HTMLLoader._extract_lxml.__func__
+        received = []
+
+        def spy(cls, html_bytes):
+            received.append(type(html_bytes))
+            return extract_lxml(cls, html_bytes)
+
+        monkeypatch.setattr(HTMLLoader, "_extract_lxml", classmethod(spy))
+
+        doc = HTMLLoader().load(str(html_file), "US-SEC")
+
+        assert received == [bytes if threshold > 1 else mmap.mmap]
+        assert doc.content == HTMLLoader()._extract_soup(HTML)
+        assert "tracking" not in doc.content
+        assert "Records must be retained for 5 years." in doc.content.splitlines()
+
+    def test_crlf_matches_lf(self, tmp_path, html_file):
+        """Test that CRLF line endings extract the same text as LF.
+
+        Args:
+            tmp_path: Pytest temporary directory fixture.
+            html_file: HTML document fixture.
+        """
+        crlf_file = tmp_path / "crlf.html"
+        crlf_file.write_bytes(HTML.replace("\n", "\r\n").encode("utf-8"))
+
+        assert HTMLLoader().load(str(crlf_file), "US-SEC").content == (
+            HTMLLoader().load(str(html_file), "US-SEC").content
+        )
+
+    def test_fallback_decodes_bytes(self, html_file, monkeypatch):
+        """Test that the BeautifulSoup fallback still receives decoded text.
+
+        Args:
+            html_file: HTML document fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        expected = HTMLLoader().load(str(html_file), "US-SEC").content
+
+        def no_lxml(cls, html_bytes):
+            raise ImportError("lxml")
+
+        monkeypatch.setattr(HTMLLoader, "_extract_lxml", classmethod(no_lxml))
+
+        assert HTMLLoader().load(str(html_file), "US-SEC").content == expected
+
+
+class TestDocumentCache:
+    """UniversalLoader keeps parsed documents in an on-disk cache."""
+
+    @staticmethod
+    def _entries(cache_home):
+        """List the document cache entries under `cache_home`."""
+        return sorted((cache_home / "reg_gap" / "documents").glob("*.pkl"))
+
+    def test_unchanged_file_is_served_from_cache(self, cache_home, html_file, monkeypatch):
+        """Test that a second load of an unchanged file skips the parser.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            html_file: HTML document fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        first = UniversalLoader().load(str(html_file), "US-SEC")
+        assert len(self._entries(cache_home)) == 1
+
+        def fail(self, path, jurisdiction, **kwargs):
+            raise AssertionError("document parsed again despite a cache entry")
+
+        monkeypatch.setattr(HTMLLoader, "load", fail)
+
+        second = UniversalLoader().load(str(html_file), "EU-MiFID", version="2.0")
+        assert second.content == first.content
+        assert second.jurisdiction == "EU-MiFID"
+        assert second.version == "2.0"
+
+    def test_modified_file_is_parsed_again(self, cache_home, html_file):
+        """Test that a new modification time misses and prunes the old entry.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            html_file: HTML document fixture.
+        """
+        UniversalLoader().load(str(html_file), "US-SEC")
+        (old_entry,) = self._entries(cache_home)
+
+        html_file.write_text(HTML.replace("5 years", "7 years"), encoding="utf-8")
+        stat = html_file.stat()
+        os.utime(html_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        doc = UniversalLoader().load(str(html_file), "US-SEC")
+        assert "7 years" in doc.content
+        (new_entry,) = self._entries(cache_home)
+        assert new_entry != old_entry
+
+    def test_no_cache_neither_reads_nor_writes(self, cache_home, html_file):
+        """Test that use_cache=False leaves the cache alone.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            html_file: HTML document fixture.
+        """
+        UniversalLoader(use_cache=False).load(str(html_file), "US-SEC")
+        assert self._entries(cache_home) == []
+
+    @pytest.mark.parametrize("contents", [
+        b"",
+        b"not a pickle",
+        pickle.dumps("not a document"),
+        pickle.dumps(_RaisesOnLoad((int, ("not a number",)))),
+        pickle.dumps(_RaisesOnLoad((divmod, (1,)))),
+        pickle.dumps(_RaisesOnLoad((bytes.decode, (b"\xff", "utf-8")))),
+    ], ids=["empty", "garbage", "wrong-type", "value-error", "type-error", "decode-error"])
+    def test_corrupt_entry_is_replaced(self, cache_home, html_file, contents):
+        """Test that an unusable cache entry is parsed again and rewritten.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            html_file: HTML document fixture.
+            contents: Bytes written over the cache entry.
+        """
+        expected = UniversalLoader().load(str(html_file), "US-SEC").content
+        (entry,) = self._entries(cache_home)
+        entry.write_bytes(contents)
+
+        assert UniversalLoader().load(str(html_file), "US-SEC").content == expected
+        assert pickle.loads(entry.read_bytes()).content == expected
+
+    def test_corrupted_bytes_never_escape(self, cache_home, html_file):
+        """Test that byte-level damage anywhere in an entry is a cache miss.
+
+        Args:
+            cache_home: Temporary cache directory fixture.
+            html_file: HTML document fixture.
+        """
+        expected = UniversalLoader().load(str(html_file), "US-SEC").content
+        (entry,) = self._entries(cache_home)
+        original = entry.read_bytes()
+
+        for position in range(0, len(original), max(1, len(original) // 64)):
+            for value in (0x00, 0x7f, 0xff):
+                damaged = bytearray(original)
+                damaged[position] = value
+                entry.write_bytes(bytes(damaged))
+                doc = UniversalLoader().load(str(html_file), "US-SEC")
+                assert doc.content
+                entry.write_bytes(original)
+
+        assert UniversalLoader().load(str(html_file), "US-SEC").content == expected
+
+
+def _sequential_citations(normalizer, text):
+    """Apply each citation pattern in turn, as a plain ``re.sub`` chain."""
+    for pattern, replacement in normalizer.CITATION_PATTERNS:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+class TestCitations:
+    """Citation normalization matches one ``re.sub`` per pattern."""
+
+    def test_builtin_single_pass_matches_sequential(self):
+        """Test the single-pass rewrite on random runs of citation fragments."""
+        normalizer = TextNormalizer()
+        assert normalizer._citation_patterns[1] is not None
+
+        fragments = ["U.S.C.", "C.F.R.", "Fed. Reg.", "Fed.Reg.", "S.E.C.", "U.S.", "F.R.",
+                     "C.", ".", " ", "x", "15 ", "\n", "USC"]
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 8)))
+            assert normalizer._normalize_citations(text) == _sequential_citations(normalizer, text)
+
+    def test_overridden_patterns_apply_in_turn(self):
+        """Test that a later pattern can match across an earlier replacement."""
+
+        class Chained(TextNormalizer):
+            CITATION_PATTERNS = [('ab', 'X'), ('cX', 'Y')]
+
+        normalizer = Chained()
+
+        assert normalizer._citation_patterns[1] is None
+        assert normalizer._normalize_citations('cab') == 'Y'
+        assert normalizer._normalize_citations('cab ab') == _sequential_citations(normalizer, 'cab ab')
+
+
+def _rules(count):
+    """Build raw text of `count` sections, each one paragraph long."""
+    return [
+        f"Section {i}. Rule {i}\nEvery   firm shall report item {i} within {i} days.\n\n"
+        for i in range(1, count + 1)
+    ]
+
+
+class TestIterNormalize:
+    """TextNormalizer.iter_normalize streams a long text piece by piece."""
+
+    def test_splits_at_paragraph_breaks(self):
+        """Test that pieces end at the last blank line of the buffer."""
+        raw = "".join(_rules(8))
+
+        chunks = [raw[i:i + 50] for i in range(0, len(raw), 50)]
+
+        pieces = list(TextNormalizer().iter_normalize(chunks, chunk_size=120))
+
+        assert len(pieces) > 1
+        assert "".join(piece.original for piece in pieces) == raw
+        assert all(piece.original.startswith("\n\n") for piece in pieces[1:])
+
+    def test_falls_back_to_line_breaks(self):
+        """Test that a buffer without blank lines splits at its last newline."""
+        raw = "".join(f"Every firm shall report item {i}.\n" for i in range(20))
+
+        pieces = list(TextNormalizer().iter_normalize(raw.splitlines(keepends=True), chunk_size=100))
+
+        assert len(pieces) > 1
+        assert "".join(piece.original for piece in pieces) == raw
+        assert all(piece.original.startswith("\n") for piece in pieces[1:])
+        assert all(not piece.original.endswith("\n") for piece in pieces[:-1])
+
+    def test_without_newlines_buffers_until_the_end(self):
+        """Test that text with no line break is normalized in one final piece."""
+        words = [f"word{i} " for i in range(100)]
+
+        (piece,) = TextNormalizer().iter_normalize(words, chunk_size=10)
+
+        assert piece.normalized == TextNormalizer().normalize("".join(words)).normalized
+
+    def test_final_flush(self):
+        """Test that text left in the buffer is normalized when input ends."""
+        raw = "".join(_rules(3)) + "Trailing text without a newline"
+
+        pieces = list(TextNormalizer().iter_normalize([raw], chunk_size=1 << 20))
+
+        assert [piece.normalized for piece in pieces] == [TextNormalizer().normalize(raw).normalized]
+        assert pieces[-1].normalized.endswith("Trailing text without a newline")
+
+    def test_skips_empty_pieces(self):
+        """Test that whitespace-only pieces are dropped without moving offsets."""
+        chunks = ["Section 1. One\nFirms shall report.\n\n", "   \n\n \t \n\n",
+                  "Section 2. Two\nFirms must comply.\n\n"]
+
+        pieces = list(TextNormalizer().iter_normalize(chunks, chunk_size=1))
+
+        assert [piece.normalized for piece in pieces] == [
+            "Section 1. One\nFirms shall report.",
+            "Section 2. Two\nFirms must comply.",
+        ]
+        assert pieces[1].sections.starts[0] == len(pieces[0].normalized) + 1
+
+    @pytest.mark.parametrize("chunk_size", [1, 64, 150, 1 << 20])
+    def test_sections_match_whole_document(self, chunk_size):
+        """Test that streamed sections match normalizing the joined pieces.
+
+        Args:
+            chunk_size: Raw characters to buffer before normalizing.
+        """
+        normalizer = TextNormalizer()
+
+        pieces = list(normalizer.iter_normalize(_rules(12), chunk_size=chunk_size))
+        joined = "\n\n".join(piece.normalized for piece in pieces)
+        whole = normalizer.normalize(joined)
+
+        assert joined == normalizer.normalize("".join(_rules(12))).normalized
+        assert [s.as_dict() for piece in pieces for s in piece.sections] == whole.sections.to_dicts()
+
+
+class TestSectionTable:
+    """Extracted sections still read like the section dictionaries they replaced."""
+
+    @pytest.fixture
+    def normalized(self):
+        """Normalize three sections, the second with a long body.
+
+        Returns:
+            NormalizedText: The normalized text.
+        """
+        body = " ".join(f"Firms shall report item {i}." for i in range(60))
+        raw = (
+            "Section 1. Scope\nThis rule applies to brokers.\n\n"
+            f"Section 2. Reporting\n{body}\n\n"
+            "Section 3. Records\nRecords must be kept for 5 years."
+        )
+        return TextNormalizer().normalize(raw)
+
+    @staticmethod
+    def _as_dicts(sections):
+        """Build the section dictionaries the table used to hold."""
+        return [
+            {
+                "id": section.id,
+                "start": section.start,
+                "end": section.end,
+                "content": section.content,
+                "full_content": section.full_content,
+            }
+            for section in sections
+        ]
+
+    def test_section_reads_as_mapping(self, normalized):
+        """Test key access, iteration order, and unknown keys.
+
+        Args:
+            normalized: Normalized text fixture.
+        """
+        section = normalized.sections[0]
+
+        assert isinstance(section, Section)
+        assert section["id"] == "1"
+        assert section["content"] == ". Scope\nThis rule applies to brokers."
+        assert list(section) == ["id", "start", "end", "content", "full_content"]
+        assert dict(section) == section.as_dict()
+        assert section.get("missing") is None
+        with pytest.raises(KeyError):
+            section["missing"]
+
+    def test_content_is_a_truncated_preview(self, normalized):
+        """Test that content truncates to 500 characters and full_content does not.
+
+        Args:
+            normalized: Normalized text fixture.
+        """
+        short, long = normalized.sections[0], normalized.sections[1]
+
+        assert short["content"] == short["full_content"]
+        assert len(long["full_content"]) > 500
+        assert long["content"] == long["full_content"][:500] + "..."
+
+    def test_equals_list_of_dicts(self, normalized):
+        """Test comparison with the list of dictionaries it replaced.
+
+        Args:
+            normalized: Normalized text fixture.
+        """
+        sections = normalized.sections
+        dicts = self._as_dicts(sections)
+
+        assert len(sections) == 3
+        assert sections == dicts
+        assert dicts == sections
+        assert sections != dicts[:2]
+        assert sections.to_dicts() == dicts
+        assert all(type(d) is dict for d in sections.to_dicts())
+
+    def test_slicing(self, normalized):
+        """Test that slices return lists of the same sections.
+
+        Args:
+            normalized: Normalized text fixture.
+        """
+        sections = normalized.sections
+
+        assert sections[1:] == [sections[1], sections[2]]
+        assert sections[::-1] == list(reversed(list(sections)))
+        assert sections[-1] is sections[2]
+        assert sections[5:] == []
+
+    def test_pickles_as_list(self, normalized):
+        """Test that the table and its NormalizedText survive pickling.
+
+        Args:
+            normalized: Normalized text fixture.
+        """
+        restored = pickle.loads(pickle.dumps(normalized))
+
+        assert type(restored.sections) is list
+        assert restored.sections == normalized.sections
+        assert restored.sections[1]["content"] == normalized.sections[1]["content"]
+
+    def test_offset_shifts_positions_only(self, normalized):
+        """Test that an offset moves starts, ends, and sections but not content.
+
+        Args:
+            normalized: Normalized text fixture.
+        """
+        normalizer = TextNormalizer()
+        plain = normalizer._extract_sections(normalized.normalized)
+        shifted = normalizer._extract_sections(normalized.normalized, offset=1000)
+
+        assert isinstance(shifted, SectionTable)
+        assert list(shifted.starts) == [start + 1000 for start in plain.starts]
+        assert list(shifted.ends) == [end + 1000 for end in plain.ends]
+        assert [s.start for s in shifted] == [s.start + 1000 for s in plain]
+        assert [s.end for s in shifted] == [s.end + 1000 for s in plain]
+        assert [s.full_content for s in shifted] == [s.full_content for s in plain]
+        assert list(plain.starts) == [s["start"] for s in normalized.sections]
+        assert plain.ends[-1] == len(normalized.normalized)
+
+
+class TestIterDirectory:
+    """UniversalLoader.iter_directory loads a directory in a process pool."""
+
+    @pytest.fixture
+    def directory(self, tmp_path):
+        """Write a directory of text regulations, one of them not valid UTF-8.
+
+        Args:
+            tmp_path: Pytest temporary directory fixture.
+
+        Returns:
+            tuple: (directory, path of the unreadable file).
+        """
+        directory = tmp_path / "regulations"
+        (directory / "nested").mkdir(parents=True)
+        for i in range(6):
+            folder = directory / "nested" if i % 2 else directory
+            (folder / f"rule{i}.txt").write_text(f"Rule {i}. Firms shall report item {i}.", encoding="utf-8")
+        broken = directory / "broken.txt"
+        broken.write_bytes(b"Firms shall \xff\xfe report.")
+        (directory / "notes.csv").write_text("ignored", encoding="utf-8")
+        return directory, broken
+
+    def test_pool_matches_serial_and_skips_failures(self, directory, capsys):
+        """Test input order and the warning for a file that fails to load.
+
+        Args:
+            directory: Document directory fixture.
+            capsys: Pytest output capture fixture.
+        """
+        directory, broken = directory
+        loader = UniversalLoader(use_cache=False)
+
+        serial = loader.load_directory(str(directory), "US-SEC")
+        serial_output = capsys.readouterr().out
+        pooled = list(loader.iter_directory(str(directory), "US-SEC", num_workers=2))
+        pooled_output = capsys.readouterr().out
+
+        assert len(serial) == 6
+        assert [doc.source_path for doc in pooled] == [doc.source_path for doc in serial]
+        assert [doc.content for doc in pooled] == [doc.content for doc in serial]
+        assert pooled_output == serial_output
+        assert pooled_output.startswith(f"Warning: Failed to load {broken}: ")
+
+    def test_stopping_early_cancels_remaining_loads(self, tmp_path, monkeypatch):
+        """Test that closing the iterator cancels loads that have not started.
+
+        Args:
+            tmp_path: Pytest temporary directory fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        for i in range(40):
+            (tmp_path / f"rule{i:02d}.txt").write_text(
+                f"Rule {i}. Firms shall report item {i}.\n" * 2000, encoding="utf-8"
+            )
+        submitted = []
+
+        class RecordingExecutor(futures.ProcessPoolExecutor):
+            def submit(self, *args, **kwargs):
+                future = super().submit(*args, **kwargs)
+                submitted.append(future)
+                return future
+
+        monkeypatch.setattr(futures, "ProcessPoolExecutor", RecordingExecutor)
+
+        documents = UniversalLoader(use_cache=False).iter_directory(str(tmp_path), "US-SEC", num_workers=2)
+        first = next(documents)
+        documents.close()
+
+        assert first.source_path == str(next(tmp_path.rglob("*.txt")))
+        assert len(submitted) == 40
+        assert any(future.cancelled() for future in submitted)
+        assert all(future.done() for future in submitted)
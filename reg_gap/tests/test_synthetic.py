@@ -5,6 +5,7 @@ Tests with synthetic regulations containing known conflicts.
 import pytest
 from reg_gap.parsing.clause_extractor import ClauseExtractor, ClauseType
 from reg_gap.parsing.definitions import DefinitionExtractor
+from reg_gap.parsing.fused import FusedPipeline
 from reg_gap.comparison.jurisdictional import (
     JurisdictionalComparator, 
     JurisdictionProfile,
@@ -164,6 +165,38 @@ class TestSyntheticRegulations:
         # This tests the mechanism works
         assert isinstance(conflicts, list)
     
+    def test_fused_pipeline_matches_extractors(
+        self, strict_regulation, clause_extractor, definition_extractor
+    ):
+        """Test that the fused pipeline matches the individual extractors.
+
+        Verifies that FusedPipeline returns the same clauses and definitions
+        as running each extractor directly, and that the terms it defines
+        are not reported as undefined.
+
+        Args:
+            strict_regulation: Strict regulation text fixture.
+            clause_extractor: ClauseExtractor fixture instance.
+            definition_extractor: DefinitionExtractor fixture instance.
+        """
+        clauses, definitions, report = FusedPipeline().run(
+            strict_regulation, source_document="strict", jurisdiction="US"
+        )
+        
+        expected_definitions = definition_extractor.extract(
+            strict_regulation, source_document="strict", jurisdiction="US"
+        )
+        assert [c.to_dict() for c in clauses] == [
+            c.to_dict() for c in clause_extractor.extract(strict_regulation)
+        ]
+        assert [d.to_dict() for d in definitions] == [d.to_dict() for d in expected_definitions]
+        
+        defined = {d.term.lower() for d in definitions}
+        assert report.document_id == "strict"
+        for amb in report.instances:
+            if amb.ambiguity_type.value == "undefined_term":
+                assert amb.text.lower() not in defined
+    
     def test_lenient_has_higher_ambiguity(
         self, strict_regulation, lenient_regulation
     ):